@@ -0,0 +1,42 @@
+"""create_ai_usage_records
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2026-03-02 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "h8i9j0k1l2m3"
+down_revision: Union[str, None] = "g7h8i9j0k1l2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_usage_records",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("operation", sa.String(50), nullable=False, index=True),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completion_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cached_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("characters", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("latency_ms", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("success", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("interview_id", sa.Integer(), nullable=True, index=True),
+        sa.Column("job_id", sa.Integer(), nullable=True, index=True),
+        sa.Column("candidate_id", sa.Integer(), nullable=True, index=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now(), index=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ai_usage_records")
@@ -0,0 +1,32 @@
+"""add_interview_prerendered_messages
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-03-04 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "i9j0k1l2m3n4"
+down_revision: Union[str, None] = "h8i9j0k1l2m3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("interviews", sa.Column("greeting_text", sa.Text(), nullable=True))
+    op.add_column("interviews", sa.Column("closing_text", sa.Text(), nullable=True))
+    op.add_column("interviews", sa.Column("greeting_audio_path", sa.String(500), nullable=True))
+    op.add_column("interviews", sa.Column("closing_audio_path", sa.String(500), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("interviews", "closing_audio_path")
+    op.drop_column("interviews", "greeting_audio_path")
+    op.drop_column("interviews", "closing_text")
+    op.drop_column("interviews", "greeting_text")
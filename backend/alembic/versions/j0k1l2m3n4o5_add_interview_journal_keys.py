@@ -0,0 +1,66 @@
+"""add_interview_journal_keys
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-03-05 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "j0k1l2m3n4o5"
+down_revision: Union[str, None] = "i9j0k1l2m3n4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop exact duplicates left by concurrent turns so the unique key can be built.
+    op.execute(
+        """
+        DELETE FROM interview_transcripts a
+        USING interview_transcripts b
+        WHERE a.interview_id = b.interview_id
+          AND a.sequence_order = b.sequence_order
+          AND a.speaker = b.speaker
+          AND a.content = b.content
+          AND a.id > b.id
+        """
+    )
+    # Turns that raced to the same sequence numbers with different content are all kept:
+    # renumber those interviews' transcripts in their existing order.
+    op.execute(
+        """
+        UPDATE interview_transcripts t
+        SET sequence_order = r.rn
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY interview_id ORDER BY sequence_order, timestamp, id
+            ) AS rn
+            FROM interview_transcripts
+            WHERE interview_id IN (
+                SELECT interview_id FROM interview_transcripts
+                GROUP BY interview_id, sequence_order
+                HAVING COUNT(*) > 1
+            )
+        ) r
+        WHERE t.id = r.id AND t.sequence_order <> r.rn
+        """
+    )
+    op.create_unique_constraint(
+        "uq_interview_transcripts_sequence", "interview_transcripts", ["interview_id", "sequence_order"]
+    )
+    op.add_column("interview_answers", sa.Column("sequence_order", sa.Integer(), nullable=True))
+    op.create_unique_constraint(
+        "uq_interview_answers_sequence", "interview_answers", ["interview_id", "sequence_order"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_interview_answers_sequence", "interview_answers", type_="unique")
+    op.drop_column("interview_answers", "sequence_order")
+    op.drop_constraint("uq_interview_transcripts_sequence", "interview_transcripts", type_="unique")
@@ -0,0 +1,48 @@
+"""create_interview_recording_segments
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-03-06 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "k1l2m3n4o5p6"
+down_revision: Union[str, None] = "j0k1l2m3n4o5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "interview_recording_segments",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("interview_id", sa.Integer(), sa.ForeignKey("interviews.id"), nullable=False, index=True),
+        sa.Column("recording_path", sa.String(500), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("start_sec", sa.Float(), nullable=False),
+        sa.Column("end_sec", sa.Float(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "DONE", "FAILED", name="recordingsegmentstatus"),
+            nullable=False,
+            server_default="PENDING",
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("text", sa.Text(), nullable=True),
+        sa.Column("aligned_text", sa.Text(), nullable=True),
+        sa.Column("transcript_id", sa.Integer(), sa.ForeignKey("interview_transcripts.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint("recording_path", "chunk_index", name="uq_recording_segments_chunk"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("interview_recording_segments")
+    sa.Enum(name="recordingsegmentstatus").drop(op.get_bind(), checkfirst=True)
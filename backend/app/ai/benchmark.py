@@ -0,0 +1,175 @@
+"""Replay recorded prompts against each model tier.
+
+Reports latency and output-schema validity per (operation, tier) so cheap
+operations can be moved to faster models with evidence.
+
+    python -m app.ai.benchmark recorded_prompts.jsonl --tiers fast,standard --concurrency 4
+
+Prompts are recorded by setting ``AI_PROMPT_RECORD_PATH``.
+"""
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from app.ai.openai_client import ai_client
+from app.ai.rate_governor import Priority
+from app.core.config import settings
+
+# Required top-level keys and their types for each structured operation.
+OUTPUT_SCHEMAS: dict[str, dict] = {
+    "screening": {
+        "keyword_match_score": (int, float),
+        "skill_relevance_score": (int, float),
+        "experience_match_score": (int, float),
+        "education_match_score": (int, float),
+        "overall_score": (int, float),
+        "recommendation": str,
+        "matched_skills": list,
+        "missing_skills": list,
+        "summary": str,
+    },
+    "evaluation": {
+        "communication_score": (int, float),
+        "technical_score": (int, float),
+        "confidence_score": (int, float),
+        "domain_knowledge_score": (int, float),
+        "problem_solving_score": (int, float),
+        "overall_score": (int, float),
+        "strengths": list,
+        "weaknesses": list,
+        "detailed_feedback": str,
+        "recommendation": str,
+    },
+    "question_gen": {"questions": list},
+    "parse": {
+        "full_name": str,
+        "email": str,
+        "experience_years": (int, float),
+        "skills": list,
+        "work_experiences": list,
+    },
+}
+
+
+def validate_output(operation: str, output) -> bool:
+    schema = OUTPUT_SCHEMAS.get(operation)
+    if schema is None:
+        return isinstance(output, str) and bool(output.strip())
+    if not isinstance(output, dict):
+        return False
+    if not all(isinstance(output.get(key), expected) for key, expected in schema.items()):
+        return False
+    if operation == "question_gen":
+        return bool(output["questions"]) and all(
+            isinstance(q, dict) and q.get("question_text") for q in output["questions"]
+        )
+    return True
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _replay(record: dict, model: str) -> tuple[float, bool, str]:
+    started = time.monotonic()
+    try:
+        if record.get("response_format"):
+            output = await ai_client.chat_completion_json(
+                messages=record["messages"],
+                model=model,
+                temperature=record["temperature"],
+                max_tokens=record["max_tokens"],
+                cache=False,
+                priority=Priority.BATCH,
+            )
+        else:
+            output = await ai_client.chat_completion(
+                messages=record["messages"],
+                model=model,
+                temperature=record["temperature"],
+                max_tokens=record["max_tokens"],
+                priority=Priority.BATCH,
+            )
+    except Exception as e:
+        return time.monotonic() - started, False, type(e).__name__
+    return time.monotonic() - started, validate_output(record["operation"], output), ""
+
+
+async def run_benchmark(path: str, tiers: list[str], concurrency: int, limit: int = 0) -> list[dict]:
+    records = [json.loads(line) for line in Path(path).read_text(encoding="utf-8").splitlines() if line.strip()]
+    if limit:
+        records = records[:limit]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    results: dict[tuple[str, str, str], dict] = {}
+
+    async def one(record: dict, tier: str, model: str):
+        async with semaphore:
+            latency, valid, error = await _replay(record, model)
+        row = results.setdefault((record["operation"], tier, model), {
+            "latencies": [], "valid": 0, "errors": {},
+        })
+        row["latencies"].append(latency)
+        row["valid"] += int(valid)
+        if error:
+            row["errors"][error] = row["errors"].get(error, 0) + 1
+
+    jobs = []
+    for tier in tiers:
+        # Benchmark the tier's primary model; fallbacks are only for outages.
+        model = ai_client.router.models_for_tier(tier)[0]
+        jobs.extend(one(record, tier, model) for record in records)
+    await asyncio.gather(*jobs)
+    await ai_client.aclose()
+
+    report = []
+    for (operation, tier, model), row in sorted(results.items()):
+        n = len(row["latencies"])
+        report.append({
+            "operation": operation,
+            "tier": tier,
+            "model": model,
+            "samples": n,
+            "schema_valid_rate": round(row["valid"] / n, 4),
+            "p50_sec": round(_percentile(row["latencies"], 50), 3),
+            "p95_sec": round(_percentile(row["latencies"], 95), 3),
+            "errors": row["errors"],
+        })
+    return report
+
+
+def _print_report(report: list[dict]):
+    header = f"{'operation':<16}{'tier':<10}{'model':<18}{'n':>5}{'valid':>8}{'p50 s':>9}{'p95 s':>9}  errors"
+    print(header)
+    print("-" * len(header))
+    for row in report:
+        errors = ", ".join(f"{k}={v}" for k, v in row["errors"].items()) or "-"
+        print(
+            f"{row['operation']:<16}{row['tier']:<10}{row['model']:<18}{row['samples']:>5}"
+            f"{row['schema_valid_rate']:>8.0%}{row['p50_sec']:>9.2f}{row['p95_sec']:>9.2f}  {errors}"
+        )
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Benchmark model tiers on recorded prompts.")
+    parser.add_argument("prompts", help="JSONL file written via AI_PROMPT_RECORD_PATH")
+    parser.add_argument("--tiers", default="", help="Comma-separated tiers (default: all configured)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=0, help="Replay only the first N prompts")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    tiers = [t.strip() for t in args.tiers.split(",") if t.strip()] or list(settings.AI_MODEL_TIERS)
+    report = asyncio.run(run_benchmark(args.prompts, tiers, args.concurrency, args.limit))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+
+if __name__ == "__main__":
+    run()
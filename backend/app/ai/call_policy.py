@@ -0,0 +1,207 @@
+"""Deadline, retry and hedging policies for AI provider calls.
+
+Each client operation (chat, chat_json, chat_stream, transcribe, tts) runs
+under a ``CallPolicy``: an overall deadline, a per-attempt timeout,
+exponential backoff with jitter on transient errors, and an optional hedged
+second request once an attempt outlives the operation's observed p95.
+Defaults live here; ``AI_CALL_POLICY_OVERRIDES`` can tune any field per
+operation without a code change.
+"""
+import asyncio
+import bisect
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import openai
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+# Histogram bucket upper bounds in seconds.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0)
+
+
+class AIDeadlineExceeded(Exception):
+    """Raised when an AI operation cannot finish within its policy deadline."""
+
+
+@dataclass(frozen=True)
+class CallPolicy:
+    deadline_sec: float
+    attempt_timeout_sec: float
+    max_attempts: int = 3
+    backoff_base_sec: float = 0.5
+    backoff_max_sec: float = 8.0
+    hedge: bool = False
+    hedge_min_samples: int = 20
+
+
+DEFAULT_POLICIES: dict[str, CallPolicy] = {
+    "chat": CallPolicy(deadline_sec=60, attempt_timeout_sec=30),
+    "chat_json": CallPolicy(deadline_sec=150, attempt_timeout_sec=90),
+    # For streams the attempt timeout bounds time-to-first-token and the gap
+    # between chunks; retries only happen before anything was yielded.
+    "chat_stream": CallPolicy(deadline_sec=30, attempt_timeout_sec=15, max_attempts=2),
+    "transcribe": CallPolicy(deadline_sec=45, attempt_timeout_sec=20, hedge=True),
+    "tts": CallPolicy(deadline_sec=30, attempt_timeout_sec=15, hedge=True),
+}
+
+
+class LatencyHistogram:
+    def __init__(self, window: int = 500):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_sec = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total_sec += seconds
+        self._recent.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[idx]
+
+    @property
+    def samples(self) -> int:
+        return len(self._recent)
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{b}" for b in LATENCY_BUCKETS] + ["le_inf"]
+        p50, p95, p99 = (self.percentile(p) for p in (50, 95, 99))
+        return {
+            "count": self.count,
+            "avg_sec": round(self.total_sec / self.count, 4) if self.count else 0.0,
+            "p50_sec": round(p50, 4) if p50 is not None else None,
+            "p95_sec": round(p95, 4) if p95 is not None else None,
+            "p99_sec": round(p99, 4) if p99 is not None else None,
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class PolicyEngine:
+    def __init__(self):
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self.retries: dict[str, int] = {}
+        self.hedges: dict[str, int] = {}
+        self.hedge_wins: dict[str, int] = {}
+        self.deadline_exceeded: dict[str, int] = {}
+
+    def policy_for(self, operation: str) -> CallPolicy:
+        base = DEFAULT_POLICIES.get(operation, DEFAULT_POLICIES["chat"])
+        overrides = settings.AI_CALL_POLICY_OVERRIDES.get(operation)
+        return replace(base, **overrides) if overrides else base
+
+    def histogram(self, operation: str) -> LatencyHistogram:
+        if operation not in self._histograms:
+            self._histograms[operation] = LatencyHistogram()
+        return self._histograms[operation]
+
+    def _bump(self, counter: dict[str, int], operation: str):
+        counter[operation] = counter.get(operation, 0) + 1
+
+    def backoff_delay(self, policy: CallPolicy, attempt: int) -> float:
+        ceiling = min(policy.backoff_max_sec, policy.backoff_base_sec * (2 ** (attempt - 1)))
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def _attempt(self, operation: str, policy: CallPolicy, call: Callable[[], Awaitable[T]]) -> T:
+        hist = self.histogram(operation)
+        hedge_after = hist.percentile(95) if policy.hedge and hist.samples >= policy.hedge_min_samples else None
+        started = time.monotonic()
+
+        if hedge_after is None:
+            result = await call()
+            hist.observe(time.monotonic() - started)
+            return result
+
+        primary = asyncio.ensure_future(call())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+            if done:
+                hist.observe(time.monotonic() - started)
+                return primary.result()
+
+            self._bump(self.hedges, operation)
+            hedged = asyncio.ensure_future(call())
+            tasks.append(hedged)
+            pending = {primary, hedged}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedged:
+                            self._bump(self.hedge_wins, operation)
+                        hist.observe(time.monotonic() - started)
+                        return task.result()
+            # Both failed: surface the primary's error.
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def execute(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call`` under the operation's deadline, retry and hedging policy."""
+        policy = self.policy_for(operation)
+        deadline = time.monotonic() + policy.deadline_sec
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._bump(self.deadline_exceeded, operation)
+                raise AIDeadlineExceeded(f"AI operation '{operation}' exceeded {policy.deadline_sec}s deadline")
+            try:
+                return await asyncio.wait_for(
+                    self._attempt(operation, policy, call),
+                    timeout=min(policy.attempt_timeout_sec, remaining),
+                )
+            except RETRYABLE_ERRORS as e:
+                delay = self.backoff_delay(policy, attempt)
+                if attempt >= policy.max_attempts or time.monotonic() + delay >= deadline:
+                    if isinstance(e, asyncio.TimeoutError):
+                        self._bump(self.deadline_exceeded, operation)
+                        raise AIDeadlineExceeded(
+                            f"AI operation '{operation}' timed out after {attempt} attempt(s)"
+                        ) from e
+                    raise
+                self._bump(self.retries, operation)
+                logger.warning(
+                    "AI operation %s failed (%s), retry %d in %.2fs",
+                    operation, type(e).__name__, attempt, delay,
+                )
+                await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {
+            operation: {
+                "latency": hist.snapshot(),
+                "retries": self.retries.get(operation, 0),
+                "hedges": self.hedges.get(operation, 0),
+                "hedge_wins": self.hedge_wins.get(operation, 0),
+                "deadline_exceeded": self.deadline_exceeded.get(operation, 0),
+                "policy": asdict(self.policy_for(operation)),
+            }
+            for operation, hist in self._histograms.items()
+        }
@@ -1,34 +1,15 @@
 """Evaluation AI chain."""
-from app.ai.openai_client import ai_client
-from app.ai.prompts.evaluation import EVALUATION_SYSTEM, build_evaluation_prompt
+from typing import AsyncGenerator, Optional
 
+from app.ai.openai_client import ai_client
+from app.ai.usage import AICallTag, tag_for
+from app.ai.prompts.evaluation import build_evaluation_messages
 
-async def run_evaluation(
-    candidate_name: str,
-    job_title: str,
-    domain: str,
-    transcript: list[dict],
-    questions_answers: list[dict],
-) -> dict:
-    user_prompt = build_evaluation_prompt(
-        candidate_name=candidate_name,
-        job_title=job_title,
-        domain=domain,
-        transcript=transcript,
-        questions_answers=questions_answers,
-    )
+# List fields surfaced to callers as soon as each entry is generated.
+STREAMED_FIELDS = ["strengths", "weaknesses"]
 
-    messages = [
-        {"role": "system", "content": EVALUATION_SYSTEM},
-        {"role": "user", "content": user_prompt},
-    ]
-
-    result = await ai_client.chat_completion_json(
-        messages=messages,
-        temperature=0.2,
-        max_tokens=4000,
-    )
 
+def _normalize_evaluation(result: dict) -> dict:
     # Normalize scores
     score_fields = [
         "communication_score", "technical_score", "confidence_score",
@@ -63,3 +44,59 @@ async def run_evaluation(
             result["recommendation"] = "no_hire"
 
     return result
+
+
+async def stream_evaluation(
+    candidate_name: str,
+    job_title: str,
+    domain: str,
+    transcript: list[dict],
+    questions_answers: list[dict],
+    tag: Optional[AICallTag] = None,
+) -> AsyncGenerator[dict, None]:
+    """Yield ``{"type": "item", "key", "value"}`` per strength/weakness, then
+    ``{"type": "done", "value": <normalized evaluation>}``."""
+    messages = build_evaluation_messages(
+        candidate_name=candidate_name,
+        job_title=job_title,
+        domain=domain,
+        transcript=transcript,
+        questions_answers=questions_answers,
+    )
+
+    async for event in ai_client.chat_completion_json_stream(
+        messages=messages,
+        array_keys=STREAMED_FIELDS,
+        temperature=0.2,
+        max_tokens=4000,
+        tag=tag_for("evaluation", tag),
+    ):
+        if event["type"] == "done":
+            yield {"type": "done", "value": _normalize_evaluation(event["value"])}
+        else:
+            yield event
+
+
+async def run_evaluation(
+    candidate_name: str,
+    job_title: str,
+    domain: str,
+    transcript: list[dict],
+    questions_answers: list[dict],
+    tag: Optional[AICallTag] = None,
+) -> dict:
+    messages = build_evaluation_messages(
+        candidate_name=candidate_name,
+        job_title=job_title,
+        domain=domain,
+        transcript=transcript,
+        questions_answers=questions_answers,
+    )
+
+    result = await ai_client.chat_completion_json(
+        messages=messages,
+        temperature=0.2,
+        max_tokens=4000,
+        tag=tag_for("evaluation", tag),
+    )
+    return _normalize_evaluation(result)
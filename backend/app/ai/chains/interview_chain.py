@@ -1,11 +1,17 @@
 """Interview conductor AI chain."""
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from app.ai.openai_client import ai_client
+from app.ai.rate_governor import Priority
+from app.ai.tokens import count_message_tokens
+from app.ai.usage import AICallTag, tag_for
 from app.ai.prompts.interview_conduct import (
     INTERVIEW_CONDUCTOR_SYSTEM,
+    HISTORY_SUMMARY_SYSTEM,
     build_greeting_prompt,
     build_interview_message_prompt,
+    build_transition_prompt,
+    build_history_summary_prompt,
     build_closing_prompt,
 )
 
@@ -15,6 +21,8 @@ async def get_interview_greeting(
     job_title: str,
     domain: str,
     duration_min: int,
+    tag: Optional[AICallTag] = None,
+    priority: Priority = Priority.INTERACTIVE,
 ) -> str:
     prompt = build_greeting_prompt(candidate_name, job_title, domain, duration_min)
     messages = [
@@ -25,6 +33,8 @@ async def get_interview_greeting(
         messages=messages,
         temperature=0.6,
         max_tokens=500,
+        tag=tag_for("greeting", tag),
+        priority=priority,
     )
 
 
@@ -35,6 +45,9 @@ async def get_interview_response(
     questions_remaining: int,
     time_remaining_min: int,
     candidate_resume: str = None,
+    history_summary: str = None,
+    job_title: str = None,
+    tag: Optional[AICallTag] = None,
 ) -> str:
     messages = build_interview_message_prompt(
         conversation_history=conversation_history,
@@ -43,11 +56,15 @@ async def get_interview_response(
         questions_remaining=questions_remaining,
         time_remaining_min=time_remaining_min,
         candidate_resume=candidate_resume,
+        history_summary=history_summary,
+        job_title=job_title,
     )
     return await ai_client.chat_completion(
         messages=messages,
         temperature=0.6,
         max_tokens=1000,
+        tag=tag_for("turn", tag),
+        priority=Priority.INTERACTIVE,
     )
 
 
@@ -58,6 +75,9 @@ async def stream_interview_response(
     questions_remaining: int,
     time_remaining_min: int,
     candidate_resume: str = None,
+    history_summary: str = None,
+    job_title: str = None,
+    tag: Optional[AICallTag] = None,
 ) -> AsyncGenerator[str, None]:
     messages = build_interview_message_prompt(
         conversation_history=conversation_history,
@@ -66,16 +86,53 @@ async def stream_interview_response(
         questions_remaining=questions_remaining,
         time_remaining_min=time_remaining_min,
         candidate_resume=candidate_resume,
+        history_summary=history_summary,
+        job_title=job_title,
     )
     async for chunk in ai_client.chat_completion_stream(
         messages=messages,
         temperature=0.6,
         max_tokens=1000,
+        tag=tag_for("turn", tag),
+        priority=Priority.INTERACTIVE,
     ):
         yield chunk
 
 
-async def get_interview_closing(candidate_name: str) -> str:
+async def get_interview_transition(
+    conversation_history: list[dict],
+    current_question: str,
+    next_question: str,
+    questions_remaining: int,
+    candidate_resume: str = None,
+    history_summary: str = None,
+    job_title: str = None,
+    tag: Optional[AICallTag] = None,
+) -> str:
+    messages = build_transition_prompt(
+        conversation_history=conversation_history,
+        current_question=current_question,
+        next_question=next_question,
+        questions_remaining=questions_remaining,
+        candidate_resume=candidate_resume,
+        history_summary=history_summary,
+        job_title=job_title,
+    )
+    # Speculative, so it yields to live turns.
+    return await ai_client.chat_completion(
+        messages=messages,
+        temperature=0.6,
+        max_tokens=300,
+        tag=tag_for("transition", tag),
+        priority=Priority.NORMAL,
+    )
+
+
+async def get_interview_closing(
+    candidate_name: str,
+    tag: Optional[AICallTag] = None,
+    priority: Priority = Priority.INTERACTIVE,
+) -> str:
     prompt = build_closing_prompt(candidate_name)
     messages = [
         {"role": "system", "content": INTERVIEW_CONDUCTOR_SYSTEM},
@@ -85,4 +142,45 @@ async def get_interview_closing(candidate_name: str) -> str:
         messages=messages,
         temperature=0.6,
         max_tokens=300,
+        tag=tag_for("closing", tag),
+        priority=priority,
+    )
+
+
+def plan_history_compaction(
+    conversation_history: list[dict],
+    summarized_count: int,
+    token_budget: int,
+    keep_turns: int,
+) -> Optional[int]:
+    """Return the history index to fold into the summary up to, or None.
+
+    Messages before ``summarized_count`` are already covered by the summary.
+    Compaction triggers once the unsummarized tail exceeds ``token_budget``
+    and always leaves the last ``keep_turns`` exchanges verbatim.
+    """
+    if count_message_tokens(conversation_history[summarized_count:]) <= token_budget:
+        return None
+    fold_upto = len(conversation_history) - keep_turns * 2
+    if fold_upto <= summarized_count:
+        return None
+    return fold_upto
+
+
+async def summarize_interview_history(
+    existing_summary: Optional[str],
+    turns: list[dict],
+    tag: Optional[AICallTag] = None,
+) -> str:
+    messages = [
+        {"role": "system", "content": HISTORY_SUMMARY_SYSTEM},
+        {"role": "user", "content": build_history_summary_prompt(existing_summary, turns)},
+    ]
+    # Runs in the background after the turn, so it yields to live turns.
+    return await ai_client.chat_completion(
+        messages=messages,
+        temperature=0.2,
+        max_tokens=400,
+        priority=Priority.NORMAL,
+        tag=tag_for("history_summary", tag),
     )
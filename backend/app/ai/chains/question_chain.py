@@ -1,9 +1,22 @@
 """Question generation AI chain."""
+from typing import AsyncGenerator, Optional
+
 from app.ai.openai_client import ai_client
+from app.ai.usage import AICallTag, tag_for
 from app.ai.prompts.question_generation import QUESTION_GENERATION_SYSTEM, build_question_generation_prompt
 
 
-async def generate_interview_questions(
+def _normalize_question(q: dict) -> dict:
+    return {
+        "question_text": q.get("question_text", ""),
+        "question_type": q.get("question_type", "technical"),
+        "difficulty": q.get("difficulty", "medium"),
+        "expected_answer": q.get("expected_answer", ""),
+        "keywords": q.get("keywords", []),
+    }
+
+
+async def stream_interview_questions(
     domain: str,
     sector: str,
     job_title: str,
@@ -12,7 +25,9 @@ async def generate_interview_questions(
     num_questions: int = 10,
     existing_questions: list = None,
     candidate_resume: str = None,
-) -> list[dict]:
+    tag: Optional[AICallTag] = None,
+) -> AsyncGenerator[dict, None]:
+    """Yield each generated question as soon as its JSON object closes in the stream."""
     user_prompt = build_question_generation_prompt(
         domain=domain,
         sector=sector,
@@ -29,23 +44,38 @@ async def generate_interview_questions(
         {"role": "user", "content": user_prompt},
     ]
 
-    result = await ai_client.chat_completion_json(
+    async for event in ai_client.chat_completion_json_stream(
         messages=messages,
+        array_keys=["questions"],
         temperature=0.7,
         max_tokens=4000,
-    )
-
-    questions = result.get("questions", [])
+        tag=tag_for("question_gen", tag),
+    ):
+        if event["type"] == "item" and isinstance(event["value"], dict):
+            yield _normalize_question(event["value"])
 
-    # Validate and normalize each question
-    validated = []
-    for q in questions:
-        validated.append({
-            "question_text": q.get("question_text", ""),
-            "question_type": q.get("question_type", "technical"),
-            "difficulty": q.get("difficulty", "medium"),
-            "expected_answer": q.get("expected_answer", ""),
-            "keywords": q.get("keywords", []),
-        })
 
-    return validated
+async def generate_interview_questions(
+    domain: str,
+    sector: str,
+    job_title: str,
+    job_description: str,
+    experience_years: int,
+    num_questions: int = 10,
+    existing_questions: list = None,
+    candidate_resume: str = None,
+    tag: Optional[AICallTag] = None,
+) -> list[dict]:
+    return [
+        q async for q in stream_interview_questions(
+            domain=domain,
+            sector=sector,
+            job_title=job_title,
+            job_description=job_description,
+            experience_years=experience_years,
+            num_questions=num_questions,
+            existing_questions=existing_questions,
+            candidate_resume=candidate_resume,
+            tag=tag,
+        )
+    ]
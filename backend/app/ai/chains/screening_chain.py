@@ -1,6 +1,9 @@
 """Resume screening AI chain."""
+from typing import Optional
+
 from app.ai.openai_client import ai_client
-from app.ai.prompts.resume_screening import RESUME_SCREENING_SYSTEM, build_screening_user_prompt
+from app.ai.usage import AICallTag, tag_for
+from app.ai.prompts.resume_screening import build_screening_messages
 
 
 async def run_resume_screening(
@@ -11,8 +14,9 @@ async def run_resume_screening(
     experience_min: int,
     experience_max: int,
     education_level: str,
+    tag: Optional[AICallTag] = None,
 ) -> dict:
-    user_prompt = build_screening_user_prompt(
+    messages = build_screening_messages(
         resume_text=resume_text,
         job_title=job_title,
         job_description=job_description,
@@ -22,15 +26,12 @@ async def run_resume_screening(
         education_level=education_level,
     )
 
-    messages = [
-        {"role": "system", "content": RESUME_SCREENING_SYSTEM},
-        {"role": "user", "content": user_prompt},
-    ]
-
     result = await ai_client.chat_completion_json(
         messages=messages,
         temperature=0.3,
         max_tokens=2000,
+        cache=True,
+        tag=tag_for("screening", tag),
     )
 
     # Normalize scores to 0-10 range
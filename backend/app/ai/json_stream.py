@@ -0,0 +1,116 @@
+"""Incremental parsing of streamed JSON completions.
+
+Structured chains return one JSON object whose interesting payload is a
+handful of top-level arrays ("questions", "strengths", ...). The parser
+scans the text as it streams and hands back each array element the moment
+its closing token arrives, so callers can act on it before the completion
+finishes.
+"""
+import json
+import logging
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JsonArrayStreamParser:
+    """Yields ``(key, element)`` for elements of the named top-level arrays."""
+
+    def __init__(self, keys: Iterable[str]):
+        self._keys = set(keys)
+        self._text = ""
+        self._pos = 0
+        # One frame per open container: [bracket, key]. For objects ``key`` is
+        # the most recent member name; for arrays it is the owning member name.
+        self._stack: list[list] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._item_start: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def _collecting(self) -> bool:
+        return (
+            len(self._stack) == 2
+            and self._stack[0][0] == "{"
+            and self._stack[1][0] == "["
+            and self._stack[1][1] in self._keys
+        )
+
+    def _emit(self, items: list, end: int):
+        raw = self._text[self._item_start:end].strip()
+        self._item_start = None
+        try:
+            items.append((self._stack[1][1], json.loads(raw)))
+        except (json.JSONDecodeError, IndexError):
+            logger.warning("Skipping unparseable streamed JSON element: %.80s", raw)
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Consume the next chunk of text; return elements completed by it."""
+        self._text += chunk
+        text = self._text
+        items: list[tuple[str, Any]] = []
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start:i + 1]
+                    if self._item_start is not None and self._collecting() and text[self._item_start] == '"':
+                        self._emit(items, i + 1)
+                continue
+
+            if ch.isspace():
+                continue
+            if self._item_start is None and ch not in ",]" and self._collecting():
+                self._item_start = i
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == ":":
+                if self._stack and self._stack[-1][0] == "{" and self._last_string is not None:
+                    try:
+                        self._stack[-1][1] = json.loads(self._last_string)
+                    except json.JSONDecodeError:
+                        self._stack[-1][1] = None
+            elif ch in "{[":
+                owner = self._stack[-1][1] if self._stack and self._stack[-1][0] == "{" else None
+                self._stack.append([ch, owner])
+            elif ch in "}]":
+                if ch == "]" and self._item_start is not None and self._collecting():
+                    # Scalar element terminated by the end of its array.
+                    self._emit(items, i)
+                if self._stack:
+                    self._stack.pop()
+                if self._item_start is not None and self._collecting():
+                    # Object or array element just closed.
+                    self._emit(items, i + 1)
+            elif ch == ",":
+                if self._item_start is not None and self._collecting():
+                    self._emit(items, i)
+
+        self._pos = len(text)
+        return items
+
+    def result(self) -> Any:
+        """Parse the complete document once the stream has ended."""
+        return json.loads(self._text)
+
+
+def iter_array_items(document: dict, keys: Iterable[str]):
+    """Yield ``(key, element)`` from an already-complete document, in key order."""
+    for key in keys:
+        value = document.get(key) if isinstance(document, dict) else None
+        if isinstance(value, list):
+            for element in value:
+                yield key, element
@@ -0,0 +1,56 @@
+"""Per-operation model routing.
+
+``AI_OPERATION_TIERS`` maps an AICallTag operation (greeting, turn,
+screening, ...) to a tier, and ``AI_MODEL_TIERS`` maps each tier to models
+in fallback order. Calls without a routed operation use ``OPENAI_MODEL``.
+When the current model times out or errors after its retry policy is
+exhausted, the client moves on to the next model in the tier.
+"""
+import logging
+from typing import Optional
+
+import openai
+
+from app.ai.call_policy import RETRYABLE_ERRORS, AIDeadlineExceeded
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_ERRORS = RETRYABLE_ERRORS + (
+    AIDeadlineExceeded,
+    # Model not available to this key / region.
+    openai.NotFoundError,
+    openai.PermissionDeniedError,
+)
+
+
+class ModelRouter:
+    def __init__(self):
+        self.fallbacks: dict[str, int] = {}
+
+    def tier_for(self, operation: str) -> Optional[str]:
+        return settings.AI_OPERATION_TIERS.get(operation)
+
+    def models_for_tier(self, tier: str) -> list[str]:
+        return list(settings.AI_MODEL_TIERS.get(tier) or [settings.OPENAI_MODEL])
+
+    def models_for(self, operation: str) -> list[str]:
+        tier = self.tier_for(operation)
+        if tier is None:
+            return [settings.OPENAI_MODEL]
+        return self.models_for_tier(tier)
+
+    def record_fallback(self, operation: str, failed_model: str, next_model: str, error: Exception):
+        key = f"{failed_model}->{next_model}"
+        self.fallbacks[key] = self.fallbacks.get(key, 0) + 1
+        logger.warning(
+            "AI operation %s failed on %s (%s), falling back to %s",
+            operation or "untagged", failed_model, type(error).__name__, next_model,
+        )
+
+    def stats(self) -> dict:
+        return {
+            "operation_tiers": dict(settings.AI_OPERATION_TIERS),
+            "model_tiers": {tier: list(models) for tier, models in settings.AI_MODEL_TIERS.items()},
+            "fallbacks": dict(self.fallbacks),
+        }
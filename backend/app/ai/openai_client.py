@@ -1,15 +1,45 @@
-"""Singleton OpenAI client wrapper for all AI operations."""
+"""Singleton AI client wrapper for all AI operations.
+
+Requests go to the provider selected by ``AI_PROVIDER`` (OpenAI, or the
+local stub for offline load tests); caching, governing, retries and usage
+accounting are applied here regardless of provider.
+"""
+import asyncio
 import json
 import logging
 import re
-from typing import Optional, AsyncGenerator
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Awaitable, Callable, Optional, TypeVar
 
 import openai
 
+from app.ai.call_policy import AIDeadlineExceeded, PolicyEngine
+from app.ai.json_stream import JsonArrayStreamParser, iter_array_items
+from app.ai.model_router import FALLBACK_ERRORS, ModelRouter
+from app.ai.prompt_recorder import record_prompt
+from app.ai.providers import ChatResult, LLMProvider, build_provider
+from app.ai.rate_governor import Permit, Priority, RateGovernor, build_governor
+from app.ai.response_cache import ResponseCache, make_cache_key
+from app.ai.tokens import count_message_tokens
+from app.ai.usage import AICallTag, PromptCacheStats
+from app.ai.usage_ledger import usage_ledger
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class _Call:
+    """Per-request bookkeeping shared by the governor and the usage ledger."""
+
+    def __init__(self, permit: Permit):
+        self.permit = permit
+        self.usage: Optional[dict] = None
+        self.characters = 0
+        self.requests = 0
+
 
 class OpenAIClient:
     _instance: Optional["OpenAIClient"] = None
@@ -17,32 +47,161 @@ class OpenAIClient:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            cls._instance._provider = build_provider()
             cls._instance._model = settings.OPENAI_MODEL
+            cls._instance._cache = ResponseCache()
+            cls._instance._governor = build_governor()
+            cls._instance._policy = PolicyEngine()
+            cls._instance._router = ModelRouter()
+            cls._instance._prompt_cache_stats = PromptCacheStats()
         return cls._instance
 
     @property
-    def client(self) -> openai.AsyncOpenAI:
-        return self._client
+    def provider(self) -> LLMProvider:
+        return self._provider
 
     @property
     def model(self) -> str:
         return self._model
 
+    @property
+    def cache(self) -> ResponseCache:
+        return self._cache
+
+    @property
+    def governor(self) -> RateGovernor:
+        return self._governor
+
+    @property
+    def policy(self) -> PolicyEngine:
+        return self._policy
+
+    @property
+    def router(self) -> ModelRouter:
+        return self._router
+
+    @property
+    def prompt_cache_stats(self) -> PromptCacheStats:
+        return self._prompt_cache_stats
+
+    async def aclose(self):
+        """Close provider connections opened on the running event loop.
+
+        Call before closing a short-lived loop (Celery tasks) so its pool
+        does not leak.
+        """
+        await self._provider.aclose()
+
+    def _record_usage(self, operation: str, call: _Call, usage: Optional[dict]):
+        if usage is None:
+            return
+        call.permit.record_usage(usage["total_tokens"])
+        call.usage = usage
+        self._prompt_cache_stats.record(operation, usage)
+
+    @asynccontextmanager
+    async def _governed(
+        self,
+        tokens: int,
+        priority: Optional[Priority],
+        tag: Optional[AICallTag] = None,
+        model: str = "",
+    ):
+        """Hold one governor slot for a whole operation.
+
+        The slot is taken before the call policy starts, so waiting for
+        capacity counts against neither the attempt timeout nor the latency
+        histogram. Retries and hedges inside the operation reuse the slot.
+        """
+        started = time.monotonic()
+        async with self._governor.slot(tokens, priority) as permit:
+            call = _Call(permit)
+            try:
+                yield call
+            except Exception:
+                usage_ledger.record(tag, model, time.monotonic() - started, success=False)
+                raise
+        usage_ledger.record(
+            tag, model, time.monotonic() - started, usage=call.usage, characters=call.characters,
+        )
+
+    async def _send(self, call: _Call, request: Callable[[], Awaitable[T]]) -> T:
+        """One provider request (an attempt, retry or hedge) under an admitted slot."""
+        if call.requests:
+            call.permit.record_request()
+        call.requests += 1
+        try:
+            return await request()
+        except openai.RateLimitError:
+            self._governor.on_rate_limited()
+            raise
+
+    async def _create_chat(
+        self,
+        operation: str,
+        priority: Optional[Priority],
+        tag: Optional[AICallTag],
+        **kwargs,
+    ) -> ChatResult:
+        tokens = count_message_tokens(kwargs["messages"], kwargs["model"]) + kwargs["max_tokens"]
+        async with self._governed(tokens, priority, tag, kwargs["model"]) as call:
+            result = await self._policy.execute(operation, lambda: self._send(
+                call, lambda: self._provider.chat(operation=tag.operation if tag else "", **kwargs),
+            ))
+            self._record_usage(operation, call, result.usage)
+        return result
+
+    def _models(self, model: Optional[str], tag: Optional[AICallTag]) -> list[str]:
+        """Explicit model, else the routed tier's models in fallback order."""
+        if model:
+            return [model]
+        return self._router.models_for(tag.operation if tag else "")
+
+    async def _with_fallback(
+        self,
+        models: list[str],
+        tag: Optional[AICallTag],
+        call: Callable[[str], Awaitable[T]],
+    ) -> T:
+        for i, use_model in enumerate(models):
+            try:
+                return await call(use_model)
+            except FALLBACK_ERRORS as e:
+                if i == len(models) - 1:
+                    raise
+                self._router.record_fallback(tag.operation if tag else "", use_model, models[i + 1], e)
+
+    def _should_cache(self, cache: Optional[bool], temperature: float) -> bool:
+        # AI_CACHE_ENABLED is a kill switch: it overrides an explicit cache=True too.
+        if not settings.AI_CACHE_ENABLED:
+            return False
+        return cache if cache is not None else temperature <= settings.AI_CACHE_MAX_TEMPERATURE
+
     async def chat_completion(
         self,
         messages: list[dict],
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        priority: Optional[Priority] = None,
+        tag: Optional[AICallTag] = None,
     ) -> str:
-        response = await self._client.chat.completions.create(
-            model=model or self._model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
+        if tag is not None:
+            record_prompt(tag.operation, messages, temperature, max_tokens)
+        result = await self._with_fallback(
+            self._models(model, tag),
+            tag,
+            lambda use_model: self._create_chat(
+                "chat",
+                priority,
+                tag,
+                model=use_model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ),
         )
-        return response.choices[0].message.content
+        return result.content
 
     async def chat_completion_json(
         self,
@@ -50,27 +209,70 @@ class OpenAIClient:
         model: Optional[str] = None,
         temperature: float = 0.3,
         max_tokens: int = 4000,
+        cache: Optional[bool] = None,
+        priority: Optional[Priority] = None,
+        tag: Optional[AICallTag] = None,
+    ) -> dict:
+        """Run a JSON-mode completion.
+
+        Results are cached when ``cache`` is True, or when it is None and the
+        call is low-temperature enough to be treated as deterministic.
+        """
+        models = self._models(model, tag)
+        cache_key = None
+        if self._should_cache(cache, temperature):
+            cache_key = make_cache_key(
+                models[0], messages, temperature, max_tokens, {"type": "json_object"}
+            )
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if tag is not None:
+            record_prompt(tag.operation, messages, temperature, max_tokens, {"type": "json_object"})
+        result = await self._with_fallback(
+            models,
+            tag,
+            lambda use_model: self._chat_completion_json(use_model, messages, temperature, max_tokens, priority, tag),
+        )
+        if cache_key is not None:
+            await self._cache.set(cache_key, result)
+        return result
+
+    async def _chat_completion_json(
+        self,
+        use_model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        priority: Optional[Priority],
+        tag: Optional[AICallTag],
     ) -> dict:
-        use_model = model or self._model
         try:
-            response = await self._client.chat.completions.create(
+            result = await self._create_chat(
+                "chat_json",
+                priority,
+                tag,
                 model=use_model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 response_format={"type": "json_object"},
             )
-            return json.loads(response.choices[0].message.content)
+            return json.loads(result.content)
         except openai.BadRequestError as e:
             if "response_format" in str(e):
                 logger.warning("Model %s doesn't support json_object format, falling back to plain completion", use_model)
-                response = await self._client.chat.completions.create(
+                result = await self._create_chat(
+                    "chat_json",
+                    priority,
+                    tag,
                     model=use_model,
                     messages=messages,
                     temperature=temperature,
                     max_tokens=max_tokens,
                 )
-                content = response.choices[0].message.content
+                content = result.content
                 # Extract JSON from markdown code blocks if present
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)```", content)
                 if match:
@@ -84,44 +286,160 @@ class OpenAIClient:
         model: Optional[str] = None,
         temperature: float = 0.6,
         max_tokens: int = 2000,
+        priority: Optional[Priority] = None,
+        tag: Optional[AICallTag] = None,
+        response_format: Optional[dict] = None,
     ) -> AsyncGenerator[str, None]:
-        stream = await self._client.chat.completions.create(
-            model=model or self._model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            stream=True,
-        )
-        async for chunk in stream:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        if tag is not None:
+            record_prompt(tag.operation, messages, temperature, max_tokens, response_format)
+        models = self._models(model, tag)
+        for i, use_model in enumerate(models):
+            started = False
+            try:
+                async for content in self._stream_once(
+                    use_model, messages, temperature, max_tokens, priority, tag, response_format,
+                ):
+                    started = True
+                    yield content
+                return
+            except FALLBACK_ERRORS as e:
+                # Once text has reached the caller the stream cannot switch models.
+                if started or i == len(models) - 1:
+                    raise
+                self._router.record_fallback(tag.operation if tag else "", use_model, models[i + 1], e)
+
+    async def _stream_once(
+        self,
+        use_model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        priority: Optional[Priority],
+        tag: Optional[AICallTag],
+        response_format: Optional[dict],
+    ) -> AsyncGenerator[str, None]:
+        tokens = count_message_tokens(messages, use_model) + max_tokens
+        idle_timeout = self._policy.policy_for("chat_stream").attempt_timeout_sec
+        # The slot is held until the stream is exhausted.
+        async with self._governed(tokens, priority, tag, use_model) as call:
+            deltas = await self._policy.execute("chat_stream", lambda: self._send(
+                call,
+                lambda: self._provider.open_chat_stream(
+                    model=use_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format=response_format,
+                    operation=tag.operation if tag else "",
+                ),
+            ))
+            deltas = deltas.__aiter__()
+            while True:
+                try:
+                    delta = await asyncio.wait_for(deltas.__anext__(), timeout=idle_timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError as e:
+                    raise AIDeadlineExceeded(f"AI stream stalled for more than {idle_timeout}s") from e
+                self._record_usage("chat_stream", call, delta.usage)
+                if delta.content:
+                    yield delta.content
+
+    async def chat_completion_json_stream(
+        self,
+        messages: list[dict],
+        array_keys: list[str],
+        model: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        cache: Optional[bool] = None,
+        priority: Optional[Priority] = None,
+        tag: Optional[AICallTag] = None,
+    ) -> AsyncGenerator[dict, None]:
+        """Run a streamed JSON-mode completion.
+
+        Yields ``{"type": "item", "key", "value"}`` for each element of the
+        top-level arrays named in ``array_keys`` as soon as it closes, then
+        ``{"type": "done", "value": <full document>}``. Shares cache entries
+        with ``chat_completion_json`` for the same request.
+        """
+        cache_key = None
+        if self._should_cache(cache, temperature):
+            cache_key = make_cache_key(
+                self._models(model, tag)[0], messages, temperature, max_tokens, {"type": "json_object"}
+            )
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                for key, value in iter_array_items(cached, array_keys):
+                    yield {"type": "item", "key": key, "value": value}
+                yield {"type": "done", "value": cached}
+                return
+
+        parser = JsonArrayStreamParser(array_keys)
+        try:
+            async for chunk in self.chat_completion_stream(
+                messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                priority=priority,
+                tag=tag,
+                response_format={"type": "json_object"},
+            ):
+                for key, value in parser.feed(chunk):
+                    yield {"type": "item", "key": key, "value": value}
+            result = parser.result()
+        except openai.BadRequestError as e:
+            if "response_format" not in str(e) or parser.text:
+                raise
+            result = await self.chat_completion_json(
+                messages, model=model, temperature=temperature, max_tokens=max_tokens,
+                cache=False, priority=priority, tag=tag,
+            )
+            for key, value in iter_array_items(result, array_keys):
+                yield {"type": "item", "key": key, "value": value}
+
+        if cache_key is not None:
+            await self._cache.set(cache_key, result)
+        yield {"type": "done", "value": result}
 
     async def transcribe_audio(
         self,
         audio_bytes: bytes,
         language: str = "en",
         filename: str = "audio.webm",
+        priority: Optional[Priority] = None,
+        tag: Optional[AICallTag] = None,
     ) -> str:
         audio_file = (filename, audio_bytes)
-        response = await self._client.audio.transcriptions.create(
-            model="whisper-1",
-            file=audio_file,
-            language=language,
-        )
-        return response.text
+        async with self._governed(0, priority, tag, "whisper-1") as call:
+            return await self._policy.execute("transcribe", lambda: self._send(
+                call,
+                lambda: self._provider.transcribe(
+                    model="whisper-1",
+                    audio_file=audio_file,
+                    language=language,
+                ),
+            ))
 
     async def text_to_speech(
         self,
         text: str,
         voice: str = "alloy",
         model: str = "tts-1",
+        priority: Optional[Priority] = None,
+        tag: Optional[AICallTag] = None,
     ) -> bytes:
-        response = await self._client.audio.speech.create(
-            model=model,
-            voice=voice,
-            input=text,
-        )
-        return response.content
+        async with self._governed(0, priority, tag, model) as call:
+            call.characters = len(text)
+            return await self._policy.execute("tts", lambda: self._send(
+                call,
+                lambda: self._provider.speech(
+                    model=model,
+                    voice=voice,
+                    text=text,
+                ),
+            ))
 
 
 ai_client = OpenAIClient()
@@ -0,0 +1,63 @@
+"""Sampled recording of chat prompts for offline model benchmarking.
+
+When ``AI_PROMPT_RECORD_PATH`` is set, a sample of tagged chat requests is
+appended to that JSONL file; ``python -m app.ai.benchmark`` replays them
+against each model tier. Recorded prompts contain resume and transcript
+text, so only enable this where that data may be stored.
+
+Lines are appended by a background thread, so recording never blocks the
+event loop; a sample still queued when the process exits is lost.
+"""
+import json
+import logging
+import queue
+import random
+import threading
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_pending: "queue.SimpleQueue[tuple[str, str]]" = queue.SimpleQueue()
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _write_forever():
+    while True:
+        path, line = _pending.get()
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            logger.warning("Failed to record AI prompt to %s", path, exc_info=True)
+
+
+def _ensure_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_forever, name="prompt-recorder", daemon=True)
+            _writer.start()
+
+
+def record_prompt(
+    operation: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    response_format: Optional[dict] = None,
+):
+    path = settings.AI_PROMPT_RECORD_PATH
+    if not path or not operation or random.random() >= settings.AI_PROMPT_RECORD_SAMPLE_RATE:
+        return
+    line = json.dumps({
+        "operation": operation,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "response_format": response_format,
+    }, ensure_ascii=False)
+    _ensure_writer()
+    _pending.put((path, line))
@@ -33,10 +33,15 @@ Recommendation Guidelines:
 - no_hire: Overall < 5.0"""
 
 
+def build_evaluation_position_prompt(job_title: str, domain: str) -> str:
+    """Position context, shared by every interview evaluated for the job."""
+    return f"""## Position
+**Position:** {job_title}
+**Domain:** {domain}"""
+
+
 def build_evaluation_prompt(
     candidate_name: str,
-    job_title: str,
-    domain: str,
     transcript: list[dict],
     questions_answers: list[dict],
 ) -> str:
@@ -54,8 +59,6 @@ def build_evaluation_prompt(
 
     return f"""## Interview Details
 **Candidate:** {candidate_name}
-**Position:** {job_title}
-**Domain:** {domain}
 
 ## Full Transcript
 {transcript_text}
@@ -64,3 +67,18 @@ def build_evaluation_prompt(
 {qa_text}
 
 Evaluate this interview and provide your assessment in JSON format."""
+
+
+def build_evaluation_messages(
+    candidate_name: str,
+    job_title: str,
+    domain: str,
+    transcript: list[dict],
+    questions_answers: list[dict],
+) -> list[dict]:
+    # Stable prefix (system prompt + position) before the per-interview content.
+    return [
+        {"role": "system", "content": EVALUATION_SYSTEM},
+        {"role": "user", "content": build_evaluation_position_prompt(job_title, domain)},
+        {"role": "user", "content": build_evaluation_prompt(candidate_name, transcript, questions_answers)},
+    ]
@@ -40,6 +40,41 @@ Include:
 - Ask if they're ready to begin"""
 
 
+def build_interview_background(job_title: str = None, candidate_resume: str = None) -> str:
+    """Fixed per-interview context. Kept identical across turns so it stays in the cached prompt prefix."""
+    parts = []
+    if job_title:
+        parts.append(f"Position: {job_title}")
+    if candidate_resume:
+        truncated = candidate_resume[:1500]
+        parts.append(f"""Candidate Resume Summary: {truncated}
+Use the resume to ask targeted follow-ups when relevant to the current topic.""")
+    if not parts:
+        return ""
+    return "[Interview Background]\n" + "\n\n".join(parts)
+
+
+def _build_conversation_prefix(
+    conversation_history: list[dict],
+    candidate_resume: str = None,
+    history_summary: str = None,
+    job_title: str = None,
+) -> list[dict]:
+    # Stable prefix first (system prompt, background, summary, prior turns),
+    # per-turn context last, so consecutive turns share a cacheable prefix.
+    messages = [{"role": "system", "content": INTERVIEW_CONDUCTOR_SYSTEM}]
+    background = build_interview_background(job_title, candidate_resume)
+    if background:
+        messages.append({"role": "system", "content": background})
+    if history_summary:
+        messages.append({
+            "role": "system",
+            "content": f"Summary of the earlier part of this interview:\n{history_summary}",
+        })
+    messages.extend(conversation_history)
+    return messages
+
+
 def build_interview_message_prompt(
     conversation_history: list[dict],
     current_question: str,
@@ -47,22 +82,16 @@ def build_interview_message_prompt(
     questions_remaining: int,
     time_remaining_min: int,
     candidate_resume: str = None,
+    history_summary: str = None,
+    job_title: str = None,
 ) -> list[dict]:
-    messages = [{"role": "system", "content": INTERVIEW_CONDUCTOR_SYSTEM}]
-    messages.extend(conversation_history)
-
-    resume_context = ""
-    if candidate_resume:
-        truncated = candidate_resume[:1500]
-        resume_context = f"""
-Candidate Resume Summary: {truncated}
-Use the resume to ask targeted follow-ups when relevant to the current topic."""
+    messages = _build_conversation_prefix(conversation_history, candidate_resume, history_summary, job_title)
 
     context = f"""[Interview Context]
 Current Question: {current_question}
 Questions Remaining: {questions_remaining}
 Time Remaining: {time_remaining_min} minutes
-{resume_context}
+
 The candidate just responded: "{candidate_response}"
 
 Based on their response, either:
@@ -74,6 +103,56 @@ Based on their response, either:
     return messages
 
 
+def build_transition_prompt(
+    conversation_history: list[dict],
+    current_question: str,
+    next_question: str,
+    questions_remaining: int,
+    candidate_resume: str = None,
+    history_summary: str = None,
+    job_title: str = None,
+) -> list[dict]:
+    """Prompt for the "move on" message, written before the candidate has answered."""
+    messages = _build_conversation_prefix(conversation_history, candidate_resume, history_summary, job_title)
+    context = f"""[Interview Context]
+Current Question: {current_question}
+Next Question: {next_question}
+Questions Remaining: {questions_remaining}
+
+The candidate is still answering the current question. Write your next message for when they finish with a complete answer:
+- A brief, neutral acknowledgement that does not depend on the specifics of their answer
+- A smooth transition into the next question, asked in your own words"""
+
+    messages.append({"role": "user", "content": context})
+    return messages
+
+
+HISTORY_SUMMARY_SYSTEM = """You maintain a running summary of an ongoing job interview for the AI interviewer.
+
+Merge the existing summary with the new conversation turns into a single updated summary that:
+- Lists the topics and questions already covered
+- Captures the key facts, examples and claims the candidate gave for each
+- Notes answers that were vague or worth revisiting
+- Stays under 250 words, written in the third person
+
+Respond with the summary text only."""
+
+
+def build_history_summary_prompt(existing_summary: str, turns: list[dict]) -> str:
+    lines = []
+    for turn in turns:
+        speaker = "Interviewer" if turn.get("role") == "assistant" else "Candidate"
+        lines.append(f"{speaker}: {turn.get('content', '')}")
+    turns_text = "\n".join(lines)
+    return f"""## Existing Summary
+{existing_summary or "None yet."}
+
+## New Conversation Turns
+{turns_text}
+
+Produce the updated summary."""
+
+
 def build_closing_prompt(candidate_name: str) -> str:
     return f"""Generate a warm, professional closing message for {candidate_name}'s interview.
 
@@ -24,16 +24,31 @@ Scoring guidelines:
 - 0-4: Poor match, not recommended"""
 
 
-def build_screening_user_prompt(resume_text: str, job_title: str, job_description: str, required_skills: list, experience_min: int, experience_max: int, education_level: str) -> str:
+def build_screening_job_prompt(job_title: str, job_description: str, required_skills: list, experience_min: int, experience_max: int, education_level: str) -> str:
+    """Job context, shared by every candidate screened for the job."""
     skills_text = ", ".join(required_skills) if required_skills else "Not specified"
     return f"""## Job Description
 **Title:** {job_title}
 **Description:** {job_description}
 **Required Skills:** {skills_text}
 **Experience:** {experience_min}-{experience_max} years
-**Education:** {education_level or 'Not specified'}
+**Education:** {education_level or 'Not specified'}"""
 
-## Candidate Resume
+
+def build_screening_resume_prompt(resume_text: str) -> str:
+    return f"""## Candidate Resume
 {resume_text}
 
 Analyze this resume against the job description and provide your assessment in JSON format."""
+
+
+def build_screening_messages(resume_text: str, job_title: str, job_description: str, required_skills: list, experience_min: int, experience_max: int, education_level: str) -> list[dict]:
+    # System prompt and job context form a prefix that is identical across a
+    # bulk screening run, so the provider can serve it from its prompt cache.
+    return [
+        {"role": "system", "content": RESUME_SCREENING_SYSTEM},
+        {"role": "user", "content": build_screening_job_prompt(
+            job_title, job_description, required_skills, experience_min, experience_max, education_level,
+        )},
+        {"role": "user", "content": build_screening_resume_prompt(resume_text)},
+    ]
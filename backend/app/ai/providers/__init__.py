@@ -0,0 +1,16 @@
+from app.ai.providers.base import ChatResult, LLMProvider, StreamDelta
+from app.core.config import settings
+
+
+def build_provider(name: str = None) -> LLMProvider:
+    name = name or settings.AI_PROVIDER
+    if name == "openai":
+        from app.ai.providers.openai_provider import OpenAIProvider
+        return OpenAIProvider()
+    if name == "stub":
+        from app.ai.providers.stub_provider import StubProvider
+        return StubProvider()
+    raise ValueError(f"Unknown AI provider: {name}")
+
+
+__all__ = ["ChatResult", "LLMProvider", "StreamDelta", "build_provider"]
@@ -0,0 +1,67 @@
+"""Provider interface behind ``ai_client``.
+
+A provider performs one raw request against a model backend and returns a
+normalized result. Caching, rate governing, retries and usage accounting
+all stay in ``OpenAIClient`` so every provider gets them unchanged.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+
+@dataclass
+class ChatResult:
+    content: str
+    usage: Optional[dict] = None
+
+
+@dataclass
+class StreamDelta:
+    """One streamed chunk; the final chunk may carry only ``usage``."""
+
+    content: str = ""
+    usage: Optional[dict] = None
+
+
+class LLMProvider(ABC):
+    name: str = ""
+
+    @abstractmethod
+    async def chat(
+        self,
+        *,
+        model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict] = None,
+        operation: str = "",
+    ) -> ChatResult:
+        """Run a chat completion. ``operation`` is the caller's AICallTag operation, if any."""
+
+    @abstractmethod
+    async def open_chat_stream(
+        self,
+        *,
+        model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict] = None,
+        operation: str = "",
+    ) -> AsyncIterator[StreamDelta]:
+        """Open a streamed chat completion and return an iterator over its deltas."""
+
+    @abstractmethod
+    async def transcribe(self, *, model: str, audio_file: tuple[str, bytes], language: str) -> str:
+        ...
+
+    @abstractmethod
+    async def speech(self, *, model: str, voice: str, text: str) -> bytes:
+        ...
+
+    async def aclose(self):
+        """Release connections held for the running event loop."""
+
+    def stats(self) -> dict:
+        return {}
@@ -0,0 +1,98 @@
+"""Tuned, instrumented httpx transport for provider SDK clients."""
+import logging
+import time
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class MeteredTransport(httpx.AsyncHTTPTransport):
+    """Connection-pooled transport that tracks request concurrency.
+
+    A request counts as in flight until its response headers arrive; streamed
+    bodies keep their connection checked out beyond that, which the pool
+    snapshot in ``stats()`` reflects.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool):
+        super().__init__(limits=limits, http2=http2)
+        self.max_connections = limits.max_connections
+        self.http2 = http2
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.header_wait_total_sec = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        started = time.monotonic()
+        try:
+            return await super().handle_async_request(request)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.header_wait_total_sec += time.monotonic() - started
+
+    def stats(self) -> dict:
+        # httpcore's pool exposes its live connections; fall back gracefully if
+        # the private attribute moves in a future httpx release.
+        connections = getattr(getattr(self, "_pool", None), "connections", None) or []
+        idle = sum(1 for c in connections if c.is_idle())
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "connections": len(connections),
+            "idle_connections": idle,
+            "active_connections": len(connections) - idle,
+            "utilization": round((len(connections) - idle) / self.max_connections, 4)
+            if self.max_connections else 0.0,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "avg_header_wait_sec": round(self.header_wait_total_sec / self.requests, 4)
+            if self.requests else 0.0,
+        }
+
+
+def build_http_client() -> tuple[httpx.AsyncClient, MeteredTransport]:
+    http2 = settings.OPENAI_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("OPENAI_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1")
+        http2 = False
+    transport = MeteredTransport(
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY_SEC,
+        ),
+        http2=http2,
+    )
+    client = httpx.AsyncClient(
+        transport=transport,
+        # Per-attempt deadlines come from the policy engine; these only bound
+        # connection setup and waiting for a free pooled connection.
+        timeout=httpx.Timeout(
+            settings.OPENAI_HTTP_TIMEOUT_SEC,
+            connect=settings.OPENAI_CONNECT_TIMEOUT_SEC,
+            pool=settings.OPENAI_POOL_TIMEOUT_SEC,
+        ),
+        follow_redirects=True,
+    )
+    return client, transport
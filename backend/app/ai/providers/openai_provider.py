@@ -0,0 +1,124 @@
+"""OpenAI API provider."""
+import asyncio
+import weakref
+from typing import AsyncIterator, Optional
+
+import openai
+
+from app.ai.providers.base import ChatResult, LLMProvider, StreamDelta
+from app.ai.providers.http_transport import MeteredTransport, build_http_client
+from app.ai.usage import extract_usage
+from app.core.config import settings
+
+
+class OpenAIProvider(LLMProvider):
+    name = "openai"
+
+    def __init__(self):
+        # httpx pools are bound to the loop that opened their connections, and
+        # Celery tasks run each job on a fresh event loop, so every loop gets
+        # its own SDK client and connection pool.
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[openai.AsyncOpenAI, MeteredTransport]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is None:
+            http_client, transport = build_http_client()
+            # Retries and timeouts are owned by the policy engine.
+            client = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                max_retries=0,
+                http_client=http_client,
+            )
+            entry = (client, transport)
+            self._clients[loop] = entry
+        return entry[0]
+
+    async def aclose(self):
+        entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].close()
+
+    def stats(self) -> dict:
+        pools = [transport.stats() for _, transport in list(self._clients.values())]
+        return {
+            "event_loops": len(pools),
+            "max_connections": settings.OPENAI_MAX_CONNECTIONS,
+            "max_keepalive_connections": settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            "keepalive_expiry_sec": settings.OPENAI_KEEPALIVE_EXPIRY_SEC,
+            "pools": pools,
+        }
+
+    async def chat(
+        self,
+        *,
+        model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict] = None,
+        operation: str = "",
+    ) -> ChatResult:
+        kwargs = {}
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        return ChatResult(response.choices[0].message.content, extract_usage(response))
+
+    async def open_chat_stream(
+        self,
+        *,
+        model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict] = None,
+        operation: str = "",
+    ) -> AsyncIterator[StreamDelta]:
+        kwargs = {}
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        stream = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            # Final chunk carries usage (including cached prompt tokens).
+            extra_body={"stream_options": {"include_usage": True}},
+            **kwargs,
+        )
+        return self._deltas(stream)
+
+    async def _deltas(self, stream) -> AsyncIterator[StreamDelta]:
+        async for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            usage = extract_usage(chunk)
+            if content or usage:
+                yield StreamDelta(content or "", usage)
+
+    async def transcribe(self, *, model: str, audio_file: tuple[str, bytes], language: str) -> str:
+        response = await self.client.audio.transcriptions.create(
+            model=model,
+            file=audio_file,
+            language=language,
+        )
+        return response.text
+
+    async def speech(self, *, model: str, voice: str, text: str) -> bytes:
+        response = await self.client.audio.speech.create(
+            model=model,
+            voice=voice,
+            input=text,
+        )
+        return response.content
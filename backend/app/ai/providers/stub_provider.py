@@ -0,0 +1,285 @@
+"""Deterministic local provider for offline load testing.
+
+Returns schema-valid JSON for every structured chain (screening, evaluation,
+question generation, resume parsing), plausible interviewer text for the
+conversational chains, silent WAV audio for TTS and canned transcripts for
+STT. Output is seeded from the request content, so the same request always
+yields the same response. Latency is simulated as a fixed overhead plus a
+per-output-token delay, both configurable.
+"""
+import asyncio
+import hashlib
+import io
+import json
+import random
+import re
+import wave
+from typing import AsyncIterator, Optional
+
+from app.ai.prompts.evaluation import EVALUATION_SYSTEM
+from app.ai.prompts.interview_conduct import HISTORY_SUMMARY_SYSTEM
+from app.ai.prompts.question_generation import QUESTION_GENERATION_SYSTEM
+from app.ai.prompts.resume_parsing import RESUME_PARSE_SYSTEM
+from app.ai.prompts.resume_screening import RESUME_SCREENING_SYSTEM
+from app.ai.providers.base import ChatResult, LLMProvider, StreamDelta
+from app.ai.tokens import count_message_tokens, count_tokens
+from app.core.config import settings
+
+# Fallback when a JSON call arrives without an AICallTag operation.
+_SYSTEM_PROMPT_OPERATIONS = {
+    RESUME_SCREENING_SYSTEM: "screening",
+    EVALUATION_SYSTEM: "evaluation",
+    QUESTION_GENERATION_SYSTEM: "question_gen",
+    RESUME_PARSE_SYSTEM: "parse",
+    HISTORY_SUMMARY_SYSTEM: "history_summary",
+}
+
+_INTERVIEWER_REPLIES = [
+    "Thank you, that's a helpful answer. Could you walk me through a specific situation where you applied that in practice?",
+    "That makes sense. What would you do differently if you faced the same challenge again today?",
+    "Good point. How did you measure whether your approach was successful?",
+    "I appreciate the detail. Let's move on: how do you prioritise when several urgent tasks arrive at once?",
+    "Interesting. Can you tell me about a time you had to explain that to someone without your background?",
+]
+
+_CANDIDATE_ANSWERS = [
+    "In my last role I handled that by setting up a weekly review with the team and tracking issues in a shared sheet.",
+    "I would first understand the customer's concern, then check our records and propose a solution within the day.",
+    "We had a tight deadline, so I split the work into smaller tasks and checked progress every morning.",
+    "I usually start with safety and compliance requirements, then plan the schedule around them.",
+]
+
+_QUESTION_TYPES = ["technical", "technical", "behavioral", "situational", "domain_specific"]
+_DIFFICULTIES = ["easy", "medium", "medium", "hard"]
+
+
+def _seed(*parts) -> random.Random:
+    digest = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def _score(rng: random.Random, low: float, high: float) -> float:
+    return round(rng.uniform(low, high), 1)
+
+
+def _section(text: str, label: str) -> str:
+    match = re.search(rf"\*\*{re.escape(label)}:\*\*\s*(.+)", text)
+    return match.group(1).strip() if match else ""
+
+
+class StubProvider(LLMProvider):
+    name = "stub"
+
+    def __init__(self, latency_ms: Optional[int] = None, token_latency_ms: Optional[int] = None):
+        self._latency = (settings.AI_STUB_LATENCY_MS if latency_ms is None else latency_ms) / 1000
+        self._token_latency = (
+            settings.AI_STUB_TOKEN_LATENCY_MS if token_latency_ms is None else token_latency_ms
+        ) / 1000
+
+    # --- content generation -------------------------------------------------
+
+    def _operation(self, messages: list[dict], operation: str) -> str:
+        if operation:
+            return operation
+        system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        return _SYSTEM_PROMPT_OPERATIONS.get(system, "")
+
+    def _screening(self, rng: random.Random, messages: list[dict]) -> dict:
+        text = "\n".join(m["content"] for m in messages if m.get("role") == "user")
+        resume = messages[-1]["content"].lower()
+        skills = [s.strip() for s in _section(text, "Required Skills").split(",") if s.strip()]
+        skills = [s for s in skills if s != "Not specified"]
+        matched = [s for s in skills if s.lower() in resume]
+        missing = [s for s in skills if s not in matched]
+        keyword = round(10 * len(matched) / len(skills), 1) if skills else _score(rng, 4, 8)
+        scores = {
+            "keyword_match_score": keyword,
+            "skill_relevance_score": _score(rng, 3, 9),
+            "experience_match_score": _score(rng, 3, 9),
+            "education_match_score": _score(rng, 4, 9),
+        }
+        overall = round(sum(scores.values()) / len(scores), 1)
+        if overall >= 8:
+            recommendation = "strongly_recommend"
+        elif overall >= 6:
+            recommendation = "recommend"
+        elif overall >= 4:
+            recommendation = "maybe"
+        else:
+            recommendation = "not_recommend"
+        return {
+            **scores,
+            "overall_score": overall,
+            "recommendation": recommendation,
+            "matched_skills": matched,
+            "missing_skills": missing,
+            "strengths": ["Relevant industry exposure", "Clear progression in responsibilities"],
+            "concerns": ["Limited evidence of " + missing[0]] if missing else [],
+            "summary": f"Synthetic screening result. {len(matched)} of {len(skills)} required skills found.",
+        }
+
+    def _evaluation(self, rng: random.Random, messages: list[dict]) -> dict:
+        scores = {
+            "communication_score": _score(rng, 4, 9.5),
+            "technical_score": _score(rng, 3, 9.5),
+            "confidence_score": _score(rng, 4, 9.5),
+            "domain_knowledge_score": _score(rng, 3, 9.5),
+            "problem_solving_score": _score(rng, 3, 9.5),
+        }
+        overall = round(
+            scores["technical_score"] * 0.25
+            + scores["domain_knowledge_score"] * 0.25
+            + scores["communication_score"] * 0.20
+            + scores["problem_solving_score"] * 0.20
+            + scores["confidence_score"] * 0.10,
+            1,
+        )
+        if overall >= 8.0:
+            recommendation = "strongly_hire"
+        elif overall >= 6.5:
+            recommendation = "hire"
+        elif overall >= 5.0:
+            recommendation = "maybe"
+        else:
+            recommendation = "no_hire"
+        return {
+            **scores,
+            "overall_score": overall,
+            "strengths": ["Structured answers", "Good awareness of safety and process", "Calm under follow-up questions"],
+            "weaknesses": ["Few quantified outcomes", "Limited depth on edge cases"],
+            "detailed_feedback": (
+                "This is a synthetic evaluation produced by the stub AI provider.\n\n"
+                f"The candidate scored {overall} overall across the weighted dimensions."
+            ),
+            "recommendation": recommendation,
+        }
+
+    def _questions(self, rng: random.Random, messages: list[dict]) -> dict:
+        prompt = messages[-1]["content"]
+        match = re.search(r"Generate (\d+) unique", prompt)
+        count = int(match.group(1)) if match else 10
+        job_title = _section(prompt, "Job Title") or "this role"
+        domain = _section(prompt, "Domain") or "your field"
+        return {
+            "questions": [
+                {
+                    "question_text": f"Question {i + 1}: Describe how you would handle a typical {domain} "
+                                     f"challenge as a {job_title}, variant {rng.randint(100, 999)}.",
+                    "question_type": _QUESTION_TYPES[i % len(_QUESTION_TYPES)],
+                    "difficulty": rng.choice(_DIFFICULTIES),
+                    "expected_answer": "A structured approach, a concrete example and the measured outcome.",
+                    "keywords": [domain.lower(), "process", "outcome"],
+                }
+                for i in range(count)
+            ]
+        }
+
+    def _parse(self, rng: random.Random, messages: list[dict]) -> dict:
+        text = messages[-1]["content"].split("## Resume Text", 1)[-1]
+        email = re.search(r"[\w.+-]+@[\w-]+\.[\w.]+", text)
+        phone = re.search(r"\+?\d[\d\s-]{8,}\d", text)
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        return {
+            "full_name": lines[0][:100] if lines else "",
+            "email": email.group(0) if email else "",
+            "phone": phone.group(0) if phone else "",
+            "address": "",
+            "date_of_birth": "",
+            "linkedin_url": "",
+            "portfolio_url": "",
+            "experience_years": rng.randint(0, 15),
+            "education": "",
+            "skills": [],
+            "work_experiences": [],
+        }
+
+    def _json(self, operation: str, rng: random.Random, messages: list[dict]) -> dict:
+        builders = {
+            "screening": self._screening,
+            "evaluation": self._evaluation,
+            "question_gen": self._questions,
+            "parse": self._parse,
+        }
+        builder = builders.get(operation)
+        return builder(rng, messages) if builder else {}
+
+    def _text(self, operation: str, rng: random.Random) -> str:
+        if operation == "greeting":
+            return (
+                "Hello, and thank you for joining today. I'll be conducting your interview. "
+                "Could you start by telling me a little about your current role?"
+            )
+        if operation == "closing":
+            return "Thank you for your time today. That concludes our interview; the team will be in touch soon."
+        if operation == "history_summary":
+            return "The candidate described relevant experience and answered the earlier questions with examples."
+        return rng.choice(_INTERVIEWER_REPLIES)
+
+    def _respond(self, model: str, messages: list[dict], response_format: Optional[dict], operation: str):
+        operation = self._operation(messages, operation)
+        rng = _seed(model, messages)
+        if response_format is not None or operation in ("screening", "evaluation", "question_gen", "parse"):
+            content = json.dumps(self._json(operation, rng, messages))
+        else:
+            content = self._text(operation, rng)
+        prompt_tokens = count_message_tokens(messages, model)
+        completion_tokens = count_tokens(content, model)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "cached_tokens": 0,
+        }
+        return content, usage
+
+    # --- provider interface -------------------------------------------------
+
+    async def chat(
+        self,
+        *,
+        model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict] = None,
+        operation: str = "",
+    ) -> ChatResult:
+        content, usage = self._respond(model, messages, response_format, operation)
+        await asyncio.sleep(self._latency + self._token_latency * usage["completion_tokens"])
+        return ChatResult(content, usage)
+
+    async def open_chat_stream(
+        self,
+        *,
+        model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict] = None,
+        operation: str = "",
+    ) -> AsyncIterator[StreamDelta]:
+        content, usage = self._respond(model, messages, response_format, operation)
+        await asyncio.sleep(self._latency)
+        return self._deltas(content, usage)
+
+    async def _deltas(self, content: str, usage: dict) -> AsyncIterator[StreamDelta]:
+        for piece in re.findall(r"\S+\s*", content):
+            yield StreamDelta(piece)
+            await asyncio.sleep(self._token_latency)
+        yield StreamDelta(usage=usage)
+
+    async def transcribe(self, *, model: str, audio_file: tuple[str, bytes], language: str) -> str:
+        await asyncio.sleep(self._latency)
+        return _seed(audio_file[1].hex()[:4096]).choice(_CANDIDATE_ANSWERS)
+
+    async def speech(self, *, model: str, voice: str, text: str) -> bytes:
+        await asyncio.sleep(self._latency)
+        # Silent 8 kHz mono WAV, roughly as long as the text would take to say.
+        seconds = min(30.0, 0.35 * max(1, len(text.split())))
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(1)
+            out.setframerate(8000)
+            out.writeframes(b"\x80" * int(8000 * seconds))
+        return buf.getvalue()
@@ -0,0 +1,265 @@
+"""Back-pressure for AI provider calls.
+
+Every request passes through a single governor that enforces the provider's
+requests-per-minute and tokens-per-minute budgets with token buckets, caps
+in-flight requests with an adaptive (AIMD) concurrency limit, and admits
+queued callers strictly by priority so live interviews are never stuck
+behind a bulk screening burst.
+
+Batch callers may only draw the buckets down to a reserve, which keeps
+headroom for interactive work running in other processes (the API server
+and Celery workers each hold their own governor).
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MAX_WAIT_POLL_SEC = 1.0
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar("ai_priority", default=Priority.NORMAL)
+
+
+@contextmanager
+def ai_priority(priority: Priority):
+    """Set the default priority for AI calls made inside the block."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+class TokenBucket:
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay_for(self, amount: float, reserve: float = 0.0) -> float:
+        """Seconds until ``amount`` can be taken without dropping below ``reserve``."""
+        self._refill()
+        needed = amount - (self.level - reserve)
+        if needed <= 0:
+            return 0.0
+        return needed / self.rate
+
+    def available(self) -> int:
+        self._refill()
+        return int(self.level)
+
+    def take(self, amount: float):
+        self._refill()
+        self.level -= amount
+
+    def give_back(self, amount: float):
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class Permit:
+    """Handle for an admitted request; reports actual usage back to the governor."""
+
+    def __init__(self, governor: "RateGovernor", reserved_tokens: int):
+        self._governor = governor
+        self.reserved_tokens = reserved_tokens
+
+    def record_usage(self, total_tokens: Optional[int]):
+        if total_tokens is None:
+            return
+        unused = self.reserved_tokens - total_tokens
+        if unused > 0:
+            self._governor._tpm.give_back(unused)
+        elif unused < 0:
+            self._governor._tpm.take(-unused)
+        self.reserved_tokens = total_tokens
+
+    def record_request(self):
+        """Charge a retry or hedged duplicate of the admitted request to the RPM budget."""
+        self._governor._rpm.take(1)
+
+
+class RateGovernor:
+    def __init__(
+        self,
+        rpm: int,
+        tpm: int,
+        max_concurrency: int,
+        min_concurrency: int,
+        batch_share: float,
+    ):
+        self._rpm = TokenBucket(rpm)
+        self._tpm = TokenBucket(tpm)
+        self._max_concurrency = max_concurrency
+        self._min_concurrency = min_concurrency
+        self._limit = float(max_concurrency)
+        self._batch_share = batch_share
+        self._in_flight = 0
+        self._queue: list[list] = []
+        self._seq = itertools.count()
+
+        self.admitted = {p.name.lower(): 0 for p in Priority}
+        self.wait_total_sec = {p.name.lower(): 0.0 for p in Priority}
+        self.wait_max_sec = {p.name.lower(): 0.0 for p in Priority}
+        self.rate_limited = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(self._min_concurrency, int(self._limit))
+
+    def _reserve(self, bucket: TokenBucket, priority: Priority) -> float:
+        if priority == Priority.BATCH:
+            return bucket.capacity * (1.0 - self._batch_share)
+        return 0.0
+
+    def _budget_delay(self, tokens: int, priority: Priority) -> float:
+        return max(
+            self._rpm.delay_for(1, self._reserve(self._rpm, priority)),
+            self._tpm.delay_for(tokens, self._reserve(self._tpm, priority)),
+        )
+
+    def _purge_dead(self):
+        # Waiters whose event loop was closed (e.g. an aborted Celery task)
+        # would otherwise block the head of the queue forever.
+        alive = [e for e in self._queue if not e[3].get_loop().is_closed()]
+        if len(alive) != len(self._queue):
+            self._queue = alive
+            heapq.heapify(self._queue)
+
+    def _wake_head(self):
+        self._purge_dead()
+        if not self._queue:
+            return
+        fut = self._queue[0][3]
+        if fut.done():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if fut.get_loop() is running:
+            fut.set_result(None)
+        else:
+            fut.get_loop().call_soon_threadsafe(lambda: fut.done() or fut.set_result(None))
+
+    async def acquire(self, tokens: int, priority: Priority) -> Permit:
+        loop = asyncio.get_running_loop()
+        tokens = int(min(tokens, self._tpm.capacity * self._batch_share))
+        entry = [int(priority), next(self._seq), tokens, loop.create_future()]
+        heapq.heappush(self._queue, entry)
+        self._wake_head()
+        started = time.monotonic()
+
+        try:
+            while True:
+                self._purge_dead()
+                # Poll as a safety net in case a wake-up is missed.
+                timeout = _MAX_WAIT_POLL_SEC
+                if self._queue[0] is entry and self._in_flight < self.concurrency_limit:
+                    delay = self._budget_delay(tokens, priority)
+                    if delay <= 0:
+                        break
+                    timeout = min(delay, timeout)
+                try:
+                    await asyncio.wait_for(asyncio.shield(entry[3]), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                entry[3] = loop.create_future()
+        finally:
+            if entry in self._queue:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._wake_head()
+
+        self._rpm.take(1)
+        self._tpm.take(tokens)
+        self._in_flight += 1
+
+        waited = time.monotonic() - started
+        name = priority.name.lower()
+        self.admitted[name] += 1
+        self.wait_total_sec[name] += waited
+        self.wait_max_sec[name] = max(self.wait_max_sec[name], waited)
+        if waited > 1.0:
+            logger.info("AI call waited %.2fs for capacity (priority=%s)", waited, name)
+
+        self._wake_head()
+        return Permit(self, tokens)
+
+    def release(self, success: bool = True):
+        self._in_flight = max(0, self._in_flight - 1)
+        if success and self._limit < self._max_concurrency:
+            # Additive increase: roughly +1 per window of successful calls.
+            self._limit = min(self._max_concurrency, self._limit + 1.0 / max(1.0, self._limit))
+        self._wake_head()
+
+    def on_rate_limited(self):
+        """Multiplicative decrease after a provider 429."""
+        self.rate_limited += 1
+        self._limit = max(float(self._min_concurrency), self._limit / 2)
+        logger.warning("AI provider rate limited; concurrency limit now %d", self.concurrency_limit)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int, priority: Optional[Priority] = None):
+        permit = await self.acquire(tokens, priority if priority is not None else current_priority())
+        success = False
+        try:
+            yield permit
+            success = True
+        finally:
+            self.release(success)
+
+    def stats(self) -> dict:
+        depth = {p.name.lower(): 0 for p in Priority}
+        for entry in self._queue:
+            depth[Priority(entry[0]).name.lower()] += 1
+        return {
+            "in_flight": self._in_flight,
+            "concurrency_limit": self.concurrency_limit,
+            "queue_depth": depth,
+            "admitted": dict(self.admitted),
+            "avg_wait_sec": {
+                name: round(self.wait_total_sec[name] / count, 4) if count else 0.0
+                for name, count in self.admitted.items()
+            },
+            "max_wait_sec": {name: round(v, 4) for name, v in self.wait_max_sec.items()},
+            "rate_limited": self.rate_limited,
+            "rpm_available": self._rpm.available(),
+            "tpm_available": self._tpm.available(),
+        }
+
+
+def build_governor() -> RateGovernor:
+    return RateGovernor(
+        rpm=settings.AI_RPM_LIMIT,
+        tpm=settings.AI_TPM_LIMIT,
+        max_concurrency=settings.AI_MAX_CONCURRENCY,
+        min_concurrency=settings.AI_MIN_CONCURRENCY,
+        batch_share=settings.AI_BATCH_BUDGET_SHARE,
+    )
@@ -0,0 +1,107 @@
+"""Content-addressed cache for deterministic OpenAI completions.
+
+Two tiers: a small in-process LRU in front of Redis. Keys are a SHA-256 of
+the request parameters that influence the output, so the same resume parsed
+twice or the same (resume, job) pair re-screened returns the stored result.
+"""
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.redis import redis_pool
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    response_format: Optional[dict] = None,
+) -> str:
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """LRU + Redis cache for JSON-serializable completion results."""
+
+    def __init__(self, prefix: str = "ai:cache:"):
+        self._prefix = prefix
+        # Entries are kept serialized so callers can mutate returned results.
+        self._lru: OrderedDict[str, str] = OrderedDict()
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _get_redis(self) -> aioredis.Redis:
+        return redis_pool.client
+
+    def _remember(self, key: str, data: str):
+        self._lru[key] = data
+        self._lru.move_to_end(key)
+        while len(self._lru) > settings.AI_CACHE_LRU_SIZE:
+            self._lru.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[Any]:
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            self.memory_hits += 1
+            return json.loads(self._lru[key])
+
+        try:
+            data = await self._get_redis().get(self._prefix + key)
+        except Exception:
+            self.errors += 1
+            logger.warning("AI cache read failed, treating as miss", exc_info=True)
+            data = None
+
+        if data is None:
+            self.misses += 1
+            return None
+
+        self._remember(key, data)
+        self.redis_hits += 1
+        return json.loads(data)
+
+    async def set(self, key: str, value: Any):
+        data = json.dumps(value, default=str)
+        self._remember(key, data)
+        try:
+            await self._get_redis().set(self._prefix + key, data, ex=settings.AI_CACHE_TTL_SEC)
+        except Exception:
+            self.errors += 1
+            logger.warning("AI cache write failed", exc_info=True)
+
+    def clear_memory(self):
+        self._lru.clear()
+
+    def stats(self) -> dict:
+        hits = self.memory_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._lru),
+        }
@@ -0,0 +1,41 @@
+"""Prompt token estimation with tiktoken."""
+import logging
+from functools import lru_cache
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Per-message framing overhead used by the chat format.
+_TOKENS_PER_MESSAGE = 4
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        logger.warning("tiktoken encoding unavailable, using length heuristic", exc_info=True)
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    if not text:
+        return 0
+    encoding = _get_encoding(model or "gpt-4o")
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: list[dict], model: Optional[str] = None) -> int:
+    total = 3  # every reply is primed with the assistant role
+    for message in messages:
+        total += _TOKENS_PER_MESSAGE + count_tokens(message.get("content") or "", model)
+    return total
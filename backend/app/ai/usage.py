@@ -0,0 +1,86 @@
+"""Token usage helpers: call tags, usage extraction and cost estimation."""
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class AICallTag:
+    """Identifies what an AI call was for, for the usage ledger.
+
+    ``operation`` is one of: greeting, turn, transition, closing,
+    history_summary, screening, parse, evaluation, question_gen, stt, tts.
+    Services usually build a tag with just the entity ids and the chain
+    fills in the operation.
+    """
+
+    operation: str = ""
+    interview_id: Optional[int] = None
+    job_id: Optional[int] = None
+    candidate_id: Optional[int] = None
+
+
+def tag_for(operation: str, tag: Optional[AICallTag] = None) -> AICallTag:
+    return replace(tag, operation=operation) if tag else AICallTag(operation)
+
+
+def _field(obj, name: str):
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def extract_usage(response) -> Optional[dict]:
+    """Return prompt/completion/cached token counts, or None if the response has no usage."""
+    usage = _field(response, "usage")
+    if usage is None:
+        return None
+    details = _field(usage, "prompt_tokens_details")
+    return {
+        "prompt_tokens": _field(usage, "prompt_tokens") or 0,
+        "completion_tokens": _field(usage, "completion_tokens") or 0,
+        "total_tokens": _field(usage, "total_tokens") or 0,
+        "cached_tokens": _field(details, "cached_tokens") or 0,
+    }
+
+
+class PromptCacheStats:
+    """Aggregates provider-side prompt cache hits per client operation."""
+
+    def __init__(self):
+        self._totals: dict[str, dict[str, int]] = {}
+
+    def record(self, operation: str, usage: dict):
+        totals = self._totals.setdefault(
+            operation, {"requests": 0, "prompt_tokens": 0, "cached_tokens": 0}
+        )
+        totals["requests"] += 1
+        totals["prompt_tokens"] += usage["prompt_tokens"]
+        totals["cached_tokens"] += usage["cached_tokens"]
+
+    def stats(self) -> dict:
+        return {
+            operation: {
+                **totals,
+                "cached_ratio": round(totals["cached_tokens"] / totals["prompt_tokens"], 4)
+                if totals["prompt_tokens"] else 0.0,
+            }
+            for operation, totals in self._totals.items()
+        }
+
+
+def estimate_cost(model: str, usage: Optional[dict] = None, characters: int = 0) -> float:
+    """Estimate USD cost from ``AI_MODEL_PRICING`` (prices per 1M tokens or characters)."""
+    pricing = settings.AI_MODEL_PRICING.get(model)
+    if not pricing:
+        return 0.0
+    cost = characters * pricing.get("characters", 0.0)
+    if usage:
+        cached = usage["cached_tokens"]
+        cost += (usage["prompt_tokens"] - cached) * pricing.get("input", 0.0)
+        cost += cached * pricing.get("cached_input", pricing.get("input", 0.0))
+        cost += usage["completion_tokens"] * pricing.get("output", 0.0)
+    return cost / 1_000_000
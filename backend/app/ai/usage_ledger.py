@@ -0,0 +1,112 @@
+"""Write-behind ledger of AI usage records.
+
+Provider calls append records to an in-memory buffer; a background task
+batch-inserts them into ``ai_usage_records`` so accounting never adds a DB
+round trip to a candidate-facing request.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from app.ai.usage import AICallTag, estimate_cost
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class UsageLedger:
+    def __init__(self):
+        self._buffer: list[dict] = []
+        self._flusher: Optional[asyncio.Task] = None
+        # Batch-size flushes still writing; held so they are not garbage-collected mid-insert.
+        self._flushes: set[asyncio.Task] = set()
+        self.written = 0
+        self.dropped = 0
+
+    def record(
+        self,
+        tag: Optional[AICallTag],
+        model: str,
+        latency_sec: float,
+        usage: Optional[dict] = None,
+        characters: int = 0,
+        success: bool = True,
+    ):
+        if not settings.AI_USAGE_LEDGER_ENABLED or tag is None:
+            return
+        usage = usage or {}
+        self._buffer.append({
+            "operation": tag.operation,
+            "model": model,
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "cached_tokens": usage.get("cached_tokens", 0),
+            "characters": characters,
+            "latency_ms": int(latency_sec * 1000),
+            "cost_usd": estimate_cost(model, usage or None, characters),
+            "success": success,
+            "interview_id": tag.interview_id,
+            "job_id": tag.job_id,
+            "candidate_id": tag.candidate_id,
+        })
+        if len(self._buffer) > settings.AI_USAGE_LEDGER_MAX_BUFFER:
+            overflow = len(self._buffer) - settings.AI_USAGE_LEDGER_MAX_BUFFER
+            del self._buffer[:overflow]
+            self.dropped += overflow
+        if len(self._buffer) >= settings.AI_USAGE_LEDGER_BATCH_SIZE:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._write_buffer())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self):
+        """Write everything buffered, after any batch-size flush already writing on this loop."""
+        loop = asyncio.get_running_loop()
+        pending = [t for t in self._flushes if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self._write_buffer()
+
+    async def _write_buffer(self):
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+
+        from app.core.database import async_session
+        from app.models.ai_usage import AIUsageRecord
+
+        try:
+            async with async_session() as session:
+                session.add_all([AIUsageRecord(**row) for row in batch])
+                await session.commit()
+            self.written += len(batch)
+        except Exception:
+            self.dropped += len(batch)
+            logger.warning("Failed to write %d AI usage records", len(batch), exc_info=True)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.AI_USAGE_LEDGER_FLUSH_INTERVAL_SEC)
+            await self.flush()
+
+    def start(self):
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {"buffered": len(self._buffer), "written": self.written, "dropped": self.dropped}
+
+
+usage_ledger = UsageLedger()
@@ -0,0 +1,170 @@
+"""Shrink recorded audio before it is uploaded to Whisper.
+
+Browser recordings arrive as stereo 44.1/48 kHz webm or wav, often with
+dead air at either end. ffmpeg trims leading and trailing silence,
+downmixes to mono, resamples to 16 kHz (Whisper's native rate) and encodes
+Opus in an Ogg container at ``AUDIO_PREPROCESS_BITRATE`` — typically a
+tenth of the original size. If ffmpeg is missing or fails, the original
+audio is sent unchanged. The trimmed clip's duration (from ffprobe) tells
+silence apart from a short answer.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from app.ai.voice.recording_chunker import probe_duration
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Trimming keeps up to 0.1 s of silence at each end, so shorter output holds no speech;
+# a one-word answer ("yes", "no") still runs well past this.
+_MIN_SPEECH_SEC = 0.25
+
+
+@dataclass
+class PreparedAudio:
+    data: bytes
+    filename: str
+    input_bytes: int
+    processed: bool
+    elapsed_sec: float = 0.0
+    duration_sec: Optional[float] = None
+
+    @property
+    def silent(self) -> bool:
+        return self.processed and self.duration_sec is not None and self.duration_sec < _MIN_SPEECH_SEC
+
+
+class _Totals:
+    def __init__(self):
+        self.files = 0
+        self.fallbacks = 0
+        self.silent = 0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.elapsed_sec = 0.0
+
+    def stats(self) -> dict:
+        processed = self.files - self.fallbacks
+        return {
+            "files": self.files,
+            "fallbacks": self.fallbacks,
+            "silent": self.silent,
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "compression_ratio": round(self.output_bytes / self.input_bytes, 4) if self.input_bytes else 0.0,
+            "avg_ms": round(self.elapsed_sec / processed * 1000, 1) if processed else 0.0,
+        }
+
+
+preprocess_totals = _Totals()
+
+
+def _trim(threshold_db: float) -> str:
+    # silenceremove only trims the start, so trim, reverse, trim again and reverse back.
+    trim = f"silenceremove=start_periods=1:start_silence=0.1:start_threshold={threshold_db}dB"
+    return f"{trim},areverse,{trim},areverse"
+
+
+def _ffmpeg_args(path: str, out_path: str) -> list[str]:
+    return [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin",
+        "-i", path,
+        "-vn",
+        "-af", _trim(settings.AUDIO_SILENCE_THRESHOLD_DB),
+        "-ac", "1",
+        "-ar", "16000",
+        "-c:a", "libopus",
+        "-b:a", settings.AUDIO_PREPROCESS_BITRATE,
+        "-application", "voip",
+        "-f", "ogg",
+        "-y", out_path,
+    ]
+
+
+async def _run_ffmpeg(path: str, out_path: str):
+    proc = await asyncio.create_subprocess_exec(
+        *_ffmpeg_args(path, out_path),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout=settings.AUDIO_PREPROCESS_TIMEOUT_SEC)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode != 0:
+        raise RuntimeError(err.decode("utf-8", errors="replace").strip()[-300:])
+
+
+async def _trimmed_duration(path: str) -> Optional[float]:
+    try:
+        return await probe_duration(path)
+    except Exception as e:
+        # Unknown length: let Whisper hear it rather than drop a real answer.
+        logger.warning(f"Could not probe preprocessed audio: {type(e).__name__}: {e}")
+        return None
+
+
+async def preprocess_file(path: str, filename: str) -> PreparedAudio:
+    """Normalize and compress the audio file at ``path``; falls back to its raw bytes."""
+    input_bytes = os.path.getsize(path)
+    preprocess_totals.files += 1
+    preprocess_totals.input_bytes += input_bytes
+    started = time.monotonic()
+    out_path = await asyncio.to_thread(_temp_path, ".ogg")
+    try:
+        try:
+            await _run_ffmpeg(path, out_path)
+            data = await asyncio.to_thread(_read, out_path)
+        except Exception as e:
+            preprocess_totals.fallbacks += 1
+            logger.warning(f"Audio preprocessing failed, sending original ({filename}): {type(e).__name__}: {e}")
+            data = await asyncio.to_thread(_read, path)
+            preprocess_totals.output_bytes += len(data)
+            return PreparedAudio(data, filename, input_bytes, processed=False)
+        duration = await _trimmed_duration(out_path)
+    finally:
+        os.remove(out_path)
+
+    elapsed = time.monotonic() - started
+    preprocess_totals.output_bytes += len(data)
+    preprocess_totals.elapsed_sec += elapsed
+    prepared = PreparedAudio(
+        data, f"{os.path.splitext(filename)[0] or 'audio'}.ogg", input_bytes, True, elapsed, duration,
+    )
+    if prepared.silent:
+        preprocess_totals.silent += 1
+    return prepared
+
+
+async def preprocess_bytes(audio_bytes: bytes, filename: str) -> PreparedAudio:
+    path = await asyncio.to_thread(_write_temp, audio_bytes, os.path.splitext(filename)[1] or ".webm")
+    try:
+        return await preprocess_file(path, filename)
+    finally:
+        os.remove(path)
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _temp_path(suffix: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    return path
+
+
+def _write_temp(data: bytes, suffix: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
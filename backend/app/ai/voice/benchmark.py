@@ -0,0 +1,127 @@
+"""Benchmark audio preprocessing on sample clips.
+
+For every clip in a directory, reports the original and preprocessed upload
+size and the ffmpeg time. With ``--transcribe`` each clip is also sent to
+Whisper both raw and preprocessed, reporting the latency of each and how
+closely the two transcripts agree.
+
+    python -m app.ai.voice.benchmark samples/ --transcribe
+
+Clips are transcribed one at a time so latencies are comparable.
+"""
+import argparse
+import asyncio
+import difflib
+import json
+import os
+import time
+from pathlib import Path
+
+from app.ai.openai_client import ai_client
+from app.ai.rate_governor import Priority
+from app.ai.voice.audio_preprocess import preprocess_file
+
+AUDIO_EXTENSIONS = {".webm", ".wav", ".ogg", ".mp3", ".m4a", ".mp4", ".flac"}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def _transcribe(audio_bytes: bytes, filename: str) -> tuple[float, str]:
+    started = time.monotonic()
+    text = await ai_client.transcribe_audio(
+        audio_bytes=audio_bytes, language="en", filename=filename, priority=Priority.BATCH,
+    )
+    return time.monotonic() - started, text
+
+
+async def run_benchmark(directory: str, transcribe: bool, limit: int = 0) -> dict:
+    clips = sorted(p for p in Path(directory).iterdir() if p.suffix.lower() in AUDIO_EXTENSIONS)
+    if limit:
+        clips = clips[:limit]
+
+    rows = []
+    for clip in clips:
+        prepared = await preprocess_file(str(clip), clip.name)
+        row = {
+            "clip": clip.name,
+            "raw_bytes": prepared.input_bytes,
+            "prepared_bytes": len(prepared.data),
+            "processed": prepared.processed,
+            "preprocess_ms": round(prepared.elapsed_sec * 1000, 1),
+        }
+        if transcribe:
+            raw_sec, raw_text = await _transcribe(clip.read_bytes(), clip.name)
+            if prepared.silent:
+                prepared_sec, prepared_text = 0.0, ""
+            else:
+                prepared_sec, prepared_text = await _transcribe(prepared.data, prepared.filename)
+            row.update({
+                "raw_stt_ms": round(raw_sec * 1000, 1),
+                # What a caller waits for: ffmpeg plus the smaller upload.
+                "prepared_stt_ms": round((prepared.elapsed_sec + prepared_sec) * 1000, 1),
+                "transcript_similarity": round(
+                    difflib.SequenceMatcher(None, raw_text.lower().split(), prepared_text.lower().split()).ratio(), 3
+                ),
+            })
+        rows.append(row)
+
+    raw_total = sum(r["raw_bytes"] for r in rows)
+    prepared_total = sum(r["prepared_bytes"] for r in rows)
+    summary = {
+        "clips": len(rows),
+        "raw_bytes": raw_total,
+        "prepared_bytes": prepared_total,
+        "size_ratio": round(prepared_total / raw_total, 4) if raw_total else 0.0,
+        "fallbacks": sum(1 for r in rows if not r["processed"]),
+        "preprocess_p50_ms": _percentile([r["preprocess_ms"] for r in rows], 50),
+    }
+    if transcribe and rows:
+        summary.update({
+            "raw_stt_p50_ms": _percentile([r["raw_stt_ms"] for r in rows], 50),
+            "raw_stt_p95_ms": _percentile([r["raw_stt_ms"] for r in rows], 95),
+            "prepared_stt_p50_ms": _percentile([r["prepared_stt_ms"] for r in rows], 50),
+            "prepared_stt_p95_ms": _percentile([r["prepared_stt_ms"] for r in rows], 95),
+            "min_transcript_similarity": min(r["transcript_similarity"] for r in rows),
+        })
+    return {"summary": summary, "clips": rows}
+
+
+def _print_report(report: dict):
+    header = f"{'clip':<32}{'raw KB':>10}{'prep KB':>10}{'ffmpeg ms':>11}{'raw STT ms':>12}{'prep STT ms':>13}{'sim':>7}"
+    print(header)
+    print("-" * len(header))
+    for row in report["clips"]:
+        print(
+            f"{row['clip'][:31]:<32}{row['raw_bytes'] / 1024:>10.1f}{row['prepared_bytes'] / 1024:>10.1f}"
+            f"{row['preprocess_ms']:>11.1f}{row.get('raw_stt_ms', 0):>12.1f}{row.get('prepared_stt_ms', 0):>13.1f}"
+            f"{row.get('transcript_similarity', 0):>7.2f}"
+        )
+    print()
+    for key, value in report["summary"].items():
+        print(f"{key:<28}{value}")
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Benchmark audio preprocessing before Whisper.")
+    parser.add_argument("directory", help="Directory of sample clips")
+    parser.add_argument("--transcribe", action="store_true", help="Also compare Whisper latency (billed)")
+    parser.add_argument("--limit", type=int, default=0, help="Only the first N clips")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        parser.error(f"Not a directory: {args.directory}")
+    report = asyncio.run(run_benchmark(args.directory, args.transcribe, args.limit))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,113 @@
+"""Split long interview recordings into chunks Whisper can take.
+
+Chunk boundaries are placed in pauses found by ffmpeg's ``silencedetect``:
+each chunk ends at the last pause in the second half of its
+``RECORDING_CHUNK_SEC`` window, or exactly at the window's end if the
+speaker never pauses. Chunks are extracted with ``RECORDING_CHUNK_OVERLAP_SEC``
+of extra audio on each side, so a word cut at a boundary is heard whole by
+one of the two chunks; ``remove_overlap`` drops the words heard twice.
+"""
+import asyncio
+import re
+from typing import Optional
+
+from app.core.config import settings
+
+_SILENCE_START = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END = re.compile(r"silence_end:\s*([\d.]+)")
+_WORD = re.compile(r"[\w']+")
+
+# Longest run of repeated words looked for between neighbouring chunks.
+_MAX_OVERLAP_WORDS = 20
+
+
+async def _run(args: list[str], timeout: float) -> tuple[bytes, bytes]:
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode != 0:
+        raise RuntimeError(f"{args[0]} failed: {err.decode('utf-8', errors='replace').strip()[-300:]}")
+    return out, err
+
+
+async def probe_duration(path: str) -> float:
+    out, _ = await _run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+        timeout=60,
+    )
+    return float(out.decode().strip())
+
+
+async def detect_silences(path: str) -> list[tuple[float, float]]:
+    """(start, end) of every pause of at least half a second."""
+    _, err = await _run(
+        [
+            "ffmpeg", "-hide_banner", "-nostdin", "-i", path, "-vn",
+            "-af", f"silencedetect=noise={settings.RECORDING_SILENCE_DB}dB:d=0.5",
+            "-f", "null", "-",
+        ],
+        timeout=600,
+    )
+    silences = []
+    start: Optional[float] = None
+    for line in err.decode("utf-8", errors="replace").splitlines():
+        if match := _SILENCE_START.search(line):
+            start = max(0.0, float(match.group(1)))
+        elif (match := _SILENCE_END.search(line)) and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+    return silences
+
+
+def plan_chunks(duration: float, silences: list[tuple[float, float]], max_chunk_sec: float) -> list[tuple[float, float]]:
+    """Cut ``[0, duration]`` into spans of at most ``max_chunk_sec``, preferring pauses."""
+    pauses = [(start + end) / 2 for start, end in silences]
+    cuts = [0.0]
+    while duration - cuts[-1] > max_chunk_sec:
+        low, high = cuts[-1] + max_chunk_sec / 2, cuts[-1] + max_chunk_sec
+        in_window = [p for p in pauses if low <= p <= high]
+        cuts.append(max(in_window) if in_window else high)
+    cuts.append(duration)
+    return list(zip(cuts, cuts[1:]))
+
+
+async def extract_chunk(path: str, start_sec: float, end_sec: float) -> bytes:
+    """The span plus overlap, as 16 kHz mono Opus."""
+    start = max(0.0, start_sec - settings.RECORDING_CHUNK_OVERLAP_SEC)
+    end = end_sec + settings.RECORDING_CHUNK_OVERLAP_SEC
+    out, _ = await _run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin",
+            "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}", "-i", path,
+            "-vn", "-ac", "1", "-ar", "16000",
+            "-c:a", "libopus", "-b:a", settings.AUDIO_PREPROCESS_BITRATE, "-application", "voip",
+            "-f", "ogg", "pipe:1",
+        ],
+        timeout=settings.AUDIO_PREPROCESS_TIMEOUT_SEC,
+    )
+    return out
+
+
+def _normalize(word: str) -> str:
+    match = _WORD.search(word.lower())
+    return match.group(0) if match else ""
+
+
+def remove_overlap(previous: str, text: str) -> str:
+    """Drop the words at the start of ``text`` that repeat the end of ``previous``."""
+    prev_words = [_normalize(w) for w in previous.split()[-_MAX_OVERLAP_WORDS:]]
+    words = text.split()
+    head = [_normalize(w) for w in words[:_MAX_OVERLAP_WORDS]]
+    # A single shared word is as likely chance as overlap, so at least two must match.
+    for size in range(min(len(prev_words), len(head)), 1, -1):
+        if prev_words[-size:] == head[:size]:
+            return " ".join(words[size:])
+    return text
@@ -0,0 +1,144 @@
+"""Sentence-level streaming TTS for voice interview replies.
+
+The reply is streamed from the LLM; ``SentenceSplitter`` cuts the tokens
+into sentences as they complete and ``SentenceSynthesizer`` starts TTS for
+each one immediately, at most ``VOICE_TTS_PARALLELISM`` at a time. Audio is
+sent strictly in sentence order, each chunk as soon as it and every earlier
+chunk are ready, so the candidate hears the first sentence while the rest
+of the reply is still being written and synthesized.
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from app.ai.usage import AICallTag
+from app.ai.voice.tts_handler import text_to_speech_bytes
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# End of a sentence: terminal punctuation, optional closing quote/bracket, then whitespace.
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+")
+
+
+class SentenceSplitter:
+    def __init__(self, min_chars: Optional[int] = None):
+        # Shorter sentences ("Great.") are merged into the next one.
+        self.min_chars = settings.VOICE_TTS_MIN_SENTENCE_CHARS if min_chars is None else min_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Add streamed text; return the sentences it completed."""
+        self._buffer += text
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END.finditer(self._buffer):
+            if match.end() - start < self.min_chars:
+                continue
+            sentences.append(self._buffer[start:match.end()].strip())
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        rest, self._buffer = self._buffer.strip(), ""
+        return rest or None
+
+
+class _Totals:
+    def __init__(self):
+        self.turns = 0
+        self.sentences = 0
+        self.prerendered = 0
+        self.failed = 0
+        # Seconds from the transcript being ready to the first reply audio sent.
+        self.first_audio_sec: deque[float] = deque(maxlen=500)
+
+    def stats(self) -> dict:
+        values = sorted(self.first_audio_sec)
+
+        def pct(p: float) -> float:
+            return round(values[min(len(values) - 1, int(p * (len(values) - 1)))] * 1000, 1) if values else 0.0
+
+        return {
+            "turns": self.turns,
+            "sentences": self.sentences,
+            "prerendered": self.prerendered,
+            "failed": self.failed,
+            "time_to_first_audio_p50_ms": pct(0.5),
+            "time_to_first_audio_p95_ms": pct(0.95),
+        }
+
+
+tts_totals = _Totals()
+
+
+class SentenceSynthesizer:
+    """Synthesizes one reply's sentences concurrently and sends the audio in order."""
+
+    def __init__(
+        self,
+        send_json: Callable[[dict], Awaitable],
+        send_bytes: Callable[[bytes], Awaitable],
+        voice: str = "alloy",
+        tag: Optional[AICallTag] = None,
+    ):
+        self.send_json = send_json
+        self.send_bytes = send_bytes
+        self.voice = voice
+        self.tag = tag
+        self.started = time.monotonic()
+        self.first_audio_sec: Optional[float] = None
+        self.chunks = 0
+        self._semaphore = asyncio.Semaphore(settings.VOICE_TTS_PARALLELISM)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._sender = asyncio.get_running_loop().create_task(self._send_in_order())
+
+    async def _synthesize(self, text: str) -> bytes:
+        async with self._semaphore:
+            return await text_to_speech_bytes(text, voice=self.voice, tag=self.tag)
+
+    def add(self, text: str, audio: Optional[Awaitable[bytes]] = None):
+        """Queue a sentence; ``audio`` supplies already-rendered bytes instead of TTS."""
+        if audio is None:
+            audio = self._synthesize(text)
+            tts_totals.sentences += 1
+        else:
+            tts_totals.prerendered += 1
+        self._queue.put_nowait((text, asyncio.get_running_loop().create_task(audio)))
+
+    async def _send_in_order(self):
+        index = 0
+        while (item := await self._queue.get()) is not None:
+            text, task = item
+            try:
+                audio = await task
+            except Exception as e:
+                tts_totals.failed += 1
+                logger.warning(f"Sentence TTS failed: {e}")
+                continue
+            await self.send_json({"type": "audio_chunk", "index": index, "content": text})
+            await self.send_bytes(audio)
+            if self.first_audio_sec is None:
+                self.first_audio_sec = time.monotonic() - self.started
+                tts_totals.first_audio_sec.append(self.first_audio_sec)
+            index += 1
+        self.chunks = index
+
+    async def finish(self) -> int:
+        """Wait until every queued sentence has been sent; returns the number of audio chunks."""
+        self._queue.put_nowait(None)
+        await self._sender
+        tts_totals.turns += 1
+        return self.chunks
+
+    def close(self):
+        """Abandon the reply (socket gone): stop sending and cancel pending TTS."""
+        self._sender.cancel()
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                item[1].cancel()
@@ -0,0 +1,190 @@
+"""Streaming speech-to-text for the voice WebSocket.
+
+Audio arrives as small PCM frames while the candidate speaks.
+``UtteranceSegmenter`` closes a segment at each short pause, and the
+segment is transcribed in the background straight away, so by the time the
+answer ends only its last segment is still in flight. Each transcribed
+segment is pushed to the client as a ``partial_transcript`` in order.
+
+The STT backend is selected by ``VOICE_STT_BACKEND``: ``whisper`` goes
+through ``ai_client`` (rate governing, retries, usage accounting), ``stub``
+returns canned transcripts locally for offline load tests.
+"""
+import asyncio
+import io
+import logging
+import time
+import wave
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from app.ai.usage import AICallTag
+from app.ai.voice.vad import UtteranceSegmenter
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        out.writeframes(pcm)
+    return buf.getvalue()
+
+
+class STTBackend(ABC):
+    name: str = ""
+
+    @abstractmethod
+    async def transcribe(
+        self,
+        pcm: bytes,
+        sample_rate: int,
+        language: str = "en",
+        tag: Optional[AICallTag] = None,
+    ) -> str:
+        """Transcribe one segment of 16-bit mono PCM."""
+
+
+class WhisperSTTBackend(STTBackend):
+    name = "whisper"
+
+    async def transcribe(self, pcm, sample_rate, language="en", tag=None) -> str:
+        from app.ai.voice.whisper_stt import transcribe_audio_bytes
+
+        return await transcribe_audio_bytes(
+            pcm_to_wav(pcm, sample_rate), language=language, filename="segment.wav", tag=tag,
+            # Segments are already 16 kHz mono with the silence cut off by VAD.
+            preprocess=False,
+        )
+
+
+class StubSTTBackend(STTBackend):
+    name = "stub"
+
+    def __init__(self):
+        from app.ai.providers.stub_provider import StubProvider
+
+        self._provider = StubProvider()
+
+    async def transcribe(self, pcm, sample_rate, language="en", tag=None) -> str:
+        return await self._provider.transcribe(
+            model="stub", audio_file=("segment.wav", pcm), language=language,
+        )
+
+
+def build_stt_backend(name: str = None) -> STTBackend:
+    name = name or settings.VOICE_STT_BACKEND
+    if name == "whisper":
+        return WhisperSTTBackend()
+    if name == "stub":
+        return StubSTTBackend()
+    raise ValueError(f"Unknown STT backend: {name}")
+
+
+class _Totals:
+    def __init__(self):
+        self.turns = 0
+        self.segments = 0
+        self.failed = 0
+        self.audio_sec = 0.0
+        # Seconds from the end of an answer to its full transcript.
+        self.tail_sec: deque[float] = deque(maxlen=500)
+
+    def stats(self) -> dict:
+        tail = sorted(self.tail_sec)
+
+        def pct(p: float) -> float:
+            return round(tail[min(len(tail) - 1, int(p * (len(tail) - 1)))] * 1000, 1) if tail else 0.0
+
+        return {
+            "backend": settings.VOICE_STT_BACKEND,
+            "turns": self.turns,
+            "segments": self.segments,
+            "failed_segments": self.failed,
+            "audio_sec": round(self.audio_sec, 1),
+            "end_of_speech_to_transcript_p50_ms": pct(0.5),
+            "end_of_speech_to_transcript_p95_ms": pct(0.95),
+        }
+
+
+stt_totals = _Totals()
+
+
+class StreamingTranscriber:
+    """Segments one socket's audio and transcribes segments as they close."""
+
+    def __init__(
+        self,
+        backend: STTBackend,
+        sample_rate: int,
+        on_partial: Callable[[dict], Awaitable],
+        language: str = "en",
+        tag: Optional[AICallTag] = None,
+    ):
+        self.backend = backend
+        self.sample_rate = sample_rate
+        self.on_partial = on_partial
+        self.language = language
+        self.tag = tag
+        self.segmenter = UtteranceSegmenter(sample_rate)
+        self._tasks: list[asyncio.Task] = []
+
+    def feed(self, audio: bytes) -> bool:
+        """Add audio; returns True once the candidate has stopped talking."""
+        segments, end_of_turn = self.segmenter.feed(audio)
+        for pcm in segments:
+            self._start(pcm)
+        return end_of_turn
+
+    def _start(self, pcm: bytes):
+        previous = self._tasks[-1] if self._tasks else None
+        index = len(self._tasks)
+        self._tasks.append(asyncio.get_running_loop().create_task(self._transcribe(index, pcm, previous)))
+        stt_totals.segments += 1
+        stt_totals.audio_sec += len(pcm) / (2 * self.sample_rate)
+
+    async def _transcribe(self, index: int, pcm: bytes, previous: Optional[asyncio.Task]) -> str:
+        text = (await self.backend.transcribe(pcm, self.sample_rate, self.language, self.tag)).strip()
+        # Partials go out in segment order even when a later segment finishes first.
+        if previous is not None:
+            await asyncio.wait([previous])
+        if text:
+            try:
+                await self.on_partial({"type": "partial_transcript", "content": text, "segment": index})
+            except Exception:
+                pass
+        return text
+
+    async def finish(self) -> str:
+        """Close the answer and return its full transcript."""
+        tail = self.segmenter.flush()
+        if tail:
+            self._start(tail)
+        ended = time.monotonic()
+        tasks, self._tasks = self._tasks, []
+        texts = []
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                stt_totals.failed += 1
+                logger.warning(f"Segment transcription failed: {result}")
+            elif result:
+                texts.append(result)
+        if tasks:
+            stt_totals.turns += 1
+            stt_totals.tail_sec.append(time.monotonic() - ended)
+        return " ".join(texts)
+
+    def reset(self):
+        """Drop everything heard since the last answer, so it cannot bleed into the next one."""
+        self.close()
+        self.segmenter.flush()
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
@@ -0,0 +1,163 @@
+"""Content-addressed cache for synthesized speech.
+
+Greetings, closings and transition phrases are spoken again and again with
+the same voice, so their audio is kept on disk under ``MEDIA_DIR/tts_cache`` (never served statically) keyed by a
+SHA-256 of (provider, model, voice, text). A Redis index shared by every worker records each entry's size
+and last use; once the total passes ``TTS_CACHE_MAX_BYTES`` the least
+recently used entries are evicted from the index and their files deleted.
+Stores run in the background so a miss returns its audio without waiting
+for the disk write and index update.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Optional
+
+from app.core.config import settings
+from app.core.redis import redis_pool
+
+logger = logging.getLogger(__name__)
+
+LRU_KEY = "tts:cache:lru"
+SIZES_KEY = "tts:cache:sizes"
+TOTAL_KEY = "tts:cache:bytes"
+
+# Index an entry once (a second store of the same audio is a no-op) and mark it used.
+_ADD = """
+if redis.call('HSETNX', KEYS[2], ARGV[1], ARGV[2]) == 1 then
+    redis.call('INCRBY', KEYS[3], ARGV[2])
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+"""
+
+# Drop least recently used entries until the total is under the cap; returns their keys.
+_EVICT = """
+local total = tonumber(redis.call('GET', KEYS[3]) or '0')
+local cap = tonumber(ARGV[1])
+local evicted = {}
+while total > cap do
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0)
+    if #oldest == 0 then
+        break
+    end
+    local size = tonumber(redis.call('HGET', KEYS[2], oldest[1]) or '0')
+    redis.call('ZREM', KEYS[1], oldest[1])
+    redis.call('HDEL', KEYS[2], oldest[1])
+    total = total - size
+    table.insert(evicted, oldest[1])
+end
+redis.call('SET', KEYS[3], math.max(total, 0))
+return evicted
+"""
+
+
+def make_tts_key(text: str, voice: str, model: str) -> str:
+    payload = json.dumps(
+        {"provider": settings.AI_PROVIDER, "model": model, "voice": voice, "text": " ".join(text.split())},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _path(key: str) -> str:
+    return os.path.join(settings.MEDIA_DIR, "tts_cache", key[:2], f"{key}.audio")
+
+
+def _read(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write(path: str, audio: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename, so a concurrent reader never sees a partial file.
+    tmp = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(audio)
+    os.replace(tmp, path)
+
+
+def _remove(paths: list[str]):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class TTSCache:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evicted = 0
+        self.errors = 0
+        # Background stores still running; held so they are not garbage-collected mid-write.
+        self._writes: set[asyncio.Task] = set()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        audio = await asyncio.to_thread(_read, _path(key))
+        if audio is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            await redis_pool.client.zadd(LRU_KEY, {key: time.time()}, xx=True)
+        except Exception:
+            self.errors += 1
+        return audio
+
+    async def set(self, key: str, audio: bytes):
+        try:
+            await asyncio.to_thread(_write, _path(key), audio)
+            redis = redis_pool.client
+            await redis.eval(_ADD, 3, LRU_KEY, SIZES_KEY, TOTAL_KEY, key, len(audio), time.time())
+            evicted = await redis.eval(_EVICT, 3, LRU_KEY, SIZES_KEY, TOTAL_KEY, settings.TTS_CACHE_MAX_BYTES)
+        except Exception:
+            self.errors += 1
+            logger.warning("TTS cache write failed", exc_info=True)
+            return
+        self.stores += 1
+        if evicted:
+            self.evicted += len(evicted)
+            await asyncio.to_thread(_remove, [_path(k) for k in evicted])
+
+    def store_later(self, key: str, audio: bytes):
+        """Store in a background task; failures are counted and logged by ``set``."""
+        task = asyncio.get_running_loop().create_task(self.set(key, audio))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def drain(self):
+        """Wait for the background stores started on this loop (before a worker closes it)."""
+        loop = asyncio.get_running_loop()
+        pending = [t for t in self._writes if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        redis = redis_pool.client
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evicted": self.evicted,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": await redis.zcard(LRU_KEY),
+            "bytes": int(await redis.get(TOTAL_KEY) or 0),
+            "max_bytes": settings.TTS_CACHE_MAX_BYTES,
+        }
+
+
+tts_cache = TTSCache()
@@ -1,23 +1,63 @@
-"""Text-to-Speech handler using OpenAI TTS."""
+"""Text-to-Speech handler using OpenAI TTS.
+
+Callers pass ``cache=True`` for text that is spoken again and again
+(greetings, closings, transitions); its audio is served from ``tts_cache``
+when the same voice and model already rendered it. Free-form reply
+sentences rarely repeat and skip the cache entirely.
+"""
 import os
 import tempfile
+from typing import Optional
 
 from app.ai.openai_client import ai_client
+from app.ai.rate_governor import Priority
+from app.ai.usage import AICallTag, tag_for
+from app.ai.voice.tts_cache import make_tts_key, tts_cache
+from app.core.config import settings
+
+
+async def _synthesize(
+    text: str,
+    voice: str,
+    model: str,
+    priority: Priority,
+    tag: Optional[AICallTag],
+    cache: bool,
+) -> bytes:
+    if not (cache and settings.TTS_CACHE_ENABLED):
+        return await ai_client.text_to_speech(
+            text=text, voice=voice, model=model, priority=priority, tag=tag_for("tts", tag),
+        )
+    key = make_tts_key(text, voice, model)
+    audio_bytes = await tts_cache.get(key)
+    if audio_bytes is None:
+        audio_bytes = await ai_client.text_to_speech(
+            text=text, voice=voice, model=model, priority=priority, tag=tag_for("tts", tag),
+        )
+        tts_cache.store_later(key, audio_bytes)
+    return audio_bytes
 
 
 async def text_to_speech_bytes(
     text: str,
     voice: str = "alloy",
+    tag: Optional[AICallTag] = None,
+    model: str = "tts-1",
+    cache: bool = False,
 ) -> bytes:
-    return await ai_client.text_to_speech(text=text, voice=voice)
+    return await _synthesize(text, voice, model, Priority.INTERACTIVE, tag, cache)
 
 
 async def text_to_speech_file(
     text: str,
     output_path: str,
     voice: str = "alloy",
+    tag: Optional[AICallTag] = None,
+    priority: Priority = Priority.INTERACTIVE,
+    model: str = "tts-1",
+    cache: bool = False,
 ) -> str:
-    audio_bytes = await ai_client.text_to_speech(text=text, voice=voice)
+    audio_bytes = await _synthesize(text, voice, model, priority, tag, cache)
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     with open(output_path, "wb") as f:
         f.write(audio_bytes)
@@ -0,0 +1,105 @@
+"""Energy-based voice activity detection for streamed interview audio.
+
+Input is 16-bit little-endian mono PCM. Audio is cut into fixed frames and
+each frame is voiced when its RMS is above both ``VOICE_VAD_ENERGY_THRESHOLD``
+and a multiple of the running noise floor. ``UtteranceSegmenter`` turns the
+frames into speech segments, closed by a short pause so they can be
+transcribed while the candidate keeps talking, and reports the end of the
+answer after a longer pause.
+"""
+import math
+import sys
+from array import array
+from collections import deque
+from typing import Optional
+
+from app.core.config import settings
+
+# Consecutive voiced frames needed to open a segment; filters out clicks.
+_START_FRAMES = 3
+# Audio kept from before a segment opens, so the first syllable isn't clipped.
+_PREROLL_MS = 300
+# A frame is voiced only when this much louder than the noise floor.
+_NOISE_RATIO = 3.0
+
+
+def frame_rms(frame: bytes) -> float:
+    samples = array("h", frame)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+class UtteranceSegmenter:
+    def __init__(self, sample_rate: int):
+        self.frame_ms = settings.VOICE_VAD_FRAME_MS
+        self.frame_bytes = sample_rate * self.frame_ms // 1000 * 2
+        self.max_segment_bytes = sample_rate * 2 * settings.VOICE_VAD_MAX_SEGMENT_SEC
+        self.noise_floor = 0.0
+        self._carry = b""
+        self._preroll: deque[bytes] = deque(maxlen=max(1, _PREROLL_MS // self.frame_ms))
+        self._segment: Optional[bytearray] = None
+        self._voiced_run = 0
+        self._silence_ms = 0
+        self._quiet_ms = 0
+        self._spoke = False
+
+    def _voiced(self, frame: bytes) -> bool:
+        rms = frame_rms(frame)
+        voiced = rms >= max(settings.VOICE_VAD_ENERGY_THRESHOLD, self.noise_floor * _NOISE_RATIO)
+        if not voiced:
+            self.noise_floor = rms if self.noise_floor == 0 else 0.95 * self.noise_floor + 0.05 * rms
+        return voiced
+
+    def feed(self, audio: bytes) -> tuple[list[bytes], bool]:
+        """Add audio; return the segments it closed and whether the answer has ended."""
+        data = self._carry + audio
+        usable = len(data) - len(data) % self.frame_bytes
+        self._carry = data[usable:]
+        segments: list[bytes] = []
+        end_of_turn = False
+
+        for start in range(0, usable, self.frame_bytes):
+            frame = data[start:start + self.frame_bytes]
+            voiced = self._voiced(frame)
+
+            if self._segment is None:
+                self._voiced_run = self._voiced_run + 1 if voiced else 0
+                self._preroll.append(frame)
+                if self._voiced_run >= _START_FRAMES:
+                    self._segment = bytearray(b"".join(self._preroll))
+                    self._preroll.clear()
+                    self._silence_ms = 0
+                    self._spoke = True
+                elif self._spoke:
+                    self._quiet_ms += self.frame_ms
+                    if self._quiet_ms >= settings.VOICE_VAD_END_OF_TURN_MS:
+                        end_of_turn = True
+                        self._spoke = False
+                        self._quiet_ms = 0
+                continue
+
+            self._segment += frame
+            self._silence_ms = 0 if voiced else self._silence_ms + self.frame_ms
+            if self._silence_ms >= settings.VOICE_VAD_SEGMENT_SILENCE_MS or len(self._segment) >= self.max_segment_bytes:
+                segments.append(bytes(self._segment))
+                self._segment = None
+                self._voiced_run = 0
+                # The pause that closed the segment counts towards the end of the answer.
+                self._quiet_ms = self._silence_ms
+
+        return segments, end_of_turn
+
+    def flush(self) -> Optional[bytes]:
+        """Close any open segment and reset for the next answer."""
+        segment = bytes(self._segment) if self._segment else None
+        self._carry = b""
+        self._preroll.clear()
+        self._segment = None
+        self._voiced_run = 0
+        self._silence_ms = 0
+        self._quiet_ms = 0
+        self._spoke = False
+        return segment
@@ -1,31 +1,57 @@
-"""Whisper Speech-to-Text handler."""
-import tempfile
+"""Whisper Speech-to-Text handler.
+
+Recorded audio is normalized and compressed (``audio_preprocess``) before
+upload unless ``AUDIO_PREPROCESS_ENABLED`` is off or the caller already
+sends compact 16 kHz mono audio.
+"""
 import os
+from typing import Optional
 
 from app.ai.openai_client import ai_client
+from app.ai.rate_governor import Priority
+from app.ai.usage import AICallTag, tag_for
+from app.ai.voice.audio_preprocess import PreparedAudio, preprocess_bytes, preprocess_file
+from app.core.config import settings
+
+
+async def _transcribe_prepared(prepared: PreparedAudio, language: str, tag: Optional[AICallTag]) -> str:
+    if prepared.silent:
+        # Nothing left after trimming silence; Whisper would only hallucinate.
+        return ""
+    return await ai_client.transcribe_audio(
+        audio_bytes=prepared.data,
+        language=language,
+        filename=prepared.filename,
+        priority=Priority.INTERACTIVE,
+        tag=tag_for("stt", tag),
+    )
 
 
 async def transcribe_audio_bytes(
     audio_bytes: bytes,
     language: str = "en",
     filename: str = "audio.webm",
+    tag: Optional[AICallTag] = None,
+    preprocess: bool = True,
 ) -> str:
-    return await ai_client.transcribe_audio(
-        audio_bytes=audio_bytes,
-        language=language,
-        filename=filename,
-    )
+    if preprocess and settings.AUDIO_PREPROCESS_ENABLED:
+        prepared = await preprocess_bytes(audio_bytes, filename)
+    else:
+        prepared = PreparedAudio(audio_bytes, filename, len(audio_bytes), processed=False)
+    return await _transcribe_prepared(prepared, language, tag)
 
 
 async def transcribe_audio_file(
     file_path: str,
     language: str = "en",
+    tag: Optional[AICallTag] = None,
+    filename: Optional[str] = None,
 ) -> str:
-    with open(file_path, "rb") as f:
-        audio_bytes = f.read()
-    filename = os.path.basename(file_path)
-    return await ai_client.transcribe_audio(
-        audio_bytes=audio_bytes,
-        language=language,
-        filename=filename,
-    )
+    filename = filename or os.path.basename(file_path)
+    if settings.AUDIO_PREPROCESS_ENABLED:
+        prepared = await preprocess_file(file_path, filename)
+    else:
+        with open(file_path, "rb") as f:
+            audio_bytes = f.read()
+        prepared = PreparedAudio(audio_bytes, filename, len(audio_bytes), processed=False)
+    return await _transcribe_prepared(prepared, language, tag)
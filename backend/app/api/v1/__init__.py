@@ -18,6 +18,8 @@ from app.api.v1.notifications import router as notifications_router
 from app.api.v1.users import router as users_router
 from app.api.v1.offer_letters import router as offer_letters_router
 from app.api.v1.contact import router as contact_router
+from app.api.v1.metrics import router as metrics_router
+from app.api.v1.ai_usage import router as ai_usage_router
 
 router = APIRouter()
 
@@ -39,3 +41,5 @@ router.include_router(notifications_router, prefix="/notifications", tags=["Noti
 router.include_router(users_router, prefix="/users", tags=["Users"])
 router.include_router(offer_letters_router, prefix="/offer-letters", tags=["Offer Letters"])
 router.include_router(contact_router, prefix="/contact", tags=["Contact"])
+router.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
+router.include_router(ai_usage_router, prefix="/ai-usage", tags=["AI Usage"])
@@ -0,0 +1,39 @@
+"""AI usage and cost reporting endpoints."""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_db, require_role
+from app.models.user import User
+from app.services.ai_usage_service import AIUsageService
+
+router = APIRouter()
+
+
+@router.get("/summary")
+async def get_usage_summary(
+    days: int = Query(30, ge=1, le=365),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role("super_admin", "hr_manager")),
+):
+    service = AIUsageService(db)
+    return await service.get_summary(days=days)
+
+
+@router.get("/jobs/{job_id}")
+async def get_job_usage(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role("super_admin", "hr_manager")),
+):
+    service = AIUsageService(db)
+    return await service.get_job_usage(job_id)
+
+
+@router.get("/interviews/{interview_id}")
+async def get_interview_usage(
+    interview_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_role("super_admin", "hr_manager")),
+):
+    service = AIUsageService(db)
+    return await service.get_interview_usage(interview_id)
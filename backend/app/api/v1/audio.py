@@ -1,10 +1,13 @@
 """Audio processing endpoints (Whisper transcription)."""
 import logging
+import os
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 
+from app.core.config import settings
 from app.core.dependencies import get_current_user
 from app.models.user import User
+from app.utils.file_handler import spool_upload
 
 logger = logging.getLogger(__name__)
 
@@ -17,21 +20,28 @@ async def transcribe_audio(
     current_user: User = Depends(get_current_user),
 ):
     """Transcribe an audio file using OpenAI Whisper."""
-    audio_bytes = await file.read()
-    logger.info(f"Transcribe: received {len(audio_bytes)} bytes, filename={file.filename}, content_type={file.content_type}")
-
-    if not audio_bytes or len(audio_bytes) < 100:
-        raise HTTPException(status_code=400, detail=f"Audio file too small ({len(audio_bytes)} bytes)")
+    try:
+        path, size = await spool_upload(file, settings.AUDIO_UPLOAD_MAX_MB, default_ext=".webm")
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    logger.info(f"Transcribe: received {size} bytes, filename={file.filename}, content_type={file.content_type}")
 
     try:
-        from app.ai.voice.whisper_stt import transcribe_audio_bytes
-        text = await transcribe_audio_bytes(
-            audio_bytes=audio_bytes,
+        if size < 100:
+            raise HTTPException(status_code=400, detail=f"Audio file too small ({size} bytes)")
+
+        from app.ai.voice.whisper_stt import transcribe_audio_file
+        text = await transcribe_audio_file(
+            path,
             language="en",
             filename=file.filename or "audio.webm",
         )
         logger.info(f"Transcribe: result = {text[:100]!r}")
         return {"text": text}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Transcribe failed: {type(e).__name__}: {e}")
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+    finally:
+        os.remove(path)
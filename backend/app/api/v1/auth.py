@@ -7,8 +7,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.config import settings
-from app.core.dependencies import get_db, get_current_user
+from app.core.dependencies import get_db, get_current_user, get_redis
 from app.core.security import create_access_token, create_refresh_token
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserLogin, UserUpdate, UserResponse, TokenResponse, TokenRefresh, ForgotPasswordRequest, ResetPasswordRequest
@@ -52,48 +51,56 @@ class TokenLoginRequest(BaseModel):
 
 
 @router.post("/token-login", response_model=TokenResponse)
-async def token_login(data: TokenLoginRequest, db: AsyncSession = Depends(get_db)):
+async def token_login(
+    data: TokenLoginRequest,
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
+):
     """Auto-login using a magic token sent via email."""
-    r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-    try:
-        key = f"magic_login:{data.token}"
-        user_id = await r.get(key)
-        logger.info(f"Token-login attempt: key={key}, user_id={user_id}")
-
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid or expired login link")
-
-        result = await db.execute(select(User).where(User.id == int(user_id)))
-        user = result.scalar_one_or_none()
-        if not user or not user.is_active:
-            raise HTTPException(status_code=401, detail="User not found or disabled")
-
-        access_token = create_access_token({"sub": str(user.id)})
-        refresh_token = create_refresh_token({"sub": str(user.id)})
-
-        logger.info(f"Token-login success for user {user.email} (id={user.id})")
-        return {
-            "access_token": access_token,
-            "refresh_token": refresh_token,
-            "token_type": "bearer",
-            "user": user,
-        }
-    finally:
-        await r.aclose()
+    key = f"magic_login:{data.token}"
+    user_id = await redis.get(key)
+    logger.info(f"Token-login attempt: key={key}, user_id={user_id}")
+
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid or expired login link")
+
+    result = await db.execute(select(User).where(User.id == int(user_id)))
+    user = result.scalar_one_or_none()
+    if not user or not user.is_active:
+        raise HTTPException(status_code=401, detail="User not found or disabled")
+
+    access_token = create_access_token({"sub": str(user.id)})
+    refresh_token = create_refresh_token({"sub": str(user.id)})
+
+    logger.info(f"Token-login success for user {user.email} (id={user.id})")
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+        "user": user,
+    }
 
 
 @router.post("/forgot-password")
-async def forgot_password(data: ForgotPasswordRequest, db: AsyncSession = Depends(get_db)):
+async def forgot_password(
+    data: ForgotPasswordRequest,
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
+):
     """Send a password reset email if the account exists."""
-    service = AuthService(db)
+    service = AuthService(db, redis)
     await service.forgot_password(data.email)
     return {"message": "If an account exists, a reset email has been sent"}
 
 
 @router.post("/reset-password")
-async def reset_password(data: ResetPasswordRequest, db: AsyncSession = Depends(get_db)):
+async def reset_password(
+    data: ResetPasswordRequest,
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
+):
     """Reset password using a valid token."""
-    service = AuthService(db)
+    service = AuthService(db, redis)
     await service.reset_password(data.token, data.new_password)
     return {"message": "Password reset successfully"}
 
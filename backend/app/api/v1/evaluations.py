@@ -1,15 +1,20 @@
 """Evaluation API endpoints."""
+import json
+import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import async_session
 from app.core.dependencies import get_db, require_role
 from app.models.user import User
 from app.schemas.evaluation import EvaluationTrigger, EvaluationResponse, HRDecisionUpdate
 from app.services.evaluation_service import EvaluationService
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.post("/", response_model=EvaluationResponse)
@@ -22,6 +27,33 @@ async def evaluate_interview(
     return await service.evaluate_interview(data.interview_id)
 
 
+@router.post("/stream")
+async def stream_evaluate_interview(
+    data: EvaluationTrigger,
+    current_user: User = Depends(require_role("super_admin", "hr_manager", "placement_officer")),
+):
+    """Evaluate an interview, streaming strengths/weaknesses as NDJSON while they are generated."""
+
+    async def events():
+        # Request-scoped sessions close before a streamed body is sent.
+        async with async_session() as session:
+            service = EvaluationService(session)
+            try:
+                async for event in service.stream_evaluate_interview(data.interview_id):
+                    if event["type"] == "done":
+                        await session.commit()
+                    yield json.dumps(event) + "\n"
+            except HTTPException as e:
+                await session.rollback()
+                yield json.dumps({"type": "error", "detail": e.detail}) + "\n"
+            except Exception:
+                await session.rollback()
+                logger.exception(f"Streamed evaluation failed for interview {data.interview_id}")
+                yield json.dumps({"type": "error", "detail": "Evaluation failed"}) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @router.get("/{evaluation_id}", response_model=EvaluationResponse)
 async def get_evaluation(
     evaluation_id: int,
@@ -1,12 +1,16 @@
 """Interview REST API endpoints."""
-from typing import Optional
+import logging
+import os
+from typing import Literal, Optional
 
+import redis.asyncio as aioredis
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func
 from sqlmodel import select
 
-from app.core.dependencies import get_db, get_current_user, require_role
+from app.core.dependencies import get_db, get_current_user, get_redis, require_role
 from app.models.user import User
 from app.models.candidate import Candidate
 from app.models.interview import Interview, InterviewStatus
@@ -15,11 +19,32 @@ from app.schemas.interview import (
     InterviewListResponse, InterviewDetailResponse, ChatMessage, ChatResponse,
 )
 from app.services.interview_conductor_service import InterviewConductorService
+from app.services.recording_transcription_service import RecordingTranscriptionService
+from app.services.ws_connection_manager import ws_manager
 from app.utils.file_handler import save_upload
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+async def _get_accessible_interview(interview_id: int, db: AsyncSession, current_user: User) -> Interview:
+    """The interview, if staff or the interview's own candidate is asking."""
+    result = await db.execute(select(Interview).where(Interview.id == interview_id))
+    interview = result.scalar_one_or_none()
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    if current_user.role == "candidate":
+        result = await db.execute(
+            select(Candidate.id).where(
+                (Candidate.user_id == current_user.id) | (Candidate.email == current_user.email)
+            )
+        )
+        if interview.candidate_id not in result.scalars().all():
+            raise HTTPException(status_code=403, detail="Access denied")
+    return interview
+
+
 @router.get("/", response_model=InterviewListResponse)
 async def list_interviews(
     status: Optional[InterviewStatus] = Query(None),
@@ -75,10 +100,11 @@ async def get_interview(interview_id: int, db: AsyncSession = Depends(get_db)):
 async def create_interview(
     data: InterviewCreate,
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user: User = Depends(require_role("super_admin", "hr_manager", "placement_officer")),
 ):
-    service = InterviewConductorService(db)
-    return await service.create_interview(
+    service = InterviewConductorService(db, redis)
+    interview = await service.create_interview(
         candidate_id=data.candidate_id,
         job_id=data.job_id,
         interview_type=data.interview_type.value,
@@ -87,15 +113,20 @@ async def create_interview(
         language=data.language,
         created_by=current_user.id,
     )
+    # The pre-render worker reads the interview row, so it must be committed first.
+    await db.commit()
+    service.schedule_prerender(interview)
+    return interview
 
 
 @router.post("/{interview_id}/start")
 async def start_interview(
     interview_id: int,
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
-    service = InterviewConductorService(db)
+    service = InterviewConductorService(db, redis)
     return await service.start_interview(interview_id)
 
 
@@ -104,13 +135,15 @@ async def send_message(
     interview_id: int,
     data: ChatMessage,
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
-    service = InterviewConductorService(db)
+    service = InterviewConductorService(db, redis)
     return await service.process_message(
         interview_id=interview_id,
         candidate_message=data.content,
         answer_mode=data.message_type,
+        idempotency_key=data.idempotency_key,
     )
 
 
@@ -118,13 +151,31 @@ async def send_message(
 async def end_interview(
     interview_id: int,
     db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user: User = Depends(get_current_user),
 ):
-    service = InterviewConductorService(db)
+    service = InterviewConductorService(db, redis)
     interview = await service.end_interview(interview_id)
+    # The candidate's socket may be held by any worker.
+    await ws_manager.end(interview_id, reason="Ended by interviewer")
     return {"message": "Interview ended", "interview_id": interview_id}
 
 
+@router.get("/{interview_id}/audio/{kind}")
+async def get_interview_audio(
+    interview_id: int,
+    kind: Literal["greeting", "closing"],
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Pre-rendered greeting or closing audio."""
+    interview = await _get_accessible_interview(interview_id, db, current_user)
+    path = interview.greeting_audio_path if kind == "greeting" else interview.closing_audio_path
+    if not path or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Audio not available")
+    return FileResponse(path, media_type="audio/mpeg")
+
+
 @router.post("/{interview_id}/recording")
 async def upload_recording(
     interview_id: int,
@@ -143,4 +194,21 @@ async def upload_recording(
     await db.commit()
     await db.refresh(interview)
 
+    from app.tasks.interview_tasks import transcribe_recording_task
+    try:
+        transcribe_recording_task.delay(interview_id, file_path)
+    except Exception:
+        logger.warning(f"Failed to dispatch recording transcription for interview {interview_id}", exc_info=True)
+
     return {"recording_url": interview.recording_url, "interview_id": interview_id}
+
+
+@router.get("/{interview_id}/recording/transcript")
+async def get_recording_transcript(
+    interview_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    await _get_accessible_interview(interview_id, db, current_user)
+    service = RecordingTranscriptionService(db)
+    return await service.get_transcript(interview_id)
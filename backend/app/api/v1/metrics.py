@@ -0,0 +1,147 @@
+"""Operational metrics endpoints for AI and realtime infrastructure."""
+from fastapi import APIRouter, Depends
+
+from app.ai.openai_client import ai_client
+from app.ai.usage_ledger import usage_ledger
+from app.ai.voice.audio_preprocess import preprocess_totals
+from app.ai.voice.sentence_tts import tts_totals
+from app.ai.voice.streaming_stt import stt_totals
+from app.ai.voice.tts_cache import tts_cache
+from app.core.database import pool_stats
+from app.core.dependencies import require_role
+from app.core.redis import redis_pool
+from app.models.user import User
+from app.services.transcript_journal import transcript_journal
+from app.services.turn_guard import turn_guard
+from app.services.turn_prefetcher import turn_prefetcher
+from app.services.ws_auth_cache import ws_auth_cache
+from app.services.ws_connection_manager import ws_manager
+from app.services.ws_frames import frame_totals
+
+router = APIRouter()
+
+
+@router.get("/ai-cache")
+async def get_ai_cache_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return ai_client.cache.stats()
+
+
+@router.get("/ai-governor")
+async def get_ai_governor_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return ai_client.governor.stats()
+
+
+@router.get("/ai-latency")
+async def get_ai_latency_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return ai_client.policy.stats()
+
+
+@router.get("/ai-routing")
+async def get_ai_routing_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return ai_client.router.stats()
+
+
+@router.get("/ai-prompt-cache")
+async def get_ai_prompt_cache_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return ai_client.prompt_cache_stats.stats()
+
+
+@router.get("/ai-http-pool")
+async def get_ai_http_pool_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return ai_client.provider.stats()
+
+
+@router.get("/ai-usage-ledger")
+async def get_ai_usage_ledger_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return usage_ledger.stats()
+
+
+@router.get("/redis-pool")
+async def get_redis_pool_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return await redis_pool.health()
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return {**pool_stats(), "ws_auth_cache": ws_auth_cache.stats()}
+
+
+@router.get("/interview-journal")
+async def get_interview_journal_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return transcript_journal.stats()
+
+
+@router.get("/interview-prefetch")
+async def get_interview_prefetch_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return turn_prefetcher.stats()
+
+
+@router.get("/interview-turns")
+async def get_interview_turn_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return turn_guard.stats()
+
+
+@router.get("/ws-connections")
+async def get_ws_connection_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return await ws_manager.cluster_stats()
+
+
+@router.get("/ws-frames")
+async def get_ws_frame_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return frame_totals.stats()
+
+
+@router.get("/voice-stt")
+async def get_voice_stt_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return stt_totals.stats()
+
+
+@router.get("/voice-tts")
+async def get_voice_tts_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return tts_totals.stats()
+
+
+@router.get("/tts-cache")
+async def get_tts_cache_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return await tts_cache.stats()
+
+
+@router.get("/audio-preprocess")
+async def get_audio_preprocess_stats(
+    current_user: User = Depends(require_role("super_admin")),
+):
+    return preprocess_totals.stats()
@@ -1,15 +1,20 @@
 """Question generation API endpoints."""
+import json
+import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import async_session
 from app.core.dependencies import get_db, require_role
 from app.models.user import User
 from app.services.question_generator_service import QuestionGeneratorService
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class GenerateForJobRequest(BaseModel):
@@ -36,6 +41,32 @@ async def generate_for_job(
     return {"questions": questions, "count": len(questions)}
 
 
+@router.post("/generate/job/stream")
+async def stream_generate_for_job(
+    data: GenerateForJobRequest,
+    current_user: User = Depends(require_role("super_admin", "hr_manager", "interviewer", "placement_officer")),
+):
+    """Generate questions for a job, streaming each one as NDJSON as soon as it is complete."""
+
+    async def events():
+        # Request-scoped sessions close before a streamed body is sent.
+        async with async_session() as session:
+            service = QuestionGeneratorService(session)
+            count = 0
+            try:
+                async for question in service.stream_for_job(data.job_id, data.num_questions):
+                    count += 1
+                    yield json.dumps({"type": "question", "value": question}) + "\n"
+                yield json.dumps({"type": "done", "count": count}) + "\n"
+            except HTTPException as e:
+                yield json.dumps({"type": "error", "detail": e.detail}) + "\n"
+            except Exception:
+                logger.exception(f"Streamed question generation failed for job {data.job_id}")
+                yield json.dumps({"type": "error", "detail": "Question generation failed"}) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @router.post("/generate/domain")
 async def generate_for_domain(
     data: GenerateForDomainRequest,
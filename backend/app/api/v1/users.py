@@ -65,7 +65,11 @@ async def update_user(
     if data.role == UserRole.SUPER_ADMIN:
         raise HTTPException(status_code=403, detail="Cannot assign Super Admin role")
     service = UserService(db)
-    return await service.update(user_id, data)
+    user = await service.update(user_id, data)
+    if "is_active" in data.model_dump(exclude_unset=True):
+        await db.commit()
+        await service.forget_ws_grants(user.id)
+    return user
 
 
 @router.patch("/{user_id}/status", response_model=UserResponse)
@@ -76,4 +80,7 @@ async def update_user_status(
     current_user: User = Depends(require_role("super_admin", "hr_manager", "placement_officer")),
 ):
     service = UserService(db)
-    return await service.update_status(user_id, data.is_active)
+    user = await service.update_status(user_id, data.is_active)
+    await db.commit()
+    await service.forget_ws_grants(user.id)
+    return user
@@ -1,31 +1,118 @@
 """WebSocket endpoints for real-time interview chat and voice."""
+import asyncio
 import json
 import logging
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+import redis.asyncio as aioredis
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Query
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.database import get_session
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.dependencies import get_redis
 from app.core.security import decode_token
 from app.models.user import User
 from app.models.interview import Interview
 from app.models.candidate import Candidate
 from app.services.interview_conductor_service import InterviewConductorService
+from app.services.ws_auth_cache import ws_auth_cache
 from app.services.ws_connection_manager import ws_manager
+from app.services.stream_replay import ReplayBuffer
+from app.services.ws_frames import FrameChannel, negotiate_protocol
+from app.ai.voice.sentence_tts import SentenceSplitter, SentenceSynthesizer
+from app.ai.voice.streaming_stt import StreamingTranscriber, build_stt_backend
 from app.ai.voice.whisper_stt import transcribe_audio_bytes
-from app.ai.voice.tts_handler import text_to_speech_bytes
+from app.ai.usage import AICallTag
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-async def _get_db_session() -> AsyncSession:
-    """Get a fresh database session."""
-    async for session in get_session():
-        return session
+class _SocketSessions:
+    """One scoped DB session per turn of a socket, counting the pool checkouts they make."""
+
+    def __init__(self):
+        self.sessions = 0
+        self.checkouts = 0
+
+    def _checked_out(self, *args):
+        self.checkouts += 1
+
+    @asynccontextmanager
+    async def turn(self) -> AsyncIterator[AsyncSession]:
+        self.sessions += 1
+        async with async_session() as session:
+            # A connection is taken from the pool when the session begins a transaction.
+            event.listen(session.sync_session, "after_begin", self._checked_out)
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    def stats(self) -> dict:
+        return {"sessions": self.sessions, "pool_checkouts": self.checkouts}
+
+
+# Streamed responses still running, possibly for sockets that already dropped.
+_response_tasks: set[asyncio.Task] = set()
+
+
+def _response_done(task: asyncio.Task):
+    _response_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Streamed response failed: {task.exception()}")
+
+
+async def _produce_response(
+    sessions: _SocketSessions,
+    redis: aioredis.Redis,
+    replay: ReplayBuffer,
+    interview_id: int,
+    content: str,
+    idempotency_key: Optional[str],
+    queue: asyncio.Queue,
+):
+    """Run one streamed turn to completion, feeding the live socket and the replay buffer."""
+    try:
+        async with sessions.turn() as db:
+            service = InterviewConductorService(db, redis)
+            async for event in service.stream_process_message(
+                interview_id=interview_id,
+                candidate_message=content,
+                answer_mode="text",
+                idempotency_key=idempotency_key,
+            ):
+                event = replay.tag(event)
+                queue.put_nowait(event)
+                try:
+                    await replay.append(event)
+                except aioredis.RedisError:
+                    # Only resuming is lost; the live stream is unaffected.
+                    logger.warning(f"Replay buffer write failed for interview {interview_id}", exc_info=True)
+    except Exception as e:
+        try:
+            await replay.append(replay.tag({"type": "error", "code": "INTERNAL_ERROR", "content": str(e)}))
+        except aioredis.RedisError:
+            pass
+        raise
+    finally:
+        queue.put_nowait(None)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+async def _rendered(audio: bytes) -> bytes:
+    return audio
 
 
 async def authenticate_ws(token: str, db: AsyncSession) -> Optional[User]:
@@ -68,97 +155,133 @@ async def _verify_interview_access(
     return None
 
 
+async def _authorize(
+    websocket: WebSocket,
+    interview_id: int,
+    token: str,
+    redis: aioredis.Redis,
+    sessions: _SocketSessions,
+) -> Optional[int]:
+    """Authenticate the socket and check interview access, closing it if either fails.
+
+    Returns the user id. A grant cached by an earlier connection skips the database.
+    """
+    payload = decode_token(token) if token else None
+    user_id = payload.get("sub") if payload else None
+    if not user_id:
+        await websocket.close(code=4001, reason="Unauthorized")
+        return None
+    if await ws_auth_cache.allowed(redis, int(user_id), interview_id):
+        return int(user_id)
+
+    async with sessions.turn() as db:
+        user = await authenticate_ws(token, db)
+        interview = await _verify_interview_access(interview_id, user, db) if user else None
+    if not user:
+        await websocket.close(code=4001, reason="Unauthorized")
+        return None
+    if not interview:
+        await websocket.close(code=4004, reason="Access denied")
+        return None
+    await ws_auth_cache.remember(redis, user.id, interview_id, user.role)
+    return user.id
+
+
 @router.websocket("/interview/{interview_id}")
 async def interview_chat_ws(
     websocket: WebSocket,
     interview_id: int,
     token: str = Query(default=""),
+    redis: aioredis.Redis = Depends(get_redis),
 ):
     # --- Auth before accept ---
-    db = await _get_db_session()
-    user = await authenticate_ws(token, db)
-    if not user:
-        await websocket.close(code=4001, reason="Unauthorized")
+    sessions = _SocketSessions()
+    user_id = await _authorize(websocket, interview_id, token, redis, sessions)
+    if user_id is None:
         return
 
-    interview = await _verify_interview_access(interview_id, user, db)
-    if not interview:
-        await websocket.close(code=4004, reason="Access denied")
-        return
-
-    await websocket.accept()
-    await ws_manager.connect(interview_id, websocket)
-    logger.info(f"Chat WS connected: interview={interview_id} user={user.id}")
+    protocol = negotiate_protocol(websocket)
+    await websocket.accept(subprotocol=protocol)
+    channel = FrameChannel(websocket, protocol)
+    conn_id = await ws_manager.connect(interview_id, websocket, send=channel.send)
+    logger.info(f"Chat WS connected: interview={interview_id} user={user_id}")
 
     try:
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            message = await channel.receive()
             msg_type = message.get("type", "")
 
             # --- Heartbeat ---
             if msg_type == "ping":
-                await websocket.send_json({"type": "pong"})
+                await channel.send({"type": "pong"})
                 continue
 
-            # --- Reconnect: restore conversation history ---
+            # --- Reconnect: restore conversation history, then resume a cut-off response ---
             if msg_type == "reconnect":
-                db = await _get_db_session()
-                service = InterviewConductorService(db)
-                session_data = await service._get_session(interview_id)
-                history = session_data.get("conversation_history", [])
-                await websocket.send_json({
+                async with sessions.turn() as db:
+                    service = InterviewConductorService(db, redis)
+                    history, current_idx = await service.get_session_history(interview_id)
+                await channel.send({
                     "type": "reconnected",
                     "conversation_history": history,
-                    "current_question_index": session_data.get("current_question_index", 0),
+                    "current_question_index": current_idx,
                 })
+                if message.get("message_id"):
+                    replay = ReplayBuffer(redis, interview_id, message["message_id"])
+                    async for event in replay.replay(int(message.get("offset", 0))):
+                        await channel.send(event)
                 continue
 
-            # Fresh DB session per message cycle
-            db = await _get_db_session()
-            service = InterviewConductorService(db)
-
             if msg_type == "start":
-                result = await service.start_interview(interview_id)
-                await db.commit()
-                await websocket.send_json({
+                async with sessions.turn() as db:
+                    result = await InterviewConductorService(db, redis).start_interview(interview_id)
+                greeting_msg = {
                     "type": "greeting",
                     "content": result["greeting"],
                     "total_questions": result["total_questions"],
                     "duration_limit_min": result["duration_limit_min"],
-                })
+                }
+                if result.get("greeting_audio_url"):
+                    greeting_msg["greeting_audio_url"] = result["greeting_audio_url"]
+                await channel.send(greeting_msg)
 
             elif msg_type == "message":
                 content = message.get("content", "")
 
                 # Thinking indicator
-                await websocket.send_json({"type": "thinking"})
+                await channel.send({"type": "thinking"})
 
                 # Stream start
-                await websocket.send_json({"type": "stream_start"})
-
-                # Stream AI response chunk by chunk
-                async for event in service.stream_process_message(
-                    interview_id=interview_id,
-                    candidate_message=content,
-                    answer_mode="text",
-                ):
-                    await websocket.send_json(event)
-
-                await db.commit()
+                replay = ReplayBuffer(redis, interview_id)
+                await replay.reset()
+                await channel.send({"type": "stream_start", "message_id": replay.message_id})
+
+                # Stream AI response chunk by chunk. Generation runs in its own task so a
+                # dropped socket doesn't abort it; a reconnect resumes from the replay buffer.
+                queue: asyncio.Queue = asyncio.Queue()
+                producer = asyncio.create_task(
+                    _produce_response(
+                        sessions, redis, replay, interview_id, content, message.get("idempotency_key"), queue
+                    )
+                )
+                _response_tasks.add(producer)
+                producer.add_done_callback(_response_done)
+                while (event := await queue.get()) is not None:
+                    await channel.send(event)
+                await producer
 
             elif msg_type == "end":
-                await service.end_interview(interview_id)
-                await db.commit()
-                await websocket.send_json({"type": "ended", "content": "Interview ended."})
+                async with sessions.turn() as db:
+                    await InterviewConductorService(db, redis).end_interview(interview_id)
+                await channel.send({"type": "ended", "content": "Interview ended."})
                 break
 
     except WebSocketDisconnect:
-        logger.info(f"Chat WS disconnected: interview={interview_id} user={user.id}")
+        logger.info(f"Chat WS disconnected: interview={interview_id} user={user_id}")
     except Exception as e:
         logger.error(f"Chat WS error: interview={interview_id}: {e}", exc_info=True)
         try:
-            await websocket.send_json({
+            await channel.send({
                 "type": "error",
                 "code": "INTERNAL_ERROR",
                 "content": str(e),
@@ -166,7 +289,111 @@ async def interview_chat_ws(
         except Exception:
             pass
     finally:
-        ws_manager.disconnect(interview_id)
+        channel.close()
+        logger.info(f"Chat WS frames: interview={interview_id} {channel.stats()} db={sessions.stats()}")
+        await ws_manager.disconnect(interview_id, conn_id)
+
+
+async def _voice_reply(
+    websocket: WebSocket,
+    sessions: _SocketSessions,
+    redis: aioredis.Redis,
+    interview_id: int,
+    transcript: str,
+) -> bool:
+    """Run the candidate's spoken answer as a turn and stream the reply back.
+
+    Reply text streams as ``stream_chunk`` events; each finished sentence is
+    synthesized concurrently and sent as an ``audio_chunk`` event followed by
+    its audio bytes, in order. Returns True when the interview is complete.
+    """
+    # Send transcription back to client
+    await websocket.send_json({
+        "type": "transcription",
+        "content": transcript,
+    })
+
+    splitter = SentenceSplitter()
+    synthesizer = SentenceSynthesizer(websocket.send_json, websocket.send_bytes)
+    end = None
+    streamed = False
+    try:
+        # The session is committed and returned to the pool before the remaining TTS finishes.
+        async with sessions.turn() as db:
+            async for event in InterviewConductorService(db, redis).stream_process_message(
+                interview_id=interview_id,
+                candidate_message=transcript,
+                answer_mode="voice",
+            ):
+                audio = event.pop("audio", None)
+                audio_path = event.pop("audio_path", None)
+                if audio is not None or audio_path:
+                    # Pre-rendered reply (speculative transition or closing): no TTS needed.
+                    synthesizer.add(
+                        event["content"],
+                        _rendered(audio) if audio is not None else asyncio.to_thread(_read_file, audio_path),
+                    )
+                    splitter = None
+                if event["type"] == "stream_end":
+                    end = event
+                    if splitter is not None:
+                        # A closing without chunks arrives whole in stream_end.
+                        rest = splitter.flush() if streamed else end["content"]
+                        if rest:
+                            synthesizer.add(rest)
+                    # Keep consuming: the turn's bookkeeping and lock release run after stream_end.
+                    continue
+                await websocket.send_json(event)
+                streamed = True
+                for sentence in splitter.feed(event["content"]) if splitter else ():
+                    synthesizer.add(sentence)
+
+        chunks = await synthesizer.finish()
+    except BaseException:
+        synthesizer.close()
+        raise
+
+    # Send text response
+    await websocket.send_json({
+        "type": "complete" if end.get("is_complete") else "response",
+        **{k: v for k, v in end.items() if k != "type"},
+        "audio_chunks": chunks,
+        "first_audio_ms": round(synthesizer.first_audio_sec * 1000) if synthesizer.first_audio_sec is not None else None,
+    })
+    return bool(end.get("is_complete"))
+
+
+async def _receive_streamed_answer(websocket: WebSocket, transcriber: StreamingTranscriber) -> str:
+    """Feed PCM frames to the transcriber until the answer ends; return its transcript.
+
+    The answer ends when voice activity detection hears a long enough pause,
+    or when the client sends ``end_of_speech``.
+    """
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        if message.get("bytes") is not None:
+            if transcriber.feed(message["bytes"]):
+                break
+            continue
+        control = json.loads(message.get("text") or "{}")
+        if control.get("type") == "ping":
+            await websocket.send_json({"type": "pong"})
+        elif control.get("type") == "end_of_speech":
+            break
+    await websocket.send_json({"type": "thinking"})
+    return await transcriber.finish()
+
+
+async def _discard_input(websocket: WebSocket):
+    """Drop audio sent while a reply is being produced; it belongs to no answer."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        if message.get("text") and json.loads(message["text"]).get("type") == "ping":
+            await websocket.send_json({"type": "pong"})
 
 
 @router.websocket("/interview/{interview_id}/voice")
@@ -174,33 +401,50 @@ async def interview_voice_ws(
     websocket: WebSocket,
     interview_id: int,
     token: str = Query(default=""),
+    mode: str = Query(default="blob"),
+    sample_rate: int = Query(default=0),
+    redis: aioredis.Redis = Depends(get_redis),
 ):
-    # --- Auth before accept ---
-    db = await _get_db_session()
-    user = await authenticate_ws(token, db)
-    if not user:
-        await websocket.close(code=4001, reason="Unauthorized")
-        return
+    """Voice interview socket.
 
-    interview = await _verify_interview_access(interview_id, user, db)
-    if not interview:
-        await websocket.close(code=4004, reason="Access denied")
+    ``mode=blob`` (default): each binary frame is one complete recorded answer.
+    ``mode=stream``: binary frames are 16-bit mono PCM at ``sample_rate``
+    (default ``VOICE_STREAM_SAMPLE_RATE``), sent while the candidate speaks;
+    ``partial_transcript`` events follow each pause.
+    """
+    # --- Auth before accept ---
+    sessions = _SocketSessions()
+    user_id = await _authorize(websocket, interview_id, token, redis, sessions)
+    if user_id is None:
         return
 
     await websocket.accept()
-    await ws_manager.connect(interview_id, websocket)
-    logger.info(f"Voice WS connected: interview={interview_id} user={user.id}")
+    conn_id = await ws_manager.connect(interview_id, websocket)
+    logger.info(f"Voice WS connected: interview={interview_id} user={user_id} mode={mode}")
+
+    stt_tag = AICallTag(operation="stt", interview_id=interview_id)
+    transcriber = None
+    if mode == "stream":
+        transcriber = StreamingTranscriber(
+            build_stt_backend(),
+            sample_rate or settings.VOICE_STREAM_SAMPLE_RATE,
+            on_partial=websocket.send_json,
+            tag=stt_tag,
+        )
 
     try:
         while True:
-            # Receive binary audio data
-            audio_bytes = await websocket.receive_bytes()
+            if transcriber is not None:
+                transcript = await _receive_streamed_answer(websocket, transcriber)
+            else:
+                # Receive binary audio data
+                audio_bytes = await websocket.receive_bytes()
 
-            # Thinking indicator
-            await websocket.send_json({"type": "thinking"})
+                # Thinking indicator
+                await websocket.send_json({"type": "thinking"})
 
-            # Transcribe audio using Whisper
-            transcript = await transcribe_audio_bytes(audio_bytes)
+                # Transcribe audio using Whisper
+                transcript = await transcribe_audio_bytes(audio_bytes, tag=stt_tag)
 
             if not transcript.strip():
                 await websocket.send_json({
@@ -209,43 +453,27 @@ async def interview_voice_ws(
                 })
                 continue
 
-            # Send transcription back to client
-            await websocket.send_json({
-                "type": "transcription",
-                "content": transcript,
-            })
-
-            # Fresh DB session per message
-            db = await _get_db_session()
-            service = InterviewConductorService(db)
-
-            # Process as interview message (non-streaming for voice — TTS needs full text)
-            result = await service.process_message(
-                interview_id=interview_id,
-                candidate_message=transcript,
-                answer_mode="voice",
-            )
-
-            # Generate TTS for AI response
-            ai_audio = await text_to_speech_bytes(result["message"])
-
-            # Send text response
-            await websocket.send_json({
-                "type": "complete" if result.get("is_complete") else "response",
-                "content": result["message"],
-                **{k: v for k, v in result.items() if k != "message"},
-            })
-
-            # Send audio response
-            await websocket.send_bytes(ai_audio)
-
-            await db.commit()
+            if transcriber is None:
+                if await _voice_reply(websocket, sessions, redis, interview_id, transcript):
+                    break
+                continue
 
-            if result.get("is_complete"):
+            # The client may keep streaming while the reply plays; none of it is the next answer.
+            discard = asyncio.create_task(_discard_input(websocket))
+            try:
+                complete = await _voice_reply(websocket, sessions, redis, interview_id, transcript)
+            finally:
+                discard.cancel()
+                # Wait it out, so its receive() is gone before the next answer's starts.
+                await asyncio.gather(discard, return_exceptions=True)
+            if not discard.cancelled() and discard.exception() is not None:
+                raise discard.exception()
+            transcriber.reset()
+            if complete:
                 break
 
     except WebSocketDisconnect:
-        logger.info(f"Voice WS disconnected: interview={interview_id} user={user.id}")
+        logger.info(f"Voice WS disconnected: interview={interview_id} user={user_id}")
     except Exception as e:
         logger.error(f"Voice WS error: interview={interview_id}: {e}", exc_info=True)
         try:
@@ -257,4 +485,7 @@ async def interview_voice_ws(
         except Exception:
             pass
     finally:
-        ws_manager.disconnect(interview_id)
+        if transcriber is not None:
+            transcriber.close()
+        logger.info(f"Voice WS db: interview={interview_id} {sessions.stats()}")
+        await ws_manager.disconnect(interview_id, conn_id)
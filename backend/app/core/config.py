@@ -15,6 +15,10 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6380/0"
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6380
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_CONNECT_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
 
     # JWT
     JWT_SECRET_KEY: str = "dev-secret-key-change-in-production"
@@ -26,6 +30,147 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = "sk-placeholder"
     OPENAI_MODEL: str = "gpt-4o"
 
+    # OpenAI HTTP transport (one connection pool per event loop)
+    OPENAI_MAX_CONNECTIONS: int = 100
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    OPENAI_KEEPALIVE_EXPIRY_SEC: float = 30.0
+    OPENAI_HTTP2: bool = True
+    OPENAI_HTTP_TIMEOUT_SEC: float = 120.0
+    OPENAI_CONNECT_TIMEOUT_SEC: float = 5.0
+    OPENAI_POOL_TIMEOUT_SEC: float = 10.0
+
+    # AI model routing: operation -> tier, tier -> models in fallback order.
+    # Operations not listed here use OPENAI_MODEL; move one (e.g. history_summary, parse) to a
+    # cheaper tier only once `python -m app.ai.benchmark` shows it holds up.
+    AI_MODEL_TIERS: dict[str, list[str]] = {
+        "fast": ["gpt-4o-mini", "gpt-4o"],
+        "standard": ["gpt-4o", "gpt-4o-mini"],
+    }
+    AI_OPERATION_TIERS: dict[str, str] = {
+        "greeting": "fast",
+        "closing": "fast",
+        "turn": "standard",
+        "transition": "fast",
+        "screening": "standard",
+        "evaluation": "standard",
+        "question_gen": "standard",
+    }
+    # Sampled prompt recording for `python -m app.ai.benchmark` (contains PII)
+    AI_PROMPT_RECORD_PATH: Optional[str] = None
+    AI_PROMPT_RECORD_SAMPLE_RATE: float = 0.1
+
+    # AI provider: "openai", or "stub" for offline load tests
+    AI_PROVIDER: str = "openai"
+    AI_STUB_LATENCY_MS: int = 300
+    AI_STUB_TOKEN_LATENCY_MS: int = 15
+
+    # AI response cache
+    AI_CACHE_ENABLED: bool = True
+    AI_CACHE_TTL_SEC: int = 7 * 24 * 3600
+    AI_CACHE_LRU_SIZE: int = 256
+    AI_CACHE_MAX_TEMPERATURE: float = 0.3
+
+    # AI rate governor (per process)
+    AI_RPM_LIMIT: int = 500
+    AI_TPM_LIMIT: int = 150_000
+    AI_MAX_CONCURRENCY: int = 32
+    AI_MIN_CONCURRENCY: int = 2
+    AI_BATCH_BUDGET_SHARE: float = 0.6
+
+    # AI call policies: {"operation": {"deadline_sec": 20, "hedge": true, ...}}
+    AI_CALL_POLICY_OVERRIDES: dict[str, dict] = {}
+
+    # AI usage ledger
+    AI_USAGE_LEDGER_ENABLED: bool = True
+    AI_USAGE_LEDGER_BATCH_SIZE: int = 50
+    AI_USAGE_LEDGER_FLUSH_INTERVAL_SEC: float = 5.0
+    AI_USAGE_LEDGER_MAX_BUFFER: int = 5000
+    # USD per 1M tokens ("input", "cached_input", "output") or characters
+    AI_MODEL_PRICING: dict[str, dict[str, float]] = {
+        "gpt-4o": {"input": 2.50, "cached_input": 1.25, "output": 10.00},
+        "gpt-4o-mini": {"input": 0.15, "cached_input": 0.075, "output": 0.60},
+        "tts-1": {"characters": 15.00},
+    }
+
+    # Interview greeting/closing pre-rendering
+    INTERVIEW_PRERENDER_ENABLED: bool = True
+    INTERVIEW_PRERENDER_AUDIO: bool = True
+
+    # Interview prompt history
+    INTERVIEW_HISTORY_TOKEN_BUDGET: int = 2000
+    INTERVIEW_HISTORY_KEEP_TURNS: int = 3
+
+    # Interview transcript write-behind journal
+    INTERVIEW_JOURNAL_ENABLED: bool = True
+    INTERVIEW_JOURNAL_BATCH_SIZE: int = 200
+    INTERVIEW_JOURNAL_FLUSH_INTERVAL_SEC: float = 1.0
+
+    # Speculative "move on" message prepared while the candidate answers
+    INTERVIEW_PREFETCH_ENABLED: bool = True
+    # Answers shorter than this are treated as needing a follow-up, not a transition.
+    INTERVIEW_PREFETCH_MIN_ANSWER_WORDS: int = 20
+    INTERVIEW_PREFETCH_WAIT_SEC: float = 2.0
+    INTERVIEW_PREFETCH_TTL_SEC: int = 900
+
+    # One turn at a time per interview; the lock outlives a slow completion, a second message waits for it.
+    INTERVIEW_TURN_LOCK_TIMEOUT_SEC: int = 180
+    INTERVIEW_TURN_LOCK_WAIT_SEC: float = 30.0
+    # How long a turn's result is returned for a repeated idempotency key.
+    INTERVIEW_IDEMPOTENCY_TTL_SEC: int = 900
+
+    # Interview WebSocket registry (multi-worker routing)
+    WS_NODE_ID: Optional[str] = None  # defaults to hostname-pid-random
+    WS_OWNER_TTL_SEC: int = 90
+    # How often a node refreshes its sockets' ownership; keep well under WS_OWNER_TTL_SEC.
+    WS_REGISTRY_HEARTBEAT_SEC: float = 20.0
+    # Streamed chunks are merged until this many bytes or this much delay, whichever comes first.
+    WS_COALESCE_MAX_BYTES: int = 512
+    WS_COALESCE_WINDOW_MS: int = 30
+    # Must match the server's --ws-per-message-deflate (uvicorn's default is on); used for frame stats.
+    WS_PER_MESSAGE_DEFLATE: bool = True
+    # How long a streamed response stays resumable, and how long a resume waits for new chunks.
+    WS_REPLAY_TTL_SEC: int = 120
+    WS_REPLAY_WAIT_SEC: float = 30.0
+    # How long a user's access grant to an interview socket is cached (about an interview's lifetime).
+    WS_AUTH_CACHE_TTL_SEC: int = 7200
+
+    # Streaming voice answers (voice WebSocket with mode=stream)
+    VOICE_STT_BACKEND: str = "whisper"  # or "stub" for offline load tests
+    VOICE_STREAM_SAMPLE_RATE: int = 16000
+    VOICE_VAD_FRAME_MS: int = 30
+    # Minimum RMS (16-bit PCM) for a frame to count as speech.
+    VOICE_VAD_ENERGY_THRESHOLD: float = 300.0
+    # A pause this long closes a segment for transcription; a longer one ends the answer.
+    VOICE_VAD_SEGMENT_SILENCE_MS: int = 400
+    VOICE_VAD_END_OF_TURN_MS: int = 1200
+    VOICE_VAD_MAX_SEGMENT_SEC: int = 15
+    # Voice replies are synthesized per sentence, this many at once; shorter sentences are merged.
+    VOICE_TTS_PARALLELISM: int = 3
+    VOICE_TTS_MIN_SENTENCE_CHARS: int = 24
+    # Recorded answers are trimmed, downmixed to 16 kHz mono and Opus-encoded (ffmpeg) before Whisper.
+    AUDIO_PREPROCESS_ENABLED: bool = True
+    AUDIO_PREPROCESS_BITRATE: str = "24k"
+    AUDIO_SILENCE_THRESHOLD_DB: float = -45.0
+    AUDIO_PREPROCESS_TIMEOUT_SEC: float = 20.0
+    AUDIO_UPLOAD_MAX_MB: int = 25
+    # Synthesized audio cached on disk under MEDIA_DIR/tts_cache, LRU-evicted past this size.
+    TTS_CACHE_ENABLED: bool = True
+    TTS_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    # Uploaded interview recordings are split at pauses into chunks of at most RECORDING_CHUNK_SEC,
+    # each padded by the overlap, and transcribed this many at once. Failed chunks are retried up to
+    # RECORDING_CHUNK_MAX_ATTEMPTS times; the lock keeps two workers off the same recording.
+    RECORDING_CHUNK_SEC: float = 120.0
+    RECORDING_CHUNK_OVERLAP_SEC: float = 1.5
+    RECORDING_SILENCE_DB: float = -35.0
+    RECORDING_TRANSCRIBE_CONCURRENCY: int = 4
+    RECORDING_CHUNK_MAX_ATTEMPTS: int = 3
+    RECORDING_LOCK_TIMEOUT_SEC: int = 1800
+
+    # Interview session state in Redis
+    INTERVIEW_SESSION_TTL_SEC: int = 7200
+    # Already-summarized messages beyond this many are trimmed from the stored history.
+    INTERVIEW_SESSION_HISTORY_MAX: int = 40
+
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
 
@@ -53,6 +198,9 @@ class Settings(BaseSettings):
     # Upload
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE_MB: int = 10
+    # Server-side media (pre-rendered interview audio) kept out of the public /uploads mount;
+    # must be shared between the API and the Celery workers.
+    MEDIA_DIR: str = "media"
 
     # URLs
     BACKEND_URL: str = "http://localhost:8000"
@@ -34,3 +34,13 @@ async def get_session() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+def pool_stats() -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
@@ -1,11 +1,13 @@
 """FastAPI dependencies for auth and database."""
 from typing import Optional
 
+import redis.asyncio as aioredis
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
+from app.core.redis import redis_pool
 from app.core.security import decode_token
 
 security_scheme = HTTPBearer(auto_error=False)
@@ -15,6 +17,10 @@ async def get_db(session: AsyncSession = Depends(get_session)):
     yield session
 
 
+async def get_redis() -> aioredis.Redis:
+    return redis_pool.client
+
+
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_scheme),
     db: AsyncSession = Depends(get_session),
@@ -0,0 +1,87 @@
+"""Shared Redis connection pool.
+
+The API process uses one pool, opened in the FastAPI lifespan and handed
+to routes through the ``get_redis`` dependency. redis.asyncio connections
+are bound to the event loop that created them, and Celery tasks run each
+job on a fresh loop, so code running outside the API loop gets its own
+pool for that loop.
+"""
+import asyncio
+import logging
+import time
+import weakref
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisPool:
+    def __init__(self):
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _build() -> aioredis.Redis:
+        pool = aioredis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        )
+        return aioredis.Redis(connection_pool=pool)
+
+    @property
+    def client(self) -> aioredis.Redis:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._build()
+            self._clients[loop] = client
+        return client
+
+    async def start(self):
+        try:
+            await self.client.ping()
+        except aioredis.RedisError:
+            # Not fatal at startup; connections are retried per command.
+            logger.warning("Redis is not reachable at startup", exc_info=True)
+
+    async def aclose(self):
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose(close_connection_pool=True)
+
+    def stats(self) -> dict:
+        try:
+            client = self._clients.get(asyncio.get_running_loop())
+        except RuntimeError:
+            client = None
+        if client is None:
+            return {"connected": False}
+        pool = client.connection_pool
+        return {
+            "connected": True,
+            "max_connections": pool.max_connections,
+            "created_connections": pool._created_connections,
+            "idle_connections": len(pool._available_connections),
+            "in_use_connections": len(pool._in_use_connections),
+            "pools": len(self._clients),
+        }
+
+    async def health(self) -> dict:
+        stats = self.stats()
+        started = time.monotonic()
+        try:
+            await self.client.ping()
+        except aioredis.RedisError as e:
+            return {**stats, "healthy": False, "error": type(e).__name__}
+        return {**stats, "healthy": True, "ping_ms": round((time.monotonic() - started) * 1000, 2)}
+
+
+redis_pool = RedisPool()
@@ -0,0 +1,190 @@
+"""Load test for interview WebSockets across several worker processes.
+
+Opens one chat socket per interview id, spread round-robin over the given
+server URLs, keeps them alive with application pings, and halfway through
+reconnects a fraction of them to a *different* URL. Each of those old
+sockets must then be closed by its server with code 1001, which only
+happens when the cross-node registry and pub/sub eviction work.
+
+    # e.g. four workers on separate ports
+    python -m app.loadtest.ws_interviews \\
+        --urls ws://localhost:8001,ws://localhost:8002,ws://localhost:8003,ws://localhost:8004 \\
+        --interview-ids 1-3000 --user-id 1 --duration 120
+
+``--user-id`` must be a super_admin (tokens are minted with this
+deployment's JWT secret), and the interview ids must exist. Raise the
+client's open-file limit (``ulimit -n``) for thousands of sockets.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import websockets
+
+from app.core.security import create_access_token
+
+
+def _parse_ids(spec: str) -> list[int]:
+    ids = []
+    for part in spec.split(","):
+        if "-" in part:
+            start, end = part.split("-", 1)
+            ids.extend(range(int(start), int(end) + 1))
+        elif part.strip():
+            ids.append(int(part))
+    return ids
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class Stats:
+    def __init__(self):
+        self.connect_sec: list[float] = []
+        self.ping_sec: list[float] = []
+        self.connect_errors: dict[str, int] = {}
+        self.unexpected_closes = 0
+        self.moves = 0
+        self.evicted = 0
+        self.peak_open = 0
+        self.open = 0
+
+    def error(self, e: Exception):
+        name = type(e).__name__
+        self.connect_errors[name] = self.connect_errors.get(name, 0) + 1
+
+
+async def _open(url: str, interview_id: int, token: str, stats: Stats):
+    started = time.monotonic()
+    ws = await websockets.connect(
+        f"{url}/api/v1/ws/interview/{interview_id}?token={token}",
+        open_timeout=30,
+        ping_interval=None,
+    )
+    stats.connect_sec.append(time.monotonic() - started)
+    stats.open += 1
+    stats.peak_open = max(stats.peak_open, stats.open)
+    return ws
+
+
+async def _ping(ws, stats: Stats) -> bool:
+    started = time.monotonic()
+    try:
+        await ws.send(json.dumps({"type": "ping"}))
+        while True:
+            message = json.loads(await asyncio.wait_for(ws.recv(), timeout=10))
+            if message.get("type") == "pong":
+                stats.ping_sec.append(time.monotonic() - started)
+                return True
+    except (websockets.ConnectionClosed, asyncio.TimeoutError):
+        return False
+
+
+async def _client(
+    index: int,
+    interview_id: int,
+    urls: list[str],
+    token: str,
+    args: argparse.Namespace,
+    stats: Stats,
+    deadline: float,
+):
+    url = urls[index % len(urls)]
+    try:
+        ws = await _open(url, interview_id, token, stats)
+    except Exception as e:
+        stats.error(e)
+        return
+
+    move_at = None
+    if len(urls) > 1 and random.random() < args.move_fraction:
+        move_at = time.monotonic() + (deadline - time.monotonic()) / 2
+
+    try:
+        while time.monotonic() < deadline:
+            await asyncio.sleep(args.ping_interval * random.uniform(0.8, 1.2))
+            if move_at and time.monotonic() >= move_at:
+                move_at = None
+                stats.moves += 1
+                try:
+                    new_ws = await _open(urls[(index + 1) % len(urls)], interview_id, token, stats)
+                except Exception as e:
+                    stats.error(e)
+                    continue
+                try:
+                    await asyncio.wait_for(ws.wait_closed(), timeout=10)
+                    if ws.close_code == 1001:
+                        stats.evicted += 1
+                except asyncio.TimeoutError:
+                    await ws.close()
+                stats.open -= 1
+                ws = new_ws
+                continue
+            if not await _ping(ws, stats):
+                stats.unexpected_closes += 1
+                return
+    finally:
+        if ws.close_code is None:
+            await ws.close()
+        stats.open -= 1
+
+
+async def run_load_test(args: argparse.Namespace) -> dict:
+    urls = [u.strip().rstrip("/") for u in args.urls.split(",") if u.strip()]
+    ids = _parse_ids(args.interview_ids)
+    token = create_access_token({"sub": str(args.user_id)})
+    stats = Stats()
+
+    deadline = time.monotonic() + args.ramp_sec + args.duration
+    clients = []
+    for i, interview_id in enumerate(ids):
+        clients.append(asyncio.create_task(_client(i, interview_id, urls, token, args, stats, deadline)))
+        # Spread connects evenly over the ramp period.
+        await asyncio.sleep(args.ramp_sec / len(ids))
+    await asyncio.gather(*clients)
+
+    return {
+        "sockets": len(ids),
+        "workers": len(urls),
+        "peak_open": stats.peak_open,
+        "connect_errors": stats.connect_errors,
+        "connect_p50_ms": round(_percentile(stats.connect_sec, 50) * 1000, 1),
+        "connect_p95_ms": round(_percentile(stats.connect_sec, 95) * 1000, 1),
+        "pings": len(stats.ping_sec),
+        "ping_p50_ms": round(_percentile(stats.ping_sec, 50) * 1000, 1),
+        "ping_p95_ms": round(_percentile(stats.ping_sec, 95) * 1000, 1),
+        "ping_p99_ms": round(_percentile(stats.ping_sec, 99) * 1000, 1),
+        "cross_worker_moves": stats.moves,
+        "old_sockets_evicted": stats.evicted,
+        "unexpected_closes": stats.unexpected_closes,
+    }
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Load test interview WebSockets across workers.")
+    parser.add_argument("--urls", required=True, help="Comma-separated ws:// base URLs, one per worker")
+    parser.add_argument("--interview-ids", required=True, help="Ids or ranges, e.g. 1-2000,2500")
+    parser.add_argument("--user-id", type=int, required=True, help="super_admin user to mint a token for")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to hold sockets after ramp-up")
+    parser.add_argument("--ramp-sec", type=float, default=20)
+    parser.add_argument("--ping-interval", type=float, default=10)
+    parser.add_argument("--move-fraction", type=float, default=0.1, help="Share of sockets that reconnect to another worker")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:<22}{value}")
+
+
+if __name__ == "__main__":
+    run()
@@ -6,12 +6,26 @@ from fastapi.staticfiles import StaticFiles
 
 from app.core.config import settings
 from app.core.database import init_db
+from app.core.redis import redis_pool
+from app.ai.openai_client import ai_client
+from app.ai.usage_ledger import usage_ledger
+from app.services.transcript_journal import transcript_journal
+from app.services.ws_connection_manager import ws_manager
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    await redis_pool.start()
+    usage_ledger.start()
+    transcript_journal.start()
+    ws_manager.start()
     yield
+    await ws_manager.stop()
+    await transcript_journal.stop()
+    await usage_ledger.stop()
+    await ai_client.aclose()
+    await redis_pool.aclose()
 
 
 app = FastAPI(
@@ -45,37 +59,3 @@ async def health_check():
 from app.api.v1 import router as api_v1_router
 app.include_router(api_v1_router, prefix="/api/v1")
 
-
-# Direct transcribe endpoint (workaround for route matching issue)
-from fastapi import UploadFile, File, Depends, HTTPException
-from app.core.dependencies import get_current_user
-from app.models.user import User
-
-
-@app.post("/api/v1/audio/transcribe", tags=["Audio"])
-async def transcribe_audio(
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-):
-    """Transcribe an audio file using OpenAI Whisper."""
-    import logging
-    logger = logging.getLogger(__name__)
-
-    audio_bytes = await file.read()
-    logger.info(f"Transcribe: received {len(audio_bytes)} bytes, filename={file.filename}")
-
-    if not audio_bytes or len(audio_bytes) < 100:
-        raise HTTPException(status_code=400, detail=f"Audio file too small ({len(audio_bytes)} bytes)")
-
-    try:
-        from app.ai.voice.whisper_stt import transcribe_audio_bytes
-        text = await transcribe_audio_bytes(
-            audio_bytes=audio_bytes,
-            language="en",
-            filename=file.filename or "audio.webm",
-        )
-        logger.info(f"Transcribe result: {text[:100]!r}")
-        return {"text": text}
-    except Exception as e:
-        logger.error(f"Transcribe failed: {type(e).__name__}: {e}")
-        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
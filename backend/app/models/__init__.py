@@ -5,8 +5,8 @@ from app.models.job import JobDescription, JobStatus
 from app.models.candidate import Candidate, CandidateStatus, WorkExperience
 from app.models.resume_screening import ResumeScreening, ScreeningRecommendation
 from app.models.interview import (
-    Interview, InterviewQuestion, InterviewAnswer, InterviewTranscript,
-    InterviewType, InterviewStatus, AnswerMode, SpeakerType, MessageType,
+    Interview, InterviewQuestion, InterviewAnswer, InterviewTranscript, InterviewRecordingSegment,
+    InterviewType, InterviewStatus, AnswerMode, SpeakerType, MessageType, RecordingSegmentStatus,
 )
 from app.models.evaluation import Evaluation, AIRecommendation, HRDecision
 from app.models.notification import (
@@ -16,6 +16,7 @@ from app.models.notification import (
 from app.models.offer_letter import OfferLetter, OfferLetterStatus
 from app.models.audit_log import AuditLog
 from app.models.demo_request import DemoRequest, DemoRequestStatus
+from app.models.ai_usage import AIUsageRecord
 
 __all__ = [
     "User", "UserRole",
@@ -24,12 +25,13 @@ __all__ = [
     "JobDescription", "JobStatus",
     "Candidate", "CandidateStatus", "WorkExperience",
     "ResumeScreening", "ScreeningRecommendation",
-    "Interview", "InterviewQuestion", "InterviewAnswer", "InterviewTranscript",
-    "InterviewType", "InterviewStatus", "AnswerMode", "SpeakerType", "MessageType",
+    "Interview", "InterviewQuestion", "InterviewAnswer", "InterviewTranscript", "InterviewRecordingSegment",
+    "InterviewType", "InterviewStatus", "AnswerMode", "SpeakerType", "MessageType", "RecordingSegmentStatus",
     "Evaluation", "AIRecommendation", "HRDecision",
     "Notification", "NotificationTemplate",
     "NotificationType", "NotificationChannel", "NotificationStatus",
     "OfferLetter", "OfferLetterStatus",
     "AuditLog",
     "DemoRequest", "DemoRequestStatus",
+    "AIUsageRecord",
 ]
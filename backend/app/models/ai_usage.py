@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class AIUsageRecord(SQLModel, table=True):
+    """One row per AI provider call, written in batches by the usage ledger.
+
+    Entity ids are plain indexed columns (no foreign keys) so the ledger
+    never blocks deleting a candidate, job or interview.
+    """
+
+    __tablename__ = "ai_usage_records"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    operation: str = Field(max_length=50, index=True)
+    model: str = Field(max_length=100)
+    prompt_tokens: int = Field(default=0)
+    completion_tokens: int = Field(default=0)
+    cached_tokens: int = Field(default=0)
+    characters: int = Field(default=0)
+    latency_ms: int = Field(default=0)
+    cost_usd: float = Field(default=0.0)
+    success: bool = Field(default=True)
+    interview_id: Optional[int] = Field(default=None, index=True)
+    job_id: Optional[int] = Field(default=None, index=True)
+    candidate_id: Optional[int] = Field(default=None, index=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, List
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, JSON, UniqueConstraint
 from sqlmodel import Field, SQLModel, Relationship
 
 
@@ -37,6 +37,12 @@ class MessageType(str, Enum):
     SYSTEM = "system"
 
 
+class RecordingSegmentStatus(str, Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
 class Interview(SQLModel, table=True):
     __tablename__ = "interviews"
 
@@ -53,6 +59,11 @@ class Interview(SQLModel, table=True):
     total_questions: int = Field(default=0)
     questions_asked: int = Field(default=0)
     recording_url: Optional[str] = Field(default=None, max_length=500)
+    # Pre-rendered at creation so starting and finishing never wait on the LLM.
+    greeting_text: Optional[str] = Field(default=None)
+    closing_text: Optional[str] = Field(default=None)
+    greeting_audio_path: Optional[str] = Field(default=None, max_length=500)
+    closing_audio_path: Optional[str] = Field(default=None, max_length=500)
     created_by: Optional[int] = Field(default=None, foreign_key="users.id")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -85,6 +96,7 @@ class InterviewQuestion(SQLModel, table=True):
 
 class InterviewAnswer(SQLModel, table=True):
     __tablename__ = "interview_answers"
+    __table_args__ = (UniqueConstraint("interview_id", "sequence_order", name="uq_interview_answers_sequence"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     interview_id: int = Field(foreign_key="interviews.id", index=True)
@@ -94,6 +106,8 @@ class InterviewAnswer(SQLModel, table=True):
     answer_mode: AnswerMode = Field(default=AnswerMode.TEXT)
     sentiment: Optional[dict] = Field(default=None, sa_column=Column(JSON))
     confidence_score: Optional[float] = Field(default=None)
+    # Sequence of the candidate transcript this answer came from; the journal key.
+    sequence_order: Optional[int] = Field(default=None)
     answered_at: datetime = Field(default_factory=datetime.utcnow)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -103,6 +117,7 @@ class InterviewAnswer(SQLModel, table=True):
 
 class InterviewTranscript(SQLModel, table=True):
     __tablename__ = "interview_transcripts"
+    __table_args__ = (UniqueConstraint("interview_id", "sequence_order", name="uq_interview_transcripts_sequence"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     interview_id: int = Field(foreign_key="interviews.id", index=True)
@@ -114,3 +129,30 @@ class InterviewTranscript(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     interview: Optional[Interview] = Relationship(back_populates="transcripts")
+
+
+class InterviewRecordingSegment(SQLModel, table=True):
+    """One chunk of an uploaded interview recording and its transcript.
+
+    ``start_sec``/``end_sec`` are the chunk's own span in the recording; it is
+    transcribed with a little overlap on either side and ``text`` is the raw
+    result. ``aligned_text`` has the overlap with the previous chunk removed,
+    and ``transcript_id`` is the conversation turn that was live at
+    ``start_sec``.
+    """
+    __tablename__ = "interview_recording_segments"
+    __table_args__ = (UniqueConstraint("recording_path", "chunk_index", name="uq_recording_segments_chunk"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    interview_id: int = Field(foreign_key="interviews.id", index=True)
+    recording_path: str = Field(max_length=500)
+    chunk_index: int
+    start_sec: float
+    end_sec: float
+    status: RecordingSegmentStatus = Field(default=RecordingSegmentStatus.PENDING)
+    attempts: int = Field(default=0)
+    text: Optional[str] = Field(default=None)
+    aligned_text: Optional[str] = Field(default=None)
+    transcript_id: Optional[int] = Field(default=None, foreign_key="interview_transcripts.id")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -54,6 +54,8 @@ class InterviewListResponse(BaseModel):
 class ChatMessage(BaseModel):
     content: str = Field(min_length=1, max_length=5000)
     message_type: str = "text"
+    # Repeats of a key return the first result instead of running the turn again.
+    idempotency_key: Optional[str] = Field(default=None, max_length=128)
 
 
 class ChatResponse(BaseModel):
@@ -0,0 +1,66 @@
+"""Aggregate queries over the AI usage ledger."""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models.ai_usage import AIUsageRecord
+
+
+class AIUsageService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _summarize(self, *conditions) -> dict:
+        result = await self.db.execute(
+            select(
+                AIUsageRecord.operation,
+                func.count(AIUsageRecord.id),
+                func.sum(AIUsageRecord.prompt_tokens),
+                func.sum(AIUsageRecord.completion_tokens),
+                func.sum(AIUsageRecord.cached_tokens),
+                func.sum(AIUsageRecord.characters),
+                func.sum(AIUsageRecord.cost_usd),
+                func.avg(AIUsageRecord.latency_ms),
+            )
+            .where(*conditions)
+            .group_by(AIUsageRecord.operation)
+            .order_by(AIUsageRecord.operation)
+        )
+
+        operations = []
+        for op, calls, prompt, completion, cached, chars, cost, latency in result.all():
+            operations.append({
+                "operation": op,
+                "calls": calls,
+                "prompt_tokens": int(prompt or 0),
+                "completion_tokens": int(completion or 0),
+                "cached_tokens": int(cached or 0),
+                "characters": int(chars or 0),
+                "cost_usd": round(float(cost or 0), 6),
+                "avg_latency_ms": round(float(latency or 0), 1),
+            })
+
+        return {
+            "total_calls": sum(o["calls"] for o in operations),
+            "total_tokens": sum(o["prompt_tokens"] + o["completion_tokens"] for o in operations),
+            "total_cost_usd": round(sum(o["cost_usd"] for o in operations), 6),
+            "operations": operations,
+        }
+
+    async def get_job_usage(self, job_id: int) -> dict:
+        return {"job_id": job_id, **await self._summarize(AIUsageRecord.job_id == job_id)}
+
+    async def get_interview_usage(self, interview_id: int) -> dict:
+        return {
+            "interview_id": interview_id,
+            **await self._summarize(AIUsageRecord.interview_id == interview_id),
+        }
+
+    async def get_summary(self, days: Optional[int] = 30) -> dict:
+        conditions = []
+        if days:
+            conditions.append(AIUsageRecord.created_at >= datetime.utcnow() - timedelta(days=days))
+        return {"days": days, **await self._summarize(*conditions)}
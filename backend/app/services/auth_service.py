@@ -1,12 +1,14 @@
 """Authentication service."""
 import logging
 import secrets
+from typing import Optional
 
 import redis.asyncio as aioredis
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.core.config import settings
+from app.core.redis import redis_pool
 from app.core.exceptions import ConflictException, UnauthorizedException
 from app.core.security import get_password_hash, verify_password, create_access_token, create_refresh_token, decode_token
 from app.models.user import User
@@ -17,8 +19,9 @@ logger = logging.getLogger(__name__)
 
 
 class AuthService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: Optional[aioredis.Redis] = None):
         self.db = db
+        self.redis = redis or redis_pool.client
 
     async def register(self, data: UserCreate) -> User:
         result = await self.db.execute(select(User).where(User.email == data.email))
@@ -97,33 +100,25 @@ class AuthService:
             return
 
         token = secrets.token_urlsafe(32)
-        r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-        try:
-            await r.set(f"pwd_reset:{token}", str(user.id), ex=3600)  # 1 hour TTL
-        finally:
-            await r.aclose()
+        await self.redis.set(f"pwd_reset:{token}", str(user.id), ex=3600)  # 1 hour TTL
 
         reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token}"
         send_password_reset_email.delay(user.email, user.full_name, reset_url)
 
     async def reset_password(self, token: str, new_password: str) -> None:
         """Validate reset token and update user's password."""
-        r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-        try:
-            key = f"pwd_reset:{token}"
-            user_id = await r.get(key)
-            if not user_id:
-                raise UnauthorizedException("Invalid or expired reset token")
-
-            result = await self.db.execute(select(User).where(User.id == int(user_id)))
-            user = result.scalar_one_or_none()
-            if not user:
-                raise UnauthorizedException("User not found")
-
-            user.hashed_password = get_password_hash(new_password)
-            self.db.add(user)
-            await self.db.flush()
-
-            await r.delete(key)
-        finally:
-            await r.aclose()
+        key = f"pwd_reset:{token}"
+        user_id = await self.redis.get(key)
+        if not user_id:
+            raise UnauthorizedException("Invalid or expired reset token")
+
+        result = await self.db.execute(select(User).where(User.id == int(user_id)))
+        user = result.scalar_one_or_none()
+        if not user:
+            raise UnauthorizedException("User not found")
+
+        user.hashed_password = get_password_hash(new_password)
+        self.db.add(user)
+        await self.db.flush()
+
+        await self.redis.delete(key)
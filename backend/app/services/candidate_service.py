@@ -14,6 +14,7 @@ from app.models.candidate import Candidate, CandidateStatus, WorkExperience
 from app.schemas.candidate import CandidateCreate, CandidateUpdate
 from app.utils.file_handler import validate_file, save_upload, extract_resume_text
 from app.ai.openai_client import ai_client
+from app.ai.usage import AICallTag
 from app.ai.prompts.resume_parsing import RESUME_PARSE_SYSTEM, build_resume_parse_prompt
 
 logger = logging.getLogger(__name__)
@@ -164,7 +165,8 @@ class CandidateService:
                 {"role": "user", "content": prompt},
             ]
             parsed = await ai_client.chat_completion_json(
-                messages=messages, temperature=0.1, max_tokens=3000
+                messages=messages, temperature=0.1, max_tokens=3000, cache=True,
+                tag=AICallTag("parse"),
             )
         except Exception as e:
             logger.warning("AI resume parsing failed: %s", e)
@@ -1,6 +1,6 @@
 """Evaluation service."""
 from datetime import datetime
-from typing import Optional
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -11,23 +11,19 @@ from app.models.interview import Interview, InterviewStatus
 from app.models.candidate import Candidate
 from app.models.job import JobDescription
 from app.models.evaluation import Evaluation, AIRecommendation, HRDecision
-from app.ai.chains.evaluation_chain import run_evaluation
+from app.ai.chains.evaluation_chain import run_evaluation, stream_evaluation
+from app.ai.usage import AICallTag
+from app.services.transcript_journal import transcript_journal
 
 
 class EvaluationService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def evaluate_interview(self, interview_id: int) -> Evaluation:
-        # Check if already evaluated
-        result = await self.db.execute(
-            select(Evaluation).where(Evaluation.interview_id == interview_id)
-        )
-        existing = result.scalar_one_or_none()
-        if existing:
-            return existing  # Idempotent — return existing evaluation
-
-        # Get interview with related data
+    async def _load_evaluation_input(self, interview_id: int) -> tuple[Interview, dict]:
+        """Load a completed interview and build the evaluation chain's arguments."""
+        # Every entry point scores through here: never with turns still in the Redis journal.
+        await transcript_journal.drain(interview_id)
         result = await self.db.execute(
             select(Interview)
             .where(Interview.id == interview_id)
@@ -65,15 +61,20 @@ class EvaluationService:
                 "question_type": q.question_type,
             })
 
-        # Run AI evaluation
-        ai_result = await run_evaluation(
-            candidate_name=candidate.full_name if candidate else "Unknown",
-            job_title=job.title if job else "Unknown",
-            domain=job.description[:100] if job else "general",
-            transcript=transcript_data,
-            questions_answers=qa_data,
-        )
+        return interview, {
+            "candidate_name": candidate.full_name if candidate else "Unknown",
+            "job_title": job.title if job else "Unknown",
+            "domain": job.description[:100] if job else "general",
+            "transcript": transcript_data,
+            "questions_answers": qa_data,
+            "tag": AICallTag(
+                interview_id=interview_id,
+                job_id=interview.job_id,
+                candidate_id=interview.candidate_id,
+            ),
+        }
 
+    async def _save_evaluation(self, interview: Interview, ai_result: dict) -> Evaluation:
         # Map recommendation
         rec_map = {
             "strongly_hire": AIRecommendation.STRONGLY_HIRE,
@@ -83,7 +84,7 @@ class EvaluationService:
         }
 
         evaluation = Evaluation(
-            interview_id=interview_id,
+            interview_id=interview.id,
             candidate_id=interview.candidate_id,
             communication_score=ai_result.get("communication_score", 5),
             technical_score=ai_result.get("technical_score", 5),
@@ -105,6 +106,34 @@ class EvaluationService:
         await self.db.refresh(evaluation)
         return evaluation
 
+    async def evaluate_interview(self, interview_id: int) -> Evaluation:
+        # Check if already evaluated
+        existing = await self.get_by_interview(interview_id)
+        if existing:
+            return existing  # Idempotent — return existing evaluation
+
+        interview, chain_input = await self._load_evaluation_input(interview_id)
+        ai_result = await run_evaluation(**chain_input)
+        return await self._save_evaluation(interview, ai_result)
+
+    async def stream_evaluate_interview(self, interview_id: int) -> AsyncGenerator[dict, None]:
+        """Evaluate an interview, yielding strengths and weaknesses as they are generated.
+
+        Ends with ``{"type": "done", "evaluation_id": ...}`` once the evaluation is saved.
+        """
+        existing = await self.get_by_interview(interview_id)
+        if existing:
+            yield {"type": "done", "evaluation_id": existing.id}
+            return
+
+        interview, chain_input = await self._load_evaluation_input(interview_id)
+        async for event in stream_evaluation(**chain_input):
+            if event["type"] == "item":
+                yield event
+            else:
+                evaluation = await self._save_evaluation(interview, event["value"])
+                yield {"type": "done", "evaluation_id": evaluation.id}
+
     async def get_evaluation(self, evaluation_id: int) -> Evaluation:
         result = await self.db.execute(
             select(Evaluation).where(Evaluation.id == evaluation_id)
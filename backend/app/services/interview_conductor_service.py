@@ -1,8 +1,9 @@
 """Interview conductor service — the heart of the application.
 Manages real-time AI interview conversations with Redis session state.
 """
-import json
+import asyncio
 import logging
+import os
 import secrets
 from datetime import datetime
 from typing import Optional, List
@@ -15,53 +16,134 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from app.core.config import settings
-from app.core.exceptions import NotFoundException, BadRequestException
+from app.core.redis import redis_pool
+from app.core.exceptions import NotFoundException, BadRequestException, ConflictException
 from app.models.interview import (
     Interview, InterviewQuestion, InterviewAnswer, InterviewTranscript,
-    InterviewStatus, SpeakerType, MessageType, AnswerMode,
+    InterviewStatus, InterviewType, SpeakerType, MessageType, AnswerMode,
 )
 from app.models.candidate import Candidate
 from app.models.job import JobDescription
+from app.ai.rate_governor import Priority
+from app.ai.usage import AICallTag
+from app.ai.voice.tts_handler import text_to_speech_file
 from app.ai.chains.interview_chain import (
     get_interview_greeting,
     get_interview_response,
     get_interview_closing,
+    get_interview_transition,
     stream_interview_response,
+    plan_history_compaction,
+    summarize_interview_history,
 )
 from app.services.question_generator_service import QuestionGeneratorService
 from app.services.notification_service import NotificationService
 from app.models.notification import NotificationType, NotificationChannel
 from app.core.security import get_password_hash
 from app.models.user import User
+from app.services.interview_session_store import InterviewSessionStore
+from app.services.transcript_journal import transcript_journal
+from app.services.turn_guard import turn_guard
+from app.services.turn_prefetcher import turn_prefetcher
 from app.tasks.email_tasks import send_interview_invite
 
+# History compactions still running; held so they are not garbage-collected mid-flight.
+_compaction_tasks: set[asyncio.Task] = set()
+
+
+def _compaction_done(task: asyncio.Task):
+    _compaction_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"History compaction failed: {task.exception()}")
+
 
 class InterviewConductorService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: Optional[aioredis.Redis] = None):
         self.db = db
-        self._redis: Optional[aioredis.Redis] = None
+        self._redis = redis
 
     async def _get_redis(self) -> aioredis.Redis:
         if self._redis is None:
-            self._redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+            self._redis = redis_pool.client
         return self._redis
 
-    def _session_key(self, interview_id: int) -> str:
-        return f"interview:session:{interview_id}"
-
-    async def _get_session(self, interview_id: int) -> dict:
-        r = await self._get_redis()
-        data = await r.get(self._session_key(interview_id))
-        if data:
-            return json.loads(data)
-        return {}
-
-    async def _save_session(self, interview_id: int, session: dict):
-        r = await self._get_redis()
-        await r.set(
-            self._session_key(interview_id),
-            json.dumps(session, default=str),
-            ex=7200,  # 2 hour expiry
+    async def _get_store(self) -> InterviewSessionStore:
+        return InterviewSessionStore(await self._get_redis())
+
+    async def get_session_history(self, interview_id: int) -> tuple[list[dict], int]:
+        """Full conversation and current question index of a live interview.
+
+        Messages trimmed from the stored history are rebuilt from the persisted transcript.
+        """
+        store = await self._get_store()
+        history, current_idx, offset = await store.load_history(interview_id)
+        if not offset:
+            return history, current_idx
+
+        try:
+            await transcript_journal.drain(interview_id)
+        except Exception:
+            # The trimmed head is the oldest part of the conversation, long since flushed.
+            logger.warning(f"Transcript journal drain failed for interview {interview_id}", exc_info=True)
+        result = await self.db.execute(
+            select(InterviewTranscript)
+            .where(
+                InterviewTranscript.interview_id == interview_id,
+                InterviewTranscript.speaker != SpeakerType.SYSTEM,
+            )
+            .order_by(InterviewTranscript.sequence_order)
+            .limit(offset)
+        )
+        head = [
+            {"role": "assistant" if t.speaker == SpeakerType.AI else "user", "content": t.content}
+            for t in result.scalars().all()
+        ]
+        return head + history, current_idx
+
+    @staticmethod
+    def _usage_tag(interview: Interview) -> AICallTag:
+        return AICallTag(
+            interview_id=interview.id,
+            job_id=interview.job_id,
+            candidate_id=interview.candidate_id,
+        )
+
+    def _schedule_compaction(self, interview_id: int, turn: dict, tag: Optional[AICallTag] = None):
+        """Compact in the background so the reply (and the turn lock) never wait on the summary call.
+
+        The summary is stored with a compare-and-set, so a compaction finishing after the next turn is harmless.
+        """
+        task = asyncio.get_running_loop().create_task(self._compact_history(interview_id, turn, tag))
+        _compaction_tasks.add(task)
+        task.add_done_callback(_compaction_done)
+
+    async def _compact_history(self, interview_id: int, turn: dict, tag: Optional[AICallTag] = None):
+        """Fold older turns into the rolling summary once the prompt tail exceeds its token budget."""
+        # turn["history"] is the unsummarized tail, so indexes here are relative to it.
+        history = turn["history"]
+        fold_upto = plan_history_compaction(
+            history,
+            0,
+            token_budget=settings.INTERVIEW_HISTORY_TOKEN_BUDGET,
+            keep_turns=settings.INTERVIEW_HISTORY_KEEP_TURNS,
+        )
+        if fold_upto is None:
+            return
+        try:
+            summary = await summarize_interview_history(
+                turn["history_summary"],
+                history[:fold_upto],
+                tag=tag,
+            )
+        except Exception:
+            logger.warning(f"History compaction failed for interview {interview_id}", exc_info=True)
+            return
+        store = await self._get_store()
+        await store.set_summary(
+            interview_id,
+            expected_count=turn["summarized_count"],
+            new_count=turn["summarized_count"] + fold_upto,
+            summary=summary,
         )
 
     async def create_interview(
@@ -105,12 +187,17 @@ class InterviewConductorService:
                 job_description=job.description or "",
                 experience_years=job.experience_min or 3,
                 num_questions=10,
+                tag=self._usage_tag(interview),
             )
+            questions = await qg_service.save_generated_questions(interview.id, questions_data)
         else:
-            questions_data = await qg_service.generate_for_job(
-                job_id, num_questions=10, candidate_resume=resume_text
+            questions = await qg_service.save_streamed_questions(
+                interview.id,
+                qg_service.stream_for_job(
+                    job_id, num_questions=10, candidate_resume=resume_text,
+                    tag=self._usage_tag(interview),
+                ),
             )
-        questions = await qg_service.save_generated_questions(interview.id, questions_data)
 
         interview.total_questions = len(questions)
         self.db.add(interview)
@@ -185,6 +272,82 @@ class InterviewConductorService:
 
         return interview
 
+    @staticmethod
+    def schedule_prerender(interview: Interview):
+        """Queue pre-rendering of the greeting and closing. Call once the interview is committed."""
+        if not settings.INTERVIEW_PRERENDER_ENABLED:
+            return
+        from app.tasks.interview_tasks import prerender_interview_messages_task
+        try:
+            prerender_interview_messages_task.delay(
+                interview.id,
+                with_audio=settings.INTERVIEW_PRERENDER_AUDIO and interview.interview_type != InterviewType.AI_CHAT,
+            )
+        except Exception:
+            logger.warning(f"Failed to dispatch pre-render task for interview {interview.id}", exc_info=True)
+
+    @staticmethod
+    def audio_dir(interview_id: int) -> str:
+        return os.path.join(settings.MEDIA_DIR, "interview_audio", str(interview_id))
+
+    @staticmethod
+    def _audio_ready(path: Optional[str]) -> bool:
+        return bool(path) and os.path.exists(path)
+
+    async def prerender_messages(self, interview_id: int, with_audio: bool = False) -> Interview:
+        """Generate and store the greeting and closing (and optionally their audio) ahead of time."""
+        result = await self.db.execute(select(Interview).where(Interview.id == interview_id))
+        interview = result.scalar_one_or_none()
+        if not interview:
+            raise NotFoundException(f"Interview {interview_id} not found")
+
+        c_result = await self.db.execute(select(Candidate).where(Candidate.id == interview.candidate_id))
+        candidate = c_result.scalar_one_or_none()
+        j_result = await self.db.execute(select(JobDescription).where(JobDescription.id == interview.job_id))
+        job = j_result.scalar_one_or_none()
+        candidate_name = candidate.full_name if candidate else "Candidate"
+        tag = self._usage_tag(interview)
+
+        if not interview.greeting_text:
+            interview.greeting_text = await get_interview_greeting(
+                candidate_name=candidate_name,
+                job_title=job.title if job else "the position",
+                domain=job.description[:100] if job else "general",
+                duration_min=interview.duration_limit_min,
+                tag=tag,
+                priority=Priority.BATCH,
+            )
+        if not interview.closing_text:
+            interview.closing_text = await get_interview_closing(candidate_name, tag=tag, priority=Priority.BATCH)
+
+        if with_audio:
+            audio_dir = self.audio_dir(interview_id)
+            if not self._audio_ready(interview.greeting_audio_path):
+                interview.greeting_audio_path = await text_to_speech_file(
+                    interview.greeting_text, os.path.join(audio_dir, "greeting.mp3"),
+                    tag=tag, priority=Priority.BATCH, cache=True,
+                )
+            if not self._audio_ready(interview.closing_audio_path):
+                interview.closing_audio_path = await text_to_speech_file(
+                    interview.closing_text, os.path.join(audio_dir, "closing.mp3"),
+                    tag=tag, priority=Priority.BATCH, cache=True,
+                )
+
+        interview.updated_at = datetime.utcnow()
+        self.db.add(interview)
+        await self.db.flush()
+        return interview
+
+    async def _closing_message(self, interview: Interview) -> str:
+        if interview.closing_text:
+            return interview.closing_text
+        c_result = await self.db.execute(select(Candidate).where(Candidate.id == interview.candidate_id))
+        candidate = c_result.scalar_one_or_none()
+        return await get_interview_closing(
+            candidate.full_name if candidate else "Candidate",
+            tag=self._usage_tag(interview),
+        )
+
     async def start_interview(self, interview_id: int) -> dict:
         result = await self.db.execute(
             select(Interview)
@@ -204,13 +367,16 @@ class InterviewConductorService:
         j_result = await self.db.execute(select(JobDescription).where(JobDescription.id == interview.job_id))
         job = j_result.scalar_one_or_none()
 
-        # Generate greeting
-        greeting = await get_interview_greeting(
-            candidate_name=candidate.full_name if candidate else "Candidate",
-            job_title=job.title if job else "the position",
-            domain=job.description[:100] if job else "general",
-            duration_min=interview.duration_limit_min,
-        )
+        # Serve the pre-rendered greeting; generate live only if it isn't ready
+        greeting = interview.greeting_text
+        if not greeting:
+            greeting = await get_interview_greeting(
+                candidate_name=candidate.full_name if candidate else "Candidate",
+                job_title=job.title if job else "the position",
+                domain=job.description[:100] if job else "general",
+                duration_min=interview.duration_limit_min,
+                tag=self._usage_tag(interview),
+            )
 
         # Update interview status
         interview.status = InterviewStatus.IN_PROGRESS
@@ -230,22 +396,25 @@ class InterviewConductorService:
 
         # Initialize session in Redis
         question_list = sorted(interview.questions, key=lambda q: q.question_order)
-        session = {
-            "interview_id": interview_id,
-            "current_question_index": 0,
-            "questions": [{"id": q.id, "text": q.question_text, "type": q.question_type} for q in question_list],
-            "conversation_history": [
-                {"role": "assistant", "content": greeting}
-            ],
-            "started_at": datetime.utcnow().isoformat(),
-            "sequence_counter": 2,
-            "candidate_resume": (candidate.resume_text[:2000] if candidate and candidate.resume_text else None),
-        }
-        await self._save_session(interview_id, session)
+        store = await self._get_store()
+        await store.create(
+            interview_id,
+            questions=[{"id": q.id, "text": q.question_text, "type": q.question_type} for q in question_list],
+            history=[{"role": "assistant", "content": greeting}],
+            started_at=datetime.utcnow().isoformat(),
+            sequence_counter=2,
+            candidate_resume=(candidate.resume_text[:2000] if candidate and candidate.resume_text else None),
+            job_title=job.title if job else None,
+        )
 
         return {
             "interview_id": interview_id,
             "greeting": greeting,
+            "greeting_audio_url": (
+                f"/api/v1/interviews/{interview_id}/audio/greeting"
+                if greeting == interview.greeting_text and self._audio_ready(interview.greeting_audio_path)
+                else None
+            ),
             "total_questions": interview.total_questions,
             "duration_limit_min": interview.duration_limit_min,
         }
@@ -255,9 +424,30 @@ class InterviewConductorService:
         interview_id: int,
         candidate_message: str,
         answer_mode: str = "text",
+        idempotency_key: Optional[str] = None,
+    ) -> dict:
+        """Run one turn of the interview under the interview's turn lock.
+
+        A repeated ``idempotency_key`` returns the earlier turn's response.
+        """
+        redis = await self._get_redis()
+        async with turn_guard.serialize(redis, interview_id):
+            cached = await turn_guard.cached(redis, interview_id, idempotency_key)
+            if cached:
+                return {**cached, "duplicate": True}
+            response = await self._process_turn(interview_id, candidate_message, answer_mode)
+            await turn_guard.remember(redis, interview_id, idempotency_key, response)
+            return response
+
+    async def _process_turn(
+        self,
+        interview_id: int,
+        candidate_message: str,
+        answer_mode: str,
     ) -> dict:
-        session = await self._get_session(interview_id)
-        if not session:
+        store = await self._get_store()
+        turn = await store.load_turn(interview_id)
+        if not turn:
             raise BadRequestException("Interview session not found. Start the interview first.")
 
         result = await self.db.execute(select(Interview).where(Interview.id == interview_id))
@@ -265,121 +455,131 @@ class InterviewConductorService:
         if not interview or interview.status != InterviewStatus.IN_PROGRESS:
             raise BadRequestException("Interview is not in progress.")
 
-        questions = session.get("questions", [])
-        current_idx = session.get("current_question_index", 0)
-        history = session.get("conversation_history", [])
-        seq = session.get("sequence_counter", 2)
+        question_count = turn["question_count"]
+        current_idx = turn["current_question_index"]
+        history = turn["history"]
+        seq = turn["sequence_counter"]
 
-        current_question = questions[current_idx]["text"] if current_idx < len(questions) else "General discussion"
-        questions_remaining = len(questions) - current_idx - 1
+        current_question = turn["current_question"]["text"] if turn["current_question"] else "General discussion"
+        questions_remaining = question_count - current_idx - 1
 
         # Calculate time remaining
-        started = datetime.fromisoformat(session["started_at"])
+        started = datetime.fromisoformat(turn["started_at"])
         elapsed = (datetime.utcnow() - started).total_seconds() / 60
         time_remaining = max(0, interview.duration_limit_min - elapsed)
 
-        # Save candidate message as transcript
-        candidate_transcript = InterviewTranscript(
-            interview_id=interview_id,
-            speaker=SpeakerType.CANDIDATE,
-            message_type=MessageType.TEXT,
-            content=candidate_message,
-            sequence_order=seq,
-        )
-        self.db.add(candidate_transcript)
-        seq += 1
-
-        # Save answer
-        if current_idx < len(questions):
-            answer = InterviewAnswer(
-                interview_id=interview_id,
-                question_id=questions[current_idx]["id"],
-                answer_text=candidate_message,
-                answer_mode=AnswerMode.TEXT if answer_mode == "text" else AnswerMode.VOICE,
-            )
-            self.db.add(answer)
+        # Candidate message and answer; persisted with the AI reply once the turn is accepted
+        turn_transcripts = [self._transcript_row(SpeakerType.CANDIDATE, candidate_message, seq)]
+        answer = None
+        if turn["current_question"]:
+            answer = {
+                "question_id": turn["current_question"]["id"],
+                "answer_text": candidate_message,
+                "answer_mode": (AnswerMode.TEXT if answer_mode == "text" else AnswerMode.VOICE).value,
+                "sequence_order": seq,
+                "answered_at": datetime.utcnow().isoformat(),
+            }
             interview.questions_asked = current_idx + 1
             self.db.add(interview)
+        seq += 1
 
         # Update conversation history
         history.append({"role": "user", "content": candidate_message})
 
         # Check if interview should end
-        if time_remaining <= 0 or current_idx >= len(questions) - 1:
-            c_result = await self.db.execute(select(Candidate).where(Candidate.id == interview.candidate_id))
-            candidate = c_result.scalar_one_or_none()
-            closing = await get_interview_closing(candidate.full_name if candidate else "Candidate")
+        if time_remaining <= 0 or current_idx >= question_count - 1:
+            closing = await self._closing_message(interview)
 
-            ai_transcript = InterviewTranscript(
-                interview_id=interview_id,
-                speaker=SpeakerType.AI,
-                message_type=MessageType.TEXT,
-                content=closing,
-                sequence_order=seq,
-            )
-            self.db.add(ai_transcript)
-            await self.db.flush()
+            turn_transcripts.append(self._transcript_row(SpeakerType.AI, closing, seq))
+            await self._record_turn(interview_id, turn_transcripts, answer)
 
             await self._end_interview(interview_id)
 
-            return {
+            response = {
                 "message": closing,
                 "is_complete": True,
                 "questions_asked": interview.questions_asked,
             }
+            if closing == interview.closing_text and self._audio_ready(interview.closing_audio_path):
+                # Server-side path; the voice socket sends these bytes instead of calling TTS.
+                response["audio_path"] = interview.closing_audio_path
+            return response
+
+        # Get AI response; a complete answer can take the speculative transition
+        candidate_resume = turn["candidate_resume"]
+        draft = await self._take_prefetch(interview_id, current_idx, candidate_message)
+        if draft:
+            ai_response = draft["text"]
+        else:
+            ai_response = await get_interview_response(
+                conversation_history=history,
+                current_question=current_question,
+                candidate_response=candidate_message,
+                questions_remaining=questions_remaining,
+                time_remaining_min=int(time_remaining),
+                candidate_resume=candidate_resume,
+                history_summary=turn["history_summary"],
+                job_title=turn["job_title"],
+                tag=self._usage_tag(interview),
+            )
 
-        # Get AI response
-        candidate_resume = session.get("candidate_resume")
-        ai_response = await get_interview_response(
-            conversation_history=history,
-            current_question=current_question,
-            candidate_response=candidate_message,
-            questions_remaining=questions_remaining,
-            time_remaining_min=int(time_remaining),
-            candidate_resume=candidate_resume,
-        )
-
-        # Save AI response transcript
-        ai_transcript = InterviewTranscript(
-            interview_id=interview_id,
-            speaker=SpeakerType.AI,
-            message_type=MessageType.TEXT,
-            content=ai_response,
-            sequence_order=seq,
-        )
-        self.db.add(ai_transcript)
+        turn_transcripts.append(self._transcript_row(SpeakerType.AI, ai_response, seq))
         seq += 1
 
         # Move to next question
         history.append({"role": "assistant", "content": ai_response})
-        session["current_question_index"] = current_idx + 1
-        session["conversation_history"] = history
-        session["sequence_counter"] = seq
-        await self._save_session(interview_id, session)
-
-        await self.db.flush()
+        await self._apply_turn(store, interview_id, current_idx, history[-2:], seq)
+        await self._record_turn(interview_id, turn_transcripts, answer)
+        # REST replies carry no audio, so the next draft is text only.
+        self._schedule_prefetch(interview, current_idx + 1)
+        self._schedule_compaction(interview_id, turn, tag=self._usage_tag(interview))
 
-        return {
+        response = {
             "message": ai_response,
             "is_complete": False,
             "question_number": current_idx + 2,
-            "total_questions": len(questions),
+            "total_questions": question_count,
             "time_remaining_min": int(time_remaining),
         }
+        return response
 
     async def stream_process_message(
         self,
         interview_id: int,
         candidate_message: str,
         answer_mode: str = "text",
+        idempotency_key: Optional[str] = None,
     ):
         """Process a candidate message and stream the AI response chunk by chunk.
 
         Yields dicts with type: stream_chunk (during streaming) and stream_end (final).
-        Also handles interview completion the same as process_message().
+        Also handles interview completion, turn locking and idempotency keys the same
+        as process_message(); a duplicate is replayed as one chunk and its stream_end.
         """
-        session = await self._get_session(interview_id)
-        if not session:
+        redis = await self._get_redis()
+        async with turn_guard.serialize(redis, interview_id):
+            cached = await turn_guard.cached(redis, interview_id, idempotency_key)
+            if cached:
+                message = cached.pop("message")
+                yield {"type": "stream_chunk", "content": message}
+                yield {"type": "stream_end", "content": message, **cached, "duplicate": True}
+                return
+            async for event in self._stream_turn(interview_id, candidate_message, answer_mode):
+                if event["type"] == "stream_end":
+                    # Stored in process_message()'s shape so either path can replay it.
+                    result = {k: v for k, v in event.items() if k not in ("type", "content")}
+                    await turn_guard.remember(redis, interview_id, idempotency_key, {"message": event["content"], **result})
+                yield event
+
+    async def _stream_turn(
+        self,
+        interview_id: int,
+        candidate_message: str,
+        answer_mode: str,
+    ):
+        store = await self._get_store()
+        turn = await store.load_turn(interview_id)
+        if not turn:
             raise BadRequestException("Interview session not found. Start the interview first.")
 
         result = await self.db.execute(select(Interview).where(Interview.id == interview_id))
@@ -387,114 +587,210 @@ class InterviewConductorService:
         if not interview or interview.status != InterviewStatus.IN_PROGRESS:
             raise BadRequestException("Interview is not in progress.")
 
-        questions = session.get("questions", [])
-        current_idx = session.get("current_question_index", 0)
-        history = session.get("conversation_history", [])
-        seq = session.get("sequence_counter", 2)
+        question_count = turn["question_count"]
+        current_idx = turn["current_question_index"]
+        history = turn["history"]
+        seq = turn["sequence_counter"]
 
-        current_question = questions[current_idx]["text"] if current_idx < len(questions) else "General discussion"
-        questions_remaining = len(questions) - current_idx - 1
+        current_question = turn["current_question"]["text"] if turn["current_question"] else "General discussion"
+        questions_remaining = question_count - current_idx - 1
 
         # Calculate time remaining
-        started = datetime.fromisoformat(session["started_at"])
+        started = datetime.fromisoformat(turn["started_at"])
         elapsed = (datetime.utcnow() - started).total_seconds() / 60
         time_remaining = max(0, interview.duration_limit_min - elapsed)
 
-        # Save candidate message as transcript
-        candidate_transcript = InterviewTranscript(
-            interview_id=interview_id,
-            speaker=SpeakerType.CANDIDATE,
-            message_type=MessageType.TEXT,
-            content=candidate_message,
-            sequence_order=seq,
-        )
-        self.db.add(candidate_transcript)
-        seq += 1
-
-        # Save answer
-        if current_idx < len(questions):
-            answer = InterviewAnswer(
-                interview_id=interview_id,
-                question_id=questions[current_idx]["id"],
-                answer_text=candidate_message,
-                answer_mode=AnswerMode.TEXT if answer_mode == "text" else AnswerMode.VOICE,
-            )
-            self.db.add(answer)
+        # Candidate message and answer; persisted with the AI reply once the turn is accepted
+        turn_transcripts = [self._transcript_row(SpeakerType.CANDIDATE, candidate_message, seq)]
+        answer = None
+        if turn["current_question"]:
+            answer = {
+                "question_id": turn["current_question"]["id"],
+                "answer_text": candidate_message,
+                "answer_mode": (AnswerMode.TEXT if answer_mode == "text" else AnswerMode.VOICE).value,
+                "sequence_order": seq,
+                "answered_at": datetime.utcnow().isoformat(),
+            }
             interview.questions_asked = current_idx + 1
             self.db.add(interview)
+        seq += 1
 
         # Update conversation history with candidate message
         history.append({"role": "user", "content": candidate_message})
 
         # Check if interview should end (time or questions exhausted)
-        if time_remaining <= 0 or current_idx >= len(questions) - 1:
-            c_result = await self.db.execute(select(Candidate).where(Candidate.id == interview.candidate_id))
-            candidate = c_result.scalar_one_or_none()
-            closing = await get_interview_closing(candidate.full_name if candidate else "Candidate")
+        if time_remaining <= 0 or current_idx >= question_count - 1:
+            closing = await self._closing_message(interview)
 
-            ai_transcript = InterviewTranscript(
-                interview_id=interview_id,
-                speaker=SpeakerType.AI,
-                message_type=MessageType.TEXT,
-                content=closing,
-                sequence_order=seq,
-            )
-            self.db.add(ai_transcript)
-            await self.db.flush()
+            turn_transcripts.append(self._transcript_row(SpeakerType.AI, closing, seq))
+            await self._record_turn(interview_id, turn_transcripts, answer)
 
             await self._end_interview(interview_id)
 
-            yield {
+            end = {
                 "type": "stream_end",
                 "content": closing,
                 "is_complete": True,
                 "questions_asked": interview.questions_asked,
             }
+            if answer_mode == "voice" and closing == interview.closing_text and self._audio_ready(interview.closing_audio_path):
+                # Server-side path; the voice socket sends these bytes instead of calling TTS.
+                end["audio_path"] = interview.closing_audio_path
+            yield end
             return
 
-        # Stream AI response
-        candidate_resume = session.get("candidate_resume")
+        # Stream AI response; a complete answer can take the speculative transition
+        candidate_resume = turn["candidate_resume"]
         full_response = ""
-        async for chunk in stream_interview_response(
-            conversation_history=history,
-            current_question=current_question,
-            candidate_response=candidate_message,
-            questions_remaining=questions_remaining,
-            time_remaining_min=int(time_remaining),
-            candidate_resume=candidate_resume,
-        ):
-            full_response += chunk
-            yield {"type": "stream_chunk", "content": chunk}
-
-        # Save full AI response as transcript
-        ai_transcript = InterviewTranscript(
-            interview_id=interview_id,
-            speaker=SpeakerType.AI,
-            message_type=MessageType.TEXT,
-            content=full_response,
-            sequence_order=seq,
-        )
-        self.db.add(ai_transcript)
+        draft = await self._take_prefetch(interview_id, current_idx, candidate_message)
+        if draft:
+            full_response = draft["text"]
+            chunk = {"type": "stream_chunk", "content": full_response}
+            if answer_mode == "voice" and draft.get("audio"):
+                # Rendered bytes; the draft's file is already deleted.
+                chunk["audio"] = draft["audio"]
+            yield chunk
+        else:
+            async for chunk in stream_interview_response(
+                conversation_history=history,
+                current_question=current_question,
+                candidate_response=candidate_message,
+                questions_remaining=questions_remaining,
+                time_remaining_min=int(time_remaining),
+                candidate_resume=candidate_resume,
+                history_summary=turn["history_summary"],
+                job_title=turn["job_title"],
+                tag=self._usage_tag(interview),
+            ):
+                full_response += chunk
+                yield {"type": "stream_chunk", "content": chunk}
+
+        turn_transcripts.append(self._transcript_row(SpeakerType.AI, full_response, seq))
         seq += 1
 
         # Update session state
         history.append({"role": "assistant", "content": full_response})
-        session["current_question_index"] = current_idx + 1
-        session["conversation_history"] = history
-        session["sequence_counter"] = seq
-        await self._save_session(interview_id, session)
-
-        await self.db.flush()
+        await self._apply_turn(store, interview_id, current_idx, history[-2:], seq)
+        await self._record_turn(interview_id, turn_transcripts, answer)
+        self._schedule_prefetch(interview, current_idx + 1, with_audio=answer_mode == "voice")
+        self._schedule_compaction(interview_id, turn, tag=self._usage_tag(interview))
 
         yield {
             "type": "stream_end",
             "content": full_response,
             "is_complete": False,
             "question_number": current_idx + 2,
-            "total_questions": len(questions),
+            "total_questions": question_count,
             "time_remaining_min": int(time_remaining),
         }
 
+    def _schedule_prefetch(self, interview: Interview, question_index: int, with_audio: bool = False):
+        if not settings.INTERVIEW_PREFETCH_ENABLED:
+            return
+        turn_prefetcher.schedule(
+            interview.id,
+            self._draft_transition(interview.id, question_index, self._usage_tag(interview), with_audio),
+        )
+
+    async def _draft_transition(
+        self,
+        interview_id: int,
+        question_index: int,
+        tag: AICallTag,
+        with_audio: bool,
+    ) -> Optional[dict]:
+        """Write the "move on" message for the answer to question ``question_index``."""
+        store = await self._get_store()
+        turn = await store.load_turn(interview_id)
+        if not turn or turn["current_question_index"] != question_index or not turn["current_question"]:
+            return None
+        next_question = await store.get_question(interview_id, question_index + 1)
+        if not next_question:
+            # That answer ends the interview with the closing message instead.
+            return None
+
+        text = await get_interview_transition(
+            conversation_history=turn["history"],
+            current_question=turn["current_question"]["text"],
+            next_question=next_question["text"],
+            questions_remaining=turn["question_count"] - question_index - 1,
+            candidate_resume=turn["candidate_resume"],
+            history_summary=turn["history_summary"],
+            job_title=turn["job_title"],
+            tag=tag,
+        )
+        audio_path = None
+        if with_audio:
+            audio_path = await text_to_speech_file(
+                text,
+                os.path.join(self.audio_dir(interview_id), f"turn_{question_index}.mp3"),
+                tag=tag,
+                priority=Priority.NORMAL,
+                cache=True,
+            )
+        return {"question_index": question_index, "text": text, "audio_path": audio_path}
+
+    async def _take_prefetch(self, interview_id: int, question_index: int, candidate_message: str) -> Optional[dict]:
+        if not settings.INTERVIEW_PREFETCH_ENABLED:
+            return None
+        try:
+            return await turn_prefetcher.take(await self._get_redis(), interview_id, question_index, candidate_message)
+        except aioredis.RedisError:
+            logger.warning(f"Prefetch lookup failed for interview {interview_id}", exc_info=True)
+            return None
+
+    @staticmethod
+    def _transcript_row(speaker: SpeakerType, content: str, sequence_order: int) -> dict:
+        return {
+            "speaker": speaker.value,
+            "message_type": MessageType.TEXT.value,
+            "content": content,
+            "sequence_order": sequence_order,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    async def _record_turn(self, interview_id: int, transcripts: list[dict], answer: Optional[dict]):
+        """Journal a turn's rows for write-behind insertion, or add them to this session as a fallback."""
+        if settings.INTERVIEW_JOURNAL_ENABLED:
+            try:
+                await transcript_journal.append(await self._get_redis(), interview_id, transcripts, answer)
+                return
+            except aioredis.RedisError:
+                logger.warning(f"Transcript journal unavailable for interview {interview_id}; writing directly", exc_info=True)
+        for t in transcripts:
+            self.db.add(InterviewTranscript(
+                interview_id=interview_id,
+                speaker=SpeakerType(t["speaker"]),
+                message_type=MessageType(t["message_type"]),
+                content=t["content"],
+                sequence_order=t["sequence_order"],
+                timestamp=datetime.fromisoformat(t["timestamp"]),
+            ))
+        if answer:
+            self.db.add(InterviewAnswer(
+                interview_id=interview_id,
+                question_id=answer["question_id"],
+                answer_text=answer["answer_text"],
+                answer_mode=AnswerMode(answer["answer_mode"]),
+                sequence_order=answer["sequence_order"],
+                answered_at=datetime.fromisoformat(answer["answered_at"]),
+            ))
+
+    @staticmethod
+    async def _apply_turn(
+        store: InterviewSessionStore,
+        interview_id: int,
+        expected_index: int,
+        messages: list[dict],
+        sequence_counter: int,
+    ):
+        applied = await store.apply_turn(interview_id, expected_index, messages, sequence_counter)
+        if applied is None:
+            raise BadRequestException("Interview session expired.")
+        if not applied:
+            # Raising rolls back this turn's transcript rows along with the request.
+            raise ConflictException("This question was already answered by another message.")
+
     async def _end_interview(self, interview_id: int):
         result = await self.db.execute(select(Interview).where(Interview.id == interview_id))
         interview = result.scalar_one_or_none()
@@ -504,9 +800,16 @@ class InterviewConductorService:
             self.db.add(interview)
             await self.db.flush()
 
-        # Clean up Redis session
-        r = await self._get_redis()
-        await r.delete(self._session_key(interview_id))
+        # Clean up Redis session and any speculative draft
+        store = await self._get_store()
+        await store.delete(interview_id)
+        await turn_prefetcher.discard(await self._get_redis(), interview_id)
+
+        # Persist journaled turns now; the evaluation task drains again and retries until this succeeds.
+        try:
+            await transcript_journal.drain(interview_id)
+        except Exception:
+            logger.warning(f"Transcript journal drain failed for interview {interview_id}", exc_info=True)
 
         # Trigger AI evaluation in background
         from app.tasks.evaluation_tasks import evaluate_interview_task
@@ -0,0 +1,184 @@
+"""Redis-backed live interview session state.
+
+Each interview keeps two keys:
+
+- ``interview:session:{id}`` — a hash of scalar fields (question index,
+  sequence counter, summary, resume excerpt, ...) plus one ``q:{n}`` field
+  per question, so a turn reads only the question it needs.
+- ``interview:session:{id}:history`` — the conversation as a list of JSON
+  messages. Messages already folded into the summary are trimmed once the
+  list exceeds ``INTERVIEW_SESSION_HISTORY_MAX``; ``history_offset`` counts
+  how many have been dropped from the head.
+
+Turns are applied by a Lua script that checks the question index the turn
+was computed from, so two concurrent messages can no longer overwrite each
+other's history.
+"""
+import json
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+# Returns {scalar fields..., current question} and the unsummarized history tail.
+_LOAD_TURN = """
+local idx = redis.call('HGET', KEYS[1], 'current_question_index')
+if not idx then return false end
+local fields = redis.call('HMGET', KEYS[1],
+    'current_question_index', 'question_count', 'sequence_counter', 'started_at',
+    'summarized_count', 'history_offset', 'history_summary', 'candidate_resume',
+    'job_title', 'q:' .. idx)
+local start = tonumber(fields[5]) - tonumber(fields[6])
+return {fields, redis.call('LRANGE', KEYS[2], start, -1)}
+"""
+
+# ARGV: expected index, ttl, history max, new sequence counter, messages...
+_APPLY_TURN = """
+local idx = redis.call('HGET', KEYS[1], 'current_question_index')
+if not idx then return -1 end
+idx = tonumber(idx)
+if idx ~= tonumber(ARGV[1]) then return 0 end
+for i = 5, #ARGV do
+    redis.call('RPUSH', KEYS[2], ARGV[i])
+end
+redis.call('HSET', KEYS[1], 'current_question_index', idx + 1, 'sequence_counter', ARGV[4])
+local summarized = tonumber(redis.call('HGET', KEYS[1], 'summarized_count'))
+    - tonumber(redis.call('HGET', KEYS[1], 'history_offset'))
+local drop = math.min(redis.call('LLEN', KEYS[2]) - tonumber(ARGV[3]), summarized)
+if drop > 0 then
+    redis.call('LTRIM', KEYS[2], drop, -1)
+    redis.call('HINCRBY', KEYS[1], 'history_offset', drop)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+
+# ARGV: expected summarized_count, new summarized_count, summary
+_SET_SUMMARY = """
+local current = redis.call('HGET', KEYS[1], 'summarized_count')
+if not current or tonumber(current) ~= tonumber(ARGV[1]) then return 0 end
+redis.call('HSET', KEYS[1], 'summarized_count', ARGV[2], 'history_summary', ARGV[3])
+return 1
+"""
+
+
+class InterviewSessionStore:
+    def __init__(self, redis: aioredis.Redis):
+        self.redis = redis
+        self._load_turn = redis.register_script(_LOAD_TURN)
+        self._apply_turn = redis.register_script(_APPLY_TURN)
+        self._set_summary = redis.register_script(_SET_SUMMARY)
+
+    @staticmethod
+    def _keys(interview_id: int) -> list[str]:
+        key = f"interview:session:{interview_id}"
+        return [key, f"{key}:history"]
+
+    async def create(
+        self,
+        interview_id: int,
+        questions: list[dict],
+        history: list[dict],
+        started_at: str,
+        sequence_counter: int,
+        candidate_resume: Optional[str] = None,
+        job_title: Optional[str] = None,
+    ):
+        hash_key, history_key = self._keys(interview_id)
+        fields = {
+            "current_question_index": 0,
+            "question_count": len(questions),
+            "sequence_counter": sequence_counter,
+            "started_at": started_at,
+            "summarized_count": 0,
+            "history_offset": 0,
+        }
+        if candidate_resume:
+            fields["candidate_resume"] = candidate_resume
+        if job_title:
+            fields["job_title"] = job_title
+        for i, question in enumerate(questions):
+            fields[f"q:{i}"] = json.dumps(question, default=str)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(hash_key, history_key)
+            pipe.hset(hash_key, mapping=fields)
+            if history:
+                pipe.rpush(history_key, *(json.dumps(m) for m in history))
+            pipe.expire(hash_key, settings.INTERVIEW_SESSION_TTL_SEC)
+            pipe.expire(history_key, settings.INTERVIEW_SESSION_TTL_SEC)
+            await pipe.execute()
+
+    async def load_turn(self, interview_id: int) -> Optional[dict]:
+        """Everything a turn needs, in one round trip. ``history`` is the unsummarized tail."""
+        raw = await self._load_turn(keys=self._keys(interview_id))
+        if not raw:
+            return None
+        fields, history = raw
+        (idx, count, seq, started_at, summarized, offset,
+         summary, resume, job_title, question) = fields
+        return {
+            "current_question_index": int(idx),
+            "question_count": int(count),
+            "current_question": json.loads(question) if question else None,
+            "sequence_counter": int(seq),
+            "started_at": started_at,
+            "summarized_count": int(summarized),
+            "history_offset": int(offset),
+            "history_summary": summary,
+            "candidate_resume": resume,
+            "job_title": job_title,
+            "history": [json.loads(m) for m in history],
+        }
+
+    async def get_question(self, interview_id: int, index: int) -> Optional[dict]:
+        data = await self.redis.hget(self._keys(interview_id)[0], f"q:{index}")
+        return json.loads(data) if data else None
+
+    async def load_history(self, interview_id: int) -> tuple[list[dict], int, int]:
+        """Stored conversation, current question index and how many messages were trimmed from its head."""
+        hash_key, history_key = self._keys(interview_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lrange(history_key, 0, -1)
+            pipe.hmget(hash_key, "current_question_index", "history_offset")
+            history, (idx, offset) = await pipe.execute()
+        return [json.loads(m) for m in history], int(idx or 0), int(offset or 0)
+
+    async def apply_turn(
+        self,
+        interview_id: int,
+        expected_index: int,
+        messages: list[dict],
+        sequence_counter: int,
+    ) -> Optional[bool]:
+        """Append a turn and advance the question index.
+
+        Returns False if another turn already advanced the index, None if
+        the session no longer exists.
+        """
+        status = await self._apply_turn(
+            keys=self._keys(interview_id),
+            args=[
+                expected_index,
+                settings.INTERVIEW_SESSION_TTL_SEC,
+                settings.INTERVIEW_SESSION_HISTORY_MAX,
+                sequence_counter,
+                *(json.dumps(m) for m in messages),
+            ],
+        )
+        if status == -1:
+            return None
+        return status == 1
+
+    async def set_summary(self, interview_id: int, expected_count: int, new_count: int, summary: str) -> bool:
+        """Store a rolling summary unless another compaction got there first."""
+        status = await self._set_summary(
+            keys=self._keys(interview_id)[:1],
+            args=[expected_count, new_count, summary],
+        )
+        return status == 1
+
+    async def delete(self, interview_id: int):
+        await self.redis.delete(*self._keys(interview_id))
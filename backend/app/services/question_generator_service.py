@@ -1,7 +1,7 @@
 """Question generation service."""
 import logging
 import random
-from typing import List, Optional
+from typing import AsyncGenerator, AsyncIterable, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func
@@ -11,7 +11,8 @@ from app.core.exceptions import NotFoundException
 from app.models.domain import Domain, QuestionBank
 from app.models.job import JobDescription
 from app.models.interview import InterviewQuestion
-from app.ai.chains.question_chain import generate_interview_questions
+from app.ai.chains.question_chain import generate_interview_questions, stream_interview_questions
+from app.ai.usage import AICallTag
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +42,14 @@ class QuestionGeneratorService:
             for q in rows
         ]
 
-    async def generate_for_job(
+    async def stream_for_job(
         self,
         job_id: int,
         num_questions: int = 10,
         candidate_resume: Optional[str] = None,
-    ) -> List[dict]:
+        tag: Optional[AICallTag] = None,
+    ) -> AsyncGenerator[dict, None]:
+        """Yield questions as the AI generates them, topping up from the question bank on failure."""
         result = await self.db.execute(select(JobDescription).where(JobDescription.id == job_id))
         job = result.scalar_one_or_none()
         if not job:
@@ -62,6 +65,7 @@ class QuestionGeneratorService:
                 sector_name = domain.sector
 
         # Try AI generation first, fall back to question bank
+        produced = 0
         try:
             existing = []
             if job.domain_id:
@@ -72,7 +76,7 @@ class QuestionGeneratorService:
                 )
                 existing = [row[0] for row in result.all()]
 
-            questions = await generate_interview_questions(
+            async for question in stream_interview_questions(
                 domain=domain_name,
                 sector=sector_name,
                 job_title=job.title,
@@ -81,13 +85,27 @@ class QuestionGeneratorService:
                 num_questions=num_questions,
                 existing_questions=existing,
                 candidate_resume=candidate_resume,
-            )
-            return questions
+                tag=tag,
+            ):
+                produced += 1
+                yield question
         except Exception as e:
-            logger.warning("AI question generation failed, using question bank: %s", e)
+            logger.warning("AI question generation failed after %d questions, using question bank: %s", produced, e)
             if candidate_resume:
                 logger.info("Resume was provided but AI generation failed; falling back to question bank")
-            return await self._fallback_from_question_bank(job.domain_id, num_questions)
+            for question in await self._fallback_from_question_bank(job.domain_id, num_questions - produced):
+                yield question
+
+    async def generate_for_job(
+        self,
+        job_id: int,
+        num_questions: int = 10,
+        candidate_resume: Optional[str] = None,
+        tag: Optional[AICallTag] = None,
+    ) -> List[dict]:
+        return [
+            q async for q in self.stream_for_job(job_id, num_questions, candidate_resume, tag)
+        ]
 
     async def generate_for_domain(
         self,
@@ -96,6 +114,7 @@ class QuestionGeneratorService:
         job_description: str,
         experience_years: int = 3,
         num_questions: int = 10,
+        tag: Optional[AICallTag] = None,
     ) -> List[dict]:
         result = await self.db.execute(select(Domain).where(Domain.id == domain_id))
         domain = result.scalar_one_or_none()
@@ -117,6 +136,7 @@ class QuestionGeneratorService:
             experience_years=experience_years,
             num_questions=num_questions,
             existing_questions=existing,
+            tag=tag,
         )
 
     async def save_generated_questions(
@@ -141,3 +161,29 @@ class QuestionGeneratorService:
         for iq in saved:
             await self.db.refresh(iq)
         return saved
+
+    async def save_streamed_questions(
+        self,
+        interview_id: int,
+        questions: AsyncIterable[dict],
+    ) -> List[InterviewQuestion]:
+        """Persist questions one by one as a generation stream produces them."""
+        saved = []
+        async for q in questions:
+            iq = InterviewQuestion(
+                interview_id=interview_id,
+                question_text=q.get("question_text", ""),
+                question_type=q.get("question_type", "technical"),
+                difficulty=q.get("difficulty", "medium"),
+                question_order=len(saved) + 1,
+                expected_answer=q.get("expected_answer"),
+                keywords={"keywords": q.get("keywords", [])},
+            )
+            self.db.add(iq)
+            # Awaited in order; generation itself does not pause (tokens buffer on the socket),
+            # so once the stream ends only the last question's insert is left to wait for.
+            await self.db.flush()
+            saved.append(iq)
+        for iq in saved:
+            await self.db.refresh(iq)
+        return saved
@@ -0,0 +1,209 @@
+"""Transcription of uploaded interview recordings.
+
+A recording is planned into chunks once, as rows of
+``interview_recording_segments``. Every chunk not yet done is then
+transcribed, ``RECORDING_TRANSCRIBE_CONCURRENCY`` at a time, and each result
+is committed as soon as it arrives, so a run that dies midway is resumed by
+the next one from the chunks still pending. When no chunk is left to retry,
+the chunks are stitched: overlapping words are removed and each chunk is
+linked to the conversation turn that was live when it starts.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.ai.openai_client import ai_client
+from app.ai.rate_governor import Priority
+from app.ai.usage import AICallTag, tag_for
+from app.ai.voice.recording_chunker import (
+    detect_silences,
+    extract_chunk,
+    plan_chunks,
+    probe_duration,
+    remove_overlap,
+)
+from app.core.config import settings
+from app.core.exceptions import NotFoundException
+from app.models.interview import (
+    Interview, InterviewRecordingSegment, InterviewTranscript, RecordingSegmentStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingTranscriptionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        # Chunks are transcribed concurrently but share this session; writes take turns.
+        self._write_lock = asyncio.Lock()
+
+    async def _get_interview(self, interview_id: int) -> Interview:
+        result = await self.db.execute(select(Interview).where(Interview.id == interview_id))
+        interview = result.scalar_one_or_none()
+        if not interview:
+            raise NotFoundException("Interview not found")
+        return interview
+
+    async def _segments(self, recording_path: str) -> list[InterviewRecordingSegment]:
+        result = await self.db.execute(
+            select(InterviewRecordingSegment)
+            .where(InterviewRecordingSegment.recording_path == recording_path)
+            .order_by(InterviewRecordingSegment.chunk_index)
+        )
+        return list(result.scalars().all())
+
+    async def plan(self, interview_id: int, recording_path: str) -> list[InterviewRecordingSegment]:
+        """Chunk rows for the recording, creating them on the first run."""
+        segments = await self._segments(recording_path)
+        if segments:
+            return segments
+
+        # A new upload replaces the transcript of the previous one.
+        await self.db.execute(
+            delete(InterviewRecordingSegment).where(
+                InterviewRecordingSegment.interview_id == interview_id,
+                InterviewRecordingSegment.recording_path != recording_path,
+            )
+        )
+        duration = await probe_duration(recording_path)
+        spans = plan_chunks(duration, await detect_silences(recording_path), settings.RECORDING_CHUNK_SEC)
+        segments = [
+            InterviewRecordingSegment(
+                interview_id=interview_id,
+                recording_path=recording_path,
+                chunk_index=i,
+                start_sec=round(start, 3),
+                end_sec=round(end, 3),
+            )
+            for i, (start, end) in enumerate(spans)
+        ]
+        self.db.add_all(segments)
+        await self.db.commit()
+        logger.info(f"Recording for interview {interview_id}: {duration:.0f}s in {len(segments)} chunks")
+        return segments
+
+    async def _transcribe_chunk(
+        self, segment: InterviewRecordingSegment, language: str, tag: AICallTag, semaphore: asyncio.Semaphore,
+    ):
+        text = None
+        async with semaphore:
+            try:
+                audio = await extract_chunk(segment.recording_path, segment.start_sec, segment.end_sec)
+                text = await ai_client.transcribe_audio(
+                    audio_bytes=audio,
+                    language=language,
+                    filename=f"chunk_{segment.chunk_index}.ogg",
+                    priority=Priority.BATCH,
+                    tag=tag_for("stt", tag),
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Recording chunk {segment.chunk_index} of interview {segment.interview_id} failed: {e}"
+                )
+
+        async with self._write_lock:
+            segment.attempts += 1
+            segment.status = RecordingSegmentStatus.FAILED if text is None else RecordingSegmentStatus.DONE
+            segment.text = text.strip() if text is not None else None
+            segment.updated_at = datetime.utcnow()
+            self.db.add(segment)
+            await self.db.commit()
+
+    async def transcribe_pending(self, interview: Interview, segments: list[InterviewRecordingSegment]) -> int:
+        """Transcribe every chunk still worth trying; returns how many are left to retry."""
+        todo = [
+            s for s in segments
+            if s.status != RecordingSegmentStatus.DONE and s.attempts < settings.RECORDING_CHUNK_MAX_ATTEMPTS
+        ]
+        tag = AICallTag(interview_id=interview.id, job_id=interview.job_id, candidate_id=interview.candidate_id)
+        semaphore = asyncio.Semaphore(settings.RECORDING_TRANSCRIBE_CONCURRENCY)
+        await asyncio.gather(*(self._transcribe_chunk(s, interview.language, tag, semaphore) for s in todo))
+        return sum(
+            1 for s in todo
+            if s.status != RecordingSegmentStatus.DONE and s.attempts < settings.RECORDING_CHUNK_MAX_ATTEMPTS
+        )
+
+    @staticmethod
+    def _live_turn(turns: list[InterviewTranscript], started_at: Optional[datetime], offset_sec: float) -> Optional[int]:
+        """Id of the last conversation turn recorded before ``offset_sec`` into the recording."""
+        if not turns or started_at is None:
+            return None
+        at = started_at + timedelta(seconds=offset_sec)
+        live = turns[0]
+        for turn in turns:
+            if turn.timestamp > at:
+                break
+            live = turn
+        return live.id
+
+    async def stitch(self, interview: Interview, segments: list[InterviewRecordingSegment]):
+        result = await self.db.execute(
+            select(InterviewTranscript)
+            .where(InterviewTranscript.interview_id == interview.id)
+            .order_by(InterviewTranscript.timestamp, InterviewTranscript.sequence_order)
+        )
+        turns = list(result.scalars().all())
+
+        previous = ""
+        for segment in segments:
+            if segment.status != RecordingSegmentStatus.DONE:
+                # A chunk that never transcribed leaves a gap; nothing to de-duplicate against.
+                previous = ""
+                continue
+            segment.aligned_text = remove_overlap(previous, segment.text or "")
+            segment.transcript_id = self._live_turn(turns, interview.started_at, segment.start_sec)
+            segment.updated_at = datetime.utcnow()
+            self.db.add(segment)
+            previous = segment.text or ""
+        await self.db.commit()
+
+    async def transcribe(self, interview_id: int, recording_path: str) -> dict:
+        """Plan, transcribe and stitch; safe to call again after a crash or partial failure.
+
+        Raises RuntimeError while some chunks failed but can still be retried.
+        """
+        interview = await self._get_interview(interview_id)
+        segments = await self.plan(interview_id, recording_path)
+        retryable = await self.transcribe_pending(interview, segments)
+        if retryable:
+            raise RuntimeError(f"{retryable} recording chunk(s) failed and will be retried")
+        await self.stitch(interview, segments)
+        failed = sum(1 for s in segments if s.status != RecordingSegmentStatus.DONE)
+        return {"chunks": len(segments), "failed": failed}
+
+    async def get_transcript(self, interview_id: int) -> dict:
+        interview = await self._get_interview(interview_id)
+        segments = await self._segments(interview.recording_url) if interview.recording_url else []
+        done = [s for s in segments if s.status == RecordingSegmentStatus.DONE]
+        settled = [
+            s for s in segments
+            if s.status == RecordingSegmentStatus.DONE or s.attempts >= settings.RECORDING_CHUNK_MAX_ATTEMPTS
+        ]
+        if not segments:
+            status = "not_started"
+        elif len(settled) < len(segments) or any(s.aligned_text is None for s in done):
+            status = "processing"
+        else:
+            status = "completed" if len(done) == len(segments) else "partial"
+        return {
+            "interview_id": interview_id,
+            "status": status,
+            "chunks": len(segments),
+            "chunks_done": len(done),
+            "text": " ".join(s.aligned_text for s in done if s.aligned_text),
+            "segments": [
+                {
+                    "chunk_index": s.chunk_index,
+                    "start_sec": s.start_sec,
+                    "end_sec": s.end_sec,
+                    "text": s.aligned_text,
+                    "transcript_id": s.transcript_id,
+                }
+                for s in done
+            ],
+        }
@@ -9,6 +9,7 @@ from app.models.candidate import Candidate
 from app.models.job import JobDescription
 from app.models.resume_screening import ResumeScreening, ScreeningRecommendation
 from app.ai.chains.screening_chain import run_resume_screening
+from app.ai.usage import AICallTag
 
 
 class ScreeningService:
@@ -40,6 +41,7 @@ class ScreeningService:
             experience_min=job.experience_min,
             experience_max=job.experience_max,
             education_level=getattr(job, 'education_level', '') or "",
+            tag=AICallTag(candidate_id=candidate_id, job_id=job_id),
         )
 
         # Map recommendation
@@ -0,0 +1,80 @@
+"""Replay buffer for streamed interview responses.
+
+Every event of the response being streamed is also appended to a Redis
+stream, ``interview:reply:{interview_id}``, tagged with the response's
+``message_id`` and, for chunks, the character ``offset`` of the chunk in
+the full response. The buffer holds only the latest response and expires
+``WS_REPLAY_TTL_SEC`` after its last event. A client that reconnects
+mid-response sends the message id and how many characters it received;
+``replay`` yields the rest, then follows the live stream until it ends,
+whichever worker is producing it.
+"""
+import json
+import time
+import uuid
+from typing import AsyncIterator
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+_TERMINAL = ("stream_end", "error")
+
+
+def _key(interview_id: int) -> str:
+    return f"interview:reply:{interview_id}"
+
+
+class ReplayBuffer:
+    def __init__(self, redis: aioredis.Redis, interview_id: int, message_id: str = ""):
+        self.redis = redis
+        self.interview_id = interview_id
+        self.message_id = message_id or uuid.uuid4().hex
+        self.offset = 0
+
+    async def reset(self):
+        await self.redis.delete(_key(self.interview_id))
+
+    def tag(self, event: dict) -> dict:
+        """Stamp the message id and, for chunks, the chunk's offset."""
+        event = {**event, "message_id": self.message_id}
+        if event.get("type") == "stream_chunk":
+            event["offset"] = self.offset
+            self.offset += len(event["content"])
+        return event
+
+    async def append(self, event: dict):
+        key = _key(self.interview_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {"event": json.dumps(event)})
+            pipe.expire(key, settings.WS_REPLAY_TTL_SEC)
+            await pipe.execute()
+
+    async def replay(self, offset: int) -> AsyncIterator[dict]:
+        """Yield the response from character ``offset``, following it live until it ends."""
+        key = _key(self.interview_id)
+        last_id = "0-0"
+        deadline = time.monotonic() + settings.WS_REPLAY_WAIT_SEC
+        while time.monotonic() < deadline:
+            result = await self.redis.xread({key: last_id}, count=100, block=1000)
+            if not result:
+                if not await self.redis.exists(key):
+                    break
+                continue
+            for entry_id, fields in result[0][1]:
+                last_id = entry_id
+                event = json.loads(fields["event"])
+                if event.get("message_id") != self.message_id:
+                    # A newer response replaced the buffer.
+                    yield {"type": "stream_unavailable", "message_id": self.message_id}
+                    return
+                if event["type"] == "stream_chunk":
+                    start = event["offset"]
+                    if start + len(event["content"]) <= offset:
+                        continue
+                    if start < offset:
+                        event = {**event, "content": event["content"][offset - start:], "offset": offset}
+                yield event
+                if event["type"] in _TERMINAL:
+                    return
+        yield {"type": "stream_unavailable", "message_id": self.message_id}
@@ -0,0 +1,162 @@
+"""Write-behind journal for interview turn transcripts.
+
+A turn's transcript rows and answer are appended to a per-interview Redis
+stream as soon as the turn is accepted; a background task batch-inserts
+them into Postgres. Rows are keyed by ``(interview_id, sequence_order)``
+and inserted with ``ON CONFLICT DO NOTHING``, so replaying an entry after
+a crash, or two workers flushing the same stream, never duplicates rows.
+Ending an interview drains its stream before evaluation is dispatched,
+and streams left behind by a stopped process are picked up on the next
+flush because their interview ids stay in the active set until empty.
+"""
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Optional
+
+import redis.asyncio as aioredis
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.core.redis import redis_pool
+from app.models.interview import AnswerMode, InterviewAnswer, InterviewTranscript, MessageType, SpeakerType
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_KEY = "interview:journal:active"
+
+
+def _stream_key(interview_id: int) -> str:
+    return f"interview:journal:{interview_id}"
+
+
+class TranscriptJournal:
+    def __init__(self):
+        self._flusher: Optional[asyncio.Task] = None
+        self.appended = 0
+        self.written = 0
+        self.failed_flushes = 0
+
+    async def append(
+        self,
+        redis: aioredis.Redis,
+        interview_id: int,
+        transcripts: list[dict],
+        answer: Optional[dict] = None,
+    ):
+        """Journal one turn. ``transcripts`` and ``answer`` hold InterviewTranscript/InterviewAnswer fields."""
+        entry = json.dumps({"transcripts": transcripts, "answer": answer}, default=str)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(_stream_key(interview_id), {"turn": entry})
+            pipe.sadd(ACTIVE_KEY, interview_id)
+            await pipe.execute()
+        self.appended += 1
+
+    @staticmethod
+    def _rows(interview_id: int, turns: list[dict]) -> tuple[list[dict], list[dict]]:
+        transcripts, answers = [], []
+        for turn in turns:
+            for t in turn["transcripts"]:
+                timestamp = datetime.fromisoformat(t["timestamp"])
+                transcripts.append({
+                    "interview_id": interview_id,
+                    "speaker": SpeakerType(t["speaker"]),
+                    "message_type": MessageType(t.get("message_type", MessageType.TEXT.value)),
+                    "content": t["content"],
+                    "sequence_order": t["sequence_order"],
+                    "timestamp": timestamp,
+                    "created_at": timestamp,
+                })
+            answer = turn.get("answer")
+            if answer:
+                answered_at = datetime.fromisoformat(answer["answered_at"])
+                answers.append({
+                    "interview_id": interview_id,
+                    "question_id": answer["question_id"],
+                    "answer_text": answer["answer_text"],
+                    "answer_mode": AnswerMode(answer["answer_mode"]),
+                    "sequence_order": answer["sequence_order"],
+                    "answered_at": answered_at,
+                    "created_at": answered_at,
+                })
+        return transcripts, answers
+
+    async def _write(self, interview_id: int, turns: list[dict]):
+        from app.core.database import async_session
+
+        transcripts, answers = self._rows(interview_id, turns)
+        async with async_session() as session:
+            if transcripts:
+                await session.execute(
+                    pg_insert(InterviewTranscript)
+                    .values(transcripts)
+                    .on_conflict_do_nothing(index_elements=["interview_id", "sequence_order"])
+                )
+            if answers:
+                await session.execute(
+                    pg_insert(InterviewAnswer)
+                    .values(answers)
+                    .on_conflict_do_nothing(index_elements=["interview_id", "sequence_order"])
+                )
+            await session.commit()
+
+    async def drain(self, interview_id: int) -> int:
+        """Persist every journaled turn of one interview. Returns the number of turns written."""
+        redis = redis_pool.client
+        key = _stream_key(interview_id)
+        written = 0
+        while True:
+            entries = await redis.xrange(key, count=settings.INTERVIEW_JOURNAL_BATCH_SIZE)
+            if not entries:
+                break
+            await self._write(interview_id, [json.loads(fields["turn"]) for _, fields in entries])
+            await redis.xdel(key, *(entry_id for entry_id, _ in entries))
+            written += len(entries)
+        self.written += written
+
+        await redis.srem(ACTIVE_KEY, interview_id)
+        # A turn may have been appended between the last XRANGE and SREM.
+        if await redis.xlen(key):
+            await redis.sadd(ACTIVE_KEY, interview_id)
+        return written
+
+    async def flush(self):
+        try:
+            interview_ids = await redis_pool.client.smembers(ACTIVE_KEY)
+        except aioredis.RedisError:
+            self.failed_flushes += 1
+            logger.warning("Failed to read the transcript journal index", exc_info=True)
+            return
+        for interview_id in interview_ids:
+            try:
+                await self.drain(int(interview_id))
+            except Exception:
+                # Entries stay in the stream and are retried on the next flush.
+                self.failed_flushes += 1
+                logger.warning(f"Failed to flush transcript journal for interview {interview_id}", exc_info=True)
+
+    async def _run(self):
+        while True:
+            await self.flush()
+            await asyncio.sleep(settings.INTERVIEW_JOURNAL_FLUSH_INTERVAL_SEC)
+
+    def start(self):
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "appended": self.appended,
+            "written": self.written,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+transcript_journal = TranscriptJournal()
@@ -0,0 +1,94 @@
+"""Serialization and duplicate suppression for interview turns.
+
+Only one turn per interview runs at a time, across every worker: the turn
+holds ``interview:turn-lock:{interview_id}`` in Redis and a second message
+(a double-send, or the REST and WebSocket paths racing) waits for it. A
+client may tag a message with an idempotency key; the turn's result is kept
+under ``interview:turn-result:{interview_id}:{key}`` and a repeat of the key
+gets that result back instead of another completion.
+"""
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import LockError
+
+from app.core.config import settings
+from app.core.exceptions import ConflictException
+
+logger = logging.getLogger(__name__)
+
+
+def _lock_key(interview_id: int) -> str:
+    return f"interview:turn-lock:{interview_id}"
+
+
+def _result_key(interview_id: int, idempotency_key: str) -> str:
+    return f"interview:turn-result:{interview_id}:{idempotency_key}"
+
+
+class TurnGuard:
+    def __init__(self):
+        self.turns = 0
+        self.waited = 0
+        self.timeouts = 0
+        self.lock_expired = 0
+        self.replayed = 0
+
+    @asynccontextmanager
+    async def serialize(self, redis: aioredis.Redis, interview_id: int) -> AsyncIterator[None]:
+        """Hold the interview's turn lock, waiting up to ``INTERVIEW_TURN_LOCK_WAIT_SEC`` for it."""
+        lock = redis.lock(
+            _lock_key(interview_id),
+            timeout=settings.INTERVIEW_TURN_LOCK_TIMEOUT_SEC,
+            sleep=0.05,
+            blocking_timeout=settings.INTERVIEW_TURN_LOCK_WAIT_SEC,
+        )
+        if not await lock.acquire(blocking=False):
+            self.waited += 1
+            if not await lock.acquire():
+                self.timeouts += 1
+                raise ConflictException("Another message for this interview is still being processed.")
+        self.turns += 1
+        try:
+            yield
+        finally:
+            try:
+                await lock.release()
+            except LockError:
+                # The turn outlived the lock timeout; another turn may already hold it.
+                self.lock_expired += 1
+                logger.warning(f"Turn lock for interview {interview_id} expired before release")
+
+    async def cached(self, redis: aioredis.Redis, interview_id: int, idempotency_key: Optional[str]) -> Optional[dict]:
+        """Return the stored result of an earlier turn with this key, if any."""
+        if not idempotency_key:
+            return None
+        data = await redis.get(_result_key(interview_id, idempotency_key))
+        if data is None:
+            return None
+        self.replayed += 1
+        return json.loads(data)
+
+    async def remember(self, redis: aioredis.Redis, interview_id: int, idempotency_key: Optional[str], result: dict):
+        if not idempotency_key:
+            return
+        await redis.set(
+            _result_key(interview_id, idempotency_key),
+            json.dumps(result),
+            ex=settings.INTERVIEW_IDEMPOTENCY_TTL_SEC,
+        )
+
+    def stats(self) -> dict:
+        return {
+            "turns": self.turns,
+            "waited": self.waited,
+            "lock_timeouts": self.timeouts,
+            "lock_expired": self.lock_expired,
+            "duplicates_replayed": self.replayed,
+        }
+
+
+turn_guard = TurnGuard()
@@ -0,0 +1,159 @@
+"""Speculative "move on" messages for interview turns.
+
+As soon as the interviewer's message for question N is sent, a background
+task drafts the transition into question N+1 (and its TTS audio for voice
+answers) and parks it in Redis. When the candidate's answer to N arrives
+and looks complete, the turn uses the draft instead of waiting for a full
+completion; otherwise the draft is discarded and the live chain runs.
+
+Draft audio is a file under the interview's private media directory. It is
+removed whichever way the draft goes: read into memory when the draft is
+used, deleted when it is discarded or drafted for another question.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+from typing import Awaitable, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Answers that ask for help rather than answer the question.
+_CLARIFICATION = re.compile(
+    r"\b(repeat|rephrase|clarify|what do you mean|didn'?t (understand|catch)|not sure what)\b",
+    re.IGNORECASE,
+)
+
+
+def judge_answer_complete(answer: str) -> bool:
+    """Cheap check for whether an answer is likely to get a transition rather than a follow-up."""
+    text = answer.strip()
+    if len(text.split()) < settings.INTERVIEW_PREFETCH_MIN_ANSWER_WORDS:
+        return False
+    return not text.endswith("?") and not _CLARIFICATION.search(text)
+
+
+def _key(interview_id: int) -> str:
+    return f"interview:prefetch:{interview_id}"
+
+
+def _claim_audio(path: str) -> Optional[bytes]:
+    """Read a draft's audio and delete the file; None if it is gone."""
+    try:
+        with open(path, "rb") as f:
+            audio = f.read()
+    except OSError:
+        return None
+    _remove_audio(path)
+    return audio
+
+
+def _remove_audio(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class TurnPrefetcher:
+    def __init__(self):
+        self._tasks: dict[int, asyncio.Task] = {}
+        self.scheduled = 0
+        self.hits = 0
+        self.discarded = 0
+        self.not_ready = 0
+        self.cancelled = 0
+        self.failed = 0
+
+    def schedule(self, interview_id: int, draft: Awaitable[Optional[dict]]):
+        """Run ``draft`` in the background, replacing any pending draft for the interview.
+
+        ``draft`` resolves to ``{"question_index", "text", "audio_path"}`` or None.
+        """
+        self._cancel(interview_id)
+        task = asyncio.get_running_loop().create_task(self._run(interview_id, draft))
+        self._tasks[interview_id] = task
+        task.add_done_callback(lambda t: self._forget(interview_id, t))
+        self.scheduled += 1
+
+    def _forget(self, interview_id: int, task: asyncio.Task):
+        if self._tasks.get(interview_id) is task:
+            del self._tasks[interview_id]
+
+    async def _run(self, interview_id: int, draft: Awaitable[Optional[dict]]):
+        from app.core.redis import redis_pool
+
+        try:
+            result = await draft
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed += 1
+            logger.warning(f"Speculative turn draft failed for interview {interview_id}", exc_info=True)
+            return
+        if result:
+            await redis_pool.client.set(_key(interview_id), json.dumps(result), ex=settings.INTERVIEW_PREFETCH_TTL_SEC)
+
+    def _cancel(self, interview_id: int):
+        task = self._tasks.pop(interview_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+            self.cancelled += 1
+
+    async def take(self, redis: aioredis.Redis, interview_id: int, question_index: int, answer: str) -> Optional[dict]:
+        """Return the draft for this turn if the answer looks complete, else discard it.
+
+        A returned draft carries its rendered speech as ``audio`` bytes (or None) in place of ``audio_path``.
+        """
+        if not judge_answer_complete(answer):
+            self.discarded += 1
+            await self.discard(redis, interview_id)
+            return None
+
+        task = self._tasks.get(interview_id)
+        if task is not None and not task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=settings.INTERVIEW_PREFETCH_WAIT_SEC)
+            except asyncio.TimeoutError:
+                pass
+
+        data = await redis.getdel(_key(interview_id))
+        draft = json.loads(data) if data else None
+        if not draft or draft["question_index"] != question_index:
+            self.not_ready += 1
+            self._cancel(interview_id)
+            if draft and draft.get("audio_path"):
+                await asyncio.to_thread(_remove_audio, draft["audio_path"])
+            return None
+        self.hits += 1
+        audio_path = draft.pop("audio_path", None)
+        draft["audio"] = await asyncio.to_thread(_claim_audio, audio_path) if audio_path else None
+        return draft
+
+    async def discard(self, redis: aioredis.Redis, interview_id: int):
+        self._cancel(interview_id)
+        data = await redis.getdel(_key(interview_id))
+        audio_path = json.loads(data).get("audio_path") if data else None
+        if audio_path:
+            await asyncio.to_thread(_remove_audio, audio_path)
+
+    def stats(self) -> dict:
+        judged = self.hits + self.discarded + self.not_ready
+        return {
+            "scheduled": self.scheduled,
+            "pending": len(self._tasks),
+            "hits": self.hits,
+            "discarded": self.discarded,
+            "not_ready": self.not_ready,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "hit_rate": round(self.hits / judged, 4) if judged else 0.0,
+        }
+
+
+turn_prefetcher = TurnPrefetcher()
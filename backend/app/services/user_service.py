@@ -7,9 +7,11 @@ from sqlalchemy import func
 from sqlmodel import select
 
 from app.core.exceptions import NotFoundException, ConflictException
+from app.core.redis import redis_pool
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.ws_auth_cache import ws_auth_cache
 
 
 class UserService:
@@ -100,3 +102,12 @@ class UserService:
         await self.db.flush()
         await self.db.refresh(user)
         return user
+
+    @staticmethod
+    async def forget_ws_grants(user_id: int):
+        """Drop cached interview-socket grants so the next (re)connect checks the account again.
+
+        Sockets that are already open keep running; call this only after the
+        status change is committed, or a reconnect can re-cache the old status.
+        """
+        await ws_auth_cache.invalidate(redis_pool.client, user_id)
@@ -0,0 +1,69 @@
+"""Cached authorization for interview WebSockets.
+
+A socket's first connection checks the token's user and their access to the
+interview against the database; the grant is then kept in Redis, one hash
+per user (``ws:auth:{user_id}``, field = interview id, value = role), so
+reconnects for the rest of the interview skip the database entirely.
+Denials are never cached. Changing a user's active status drops their hash once
+the change is committed; sockets already open are not re-checked.
+"""
+import logging
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _key(user_id: int) -> str:
+    return f"ws:auth:{user_id}"
+
+
+class WSAuthCache:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def allowed(self, redis: aioredis.Redis, user_id: int, interview_id: int) -> bool:
+        """True if the user was already granted access to the interview."""
+        try:
+            role = await redis.hget(_key(user_id), str(interview_id))
+        except aioredis.RedisError:
+            self.errors += 1
+            logger.warning(f"WS auth cache unavailable for user {user_id}", exc_info=True)
+            return False
+        if role is None:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    async def remember(self, redis: aioredis.Redis, user_id: int, interview_id: int, role: str):
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hset(_key(user_id), str(interview_id), role)
+                pipe.expire(_key(user_id), settings.WS_AUTH_CACHE_TTL_SEC)
+                await pipe.execute()
+        except aioredis.RedisError:
+            self.errors += 1
+
+    async def invalidate(self, redis: aioredis.Redis, user_id: int):
+        try:
+            await redis.delete(_key(user_id))
+        except aioredis.RedisError:
+            self.errors += 1
+            logger.warning(f"Could not drop WS auth cache for user {user_id}", exc_info=True)
+
+    def stats(self) -> dict:
+        looked_up = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / looked_up, 4) if looked_up else 0.0,
+        }
+
+
+ws_auth_cache = WSAuthCache()
@@ -1,9 +1,53 @@
-"""WebSocket connection manager — tracks active connections per interview."""
+"""WebSocket connection manager — tracks active connections per interview.
+
+Sockets live in the worker process that accepted them, but ownership is
+recorded in Redis (``ws:owner:{interview_id}`` -> ``{node}:{conn}``) so any
+worker or replica can find them. Each process subscribes to its own
+``ws:node:{node_id}`` channel; replacing, ending or pushing to a socket
+owned by another process is published to that channel and applied there.
+"""
+import asyncio
+import json
 import logging
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+
+import redis.asyncio as aioredis
 from fastapi import WebSocket
 
+from app.core.config import settings
+from app.core.redis import redis_pool
+
 logger = logging.getLogger(__name__)
 
+OWNER_PREFIX = "ws:owner:"
+NODE_CHANNEL_PREFIX = "ws:node:"
+NODES_KEY = "ws:nodes"
+NODE_COUNTS_KEY = "ws:node_counts"
+
+# Delete the owner key only if it still names this connection.
+_RELEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Refresh TTLs only for keys still owned by this node's connections.
+_REFRESH = """
+local refreshed = 0
+for i, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[i + 1] then
+        redis.call('EXPIRE', key, ARGV[1])
+        refreshed = refreshed + 1
+    end
+end
+return refreshed
+"""
+
 
 class ConnectionManager:
     """Singleton tracking active WebSocket connections per interview."""
@@ -13,26 +57,135 @@ class ConnectionManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._connections: dict[int, WebSocket] = {}
+            # interview_id -> (conn_id, websocket, send); send applies the socket's framing.
+            cls._instance._connections: dict[int, tuple[str, WebSocket, Callable[[dict], Awaitable]]] = {}
+            cls._instance.node_id = settings.WS_NODE_ID or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+            cls._instance._tasks: list[asyncio.Task] = []
+            cls._instance.relayed = 0
+            cls._instance.received = 0
+            cls._instance.registry_errors = 0
         return cls._instance
 
-    async def connect(self, interview_id: int, websocket: WebSocket):
+    @property
+    def _redis(self) -> aioredis.Redis:
+        return redis_pool.client
+
+    def _owner(self, conn_id: str) -> str:
+        return f"{self.node_id}:{conn_id}"
+
+    # --- local socket operations -------------------------------------------
+
+    async def _close_local(self, interview_id: int, conn_id: Optional[str], code: int, reason: str):
+        entry = self._connections.get(interview_id)
+        if entry is None or (conn_id is not None and entry[0] != conn_id):
+            return
+        self._connections.pop(interview_id, None)
+        try:
+            await entry[1].close(code=code, reason=reason)
+        except Exception:
+            pass
+
+    async def _push_local(self, interview_id: int, payload: dict) -> bool:
+        entry = self._connections.get(interview_id)
+        if entry is None:
+            return False
+        try:
+            await entry[2](payload)
+        except Exception:
+            return False
+        return True
+
+    async def _apply(self, message: dict):
+        interview_id = message["interview_id"]
+        action = message["action"]
+        if action == "replace":
+            logger.info(f"Replacing WS connection for interview {interview_id} (moved to another node)")
+            await self._close_local(interview_id, message.get("conn_id"), 1001, "Replaced by new connection")
+        elif action == "end":
+            await self._push_local(interview_id, {"type": "ended", "reason": message.get("reason", "")})
+            await self._close_local(interview_id, None, 1000, "Interview ended")
+        elif action == "push":
+            await self._push_local(interview_id, message["payload"])
+
+    async def _send(self, owner: Optional[str], message: dict) -> bool:
+        """Apply ``message`` to the socket named by ``owner``, locally or via its node's channel."""
+        if not owner:
+            return False
+        node_id, _, conn_id = owner.rpartition(":")
+        message = {**message, "conn_id": conn_id}
+        if node_id == self.node_id:
+            await self._apply(message)
+            return True
+        await self._redis.publish(NODE_CHANNEL_PREFIX + node_id, json.dumps(message))
+        self.relayed += 1
+        return True
+
+    # --- public API ----------------------------------------------------------
+
+    async def connect(
+        self,
+        interview_id: int,
+        websocket: WebSocket,
+        send: Optional[Callable[[dict], Awaitable]] = None,
+    ) -> str:
+        """Register ``websocket`` as the interview's connection, evicting any previous one.
+
+        ``send`` is used for pushed messages; it defaults to ``websocket.send_json``.
+        """
+        conn_id = uuid.uuid4().hex[:12]
         if interview_id in self._connections:
-            old_ws = self._connections[interview_id]
             logger.info(f"Replacing existing WS connection for interview {interview_id}")
-            try:
-                await old_ws.close(code=1001, reason="Replaced by new connection")
-            except Exception:
-                pass
-        self._connections[interview_id] = websocket
-        logger.info(f"WS connected: interview={interview_id} (active={self.active_count})")
+            await self._close_local(interview_id, None, 1001, "Replaced by new connection")
+        self._connections[interview_id] = (conn_id, websocket, send or websocket.send_json)
 
-    def disconnect(self, interview_id: int):
-        self._connections.pop(interview_id, None)
+        try:
+            previous = await self._redis.set(
+                OWNER_PREFIX + str(interview_id),
+                self._owner(conn_id),
+                ex=settings.WS_OWNER_TTL_SEC,
+                get=True,
+            )
+            if previous and not previous.startswith(self.node_id + ":"):
+                await self._send(previous, {"action": "replace", "interview_id": interview_id})
+        except aioredis.RedisError:
+            # Local tracking still works; cross-node eviction is skipped.
+            self.registry_errors += 1
+            logger.warning(f"WS registry unavailable for interview {interview_id}", exc_info=True)
+
+        logger.info(f"WS connected: interview={interview_id} node={self.node_id} (active={self.active_count})")
+        return conn_id
+
+    async def disconnect(self, interview_id: int, conn_id: Optional[str] = None):
+        entry = self._connections.get(interview_id)
+        if entry is not None and (conn_id is None or entry[0] == conn_id):
+            self._connections.pop(interview_id, None)
+        if conn_id is not None:
+            try:
+                await self._redis.eval(_RELEASE, 1, OWNER_PREFIX + str(interview_id), self._owner(conn_id))
+            except aioredis.RedisError:
+                self.registry_errors += 1
         logger.info(f"WS disconnected: interview={interview_id} (active={self.active_count})")
 
+    async def push(self, interview_id: int, payload: dict) -> bool:
+        """Send a JSON message to the interview's socket, wherever it is connected."""
+        if await self._push_local(interview_id, payload):
+            return True
+        owner = await self._redis.get(OWNER_PREFIX + str(interview_id))
+        if owner and owner.startswith(self.node_id + ":"):
+            return False
+        return await self._send(owner, {"action": "push", "interview_id": interview_id, "payload": payload})
+
+    async def end(self, interview_id: int, reason: str = ""):
+        """Tell the interview's socket the interview is over and close it."""
+        owner = await self._redis.get(OWNER_PREFIX + str(interview_id))
+        if interview_id in self._connections:
+            await self._apply({"action": "end", "interview_id": interview_id, "reason": reason})
+        if owner and not owner.startswith(self.node_id + ":"):
+            await self._send(owner, {"action": "end", "interview_id": interview_id, "reason": reason})
+
     def get(self, interview_id: int) -> WebSocket | None:
-        return self._connections.get(interview_id)
+        entry = self._connections.get(interview_id)
+        return entry[1] if entry else None
 
     def is_connected(self, interview_id: int) -> bool:
         return interview_id in self._connections
@@ -41,5 +194,87 @@ class ConnectionManager:
     def active_count(self) -> int:
         return len(self._connections)
 
+    # --- background tasks ----------------------------------------------------
+
+    async def _listen(self):
+        channel = NODE_CHANNEL_PREFIX + self.node_id
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                while True:
+                    # Polled with a read timeout of its own: listen() would use the pool's
+                    # socket_timeout and fail on every idle stretch, dropping messages published
+                    # while it resubscribes.
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is None or message["type"] != "message":
+                        continue
+                    self.received += 1
+                    try:
+                        await self._apply(json.loads(message["data"]))
+                    except Exception:
+                        logger.warning(f"Bad WS control message on {channel}", exc_info=True)
+            except aioredis.RedisError:
+                self.registry_errors += 1
+                logger.warning(f"WS control channel {channel} lost; resubscribing", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(settings.WS_REGISTRY_HEARTBEAT_SEC)
+            try:
+                owned = list(self._connections.items())
+                if owned:
+                    await self._redis.eval(
+                        _REFRESH,
+                        len(owned),
+                        *(OWNER_PREFIX + str(interview_id) for interview_id, _ in owned),
+                        settings.WS_OWNER_TTL_SEC,
+                        *(self._owner(entry[0]) for _, entry in owned),
+                    )
+                now = time.time()
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.zadd(NODES_KEY, {self.node_id: now})
+                    pipe.zremrangebyscore(NODES_KEY, 0, now - 10 * settings.WS_REGISTRY_HEARTBEAT_SEC)
+                    pipe.hset(NODE_COUNTS_KEY, self.node_id, self.active_count)
+                    await pipe.execute()
+            except aioredis.RedisError:
+                self.registry_errors += 1
+                logger.warning("WS registry heartbeat failed", exc_info=True)
+
+    def start(self):
+        if not self._tasks:
+            loop = asyncio.get_running_loop()
+            self._tasks = [loop.create_task(self._listen()), loop.create_task(self._heartbeat())]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.zrem(NODES_KEY, self.node_id)
+                pipe.hdel(NODE_COUNTS_KEY, self.node_id)
+                await pipe.execute()
+        except aioredis.RedisError:
+            pass
+
+    async def cluster_stats(self) -> dict:
+        cutoff = time.time() - 3 * settings.WS_REGISTRY_HEARTBEAT_SEC
+        nodes = await self._redis.zrangebyscore(NODES_KEY, cutoff, "+inf")
+        counts = await self._redis.hmget(NODE_COUNTS_KEY, nodes) if nodes else []
+        per_node = {node: int(count or 0) for node, count in zip(nodes, counts)}
+        return {
+            "node_id": self.node_id,
+            "local_connections": self.active_count,
+            "cluster_connections": sum(per_node.values()),
+            "nodes": per_node,
+            "relayed": self.relayed,
+            "received": self.received,
+            "registry_errors": self.registry_errors,
+        }
+
 
 ws_manager = ConnectionManager()
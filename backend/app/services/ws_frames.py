@@ -0,0 +1,198 @@
+"""Framing for the interview chat WebSocket.
+
+Two wire protocols, chosen by WebSocket subprotocol at accept time:
+
+- ``hireez.msgpack.v1`` — every event is a msgpack-encoded map in a binary
+  frame, and the client may send msgpack binary frames too.
+- JSON text frames — the default, for clients that offer no subprotocol
+  (or ``hireez.json.v1``).
+
+Either way, consecutive ``stream_chunk`` events of the same message are
+coalesced: buffered text is sent once it reaches ``WS_COALESCE_MAX_BYTES``
+or has waited ``WS_COALESCE_WINDOW_MS``, and always before any other
+event. A merged chunk keeps the ``offset`` of its first piece. Compression
+(permessage-deflate) is negotiated by the server's WebSocket layer, which
+does not report the outcome to the app; a socket counts as compressed when
+the client offered deflate and ``WS_PER_MESSAGE_DEFLATE`` says the server
+accepts it.
+"""
+import asyncio
+import json
+import logging
+from typing import Optional
+
+import msgpack
+from fastapi import WebSocket, WebSocketDisconnect
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_PROTOCOL = "hireez.msgpack.v1"
+JSON_PROTOCOL = "hireez.json.v1"
+
+# Chunks with only these fields can be merged.
+_CHUNK_FIELDS = {"type", "content", "message_id", "offset"}
+
+
+def negotiate_protocol(websocket: WebSocket) -> Optional[str]:
+    """Pick the subprotocol to accept from the client's offer, or None for plain JSON."""
+    offered = [
+        p.strip()
+        for header in websocket.headers.getlist("sec-websocket-protocol")
+        for p in header.split(",")
+    ]
+    if MSGPACK_PROTOCOL in offered:
+        return MSGPACK_PROTOCOL
+    if JSON_PROTOCOL in offered:
+        return JSON_PROTOCOL
+    return None
+
+
+def _deflate_negotiated(websocket: WebSocket) -> bool:
+    if not settings.WS_PER_MESSAGE_DEFLATE:
+        return False
+    return any(
+        offer.split(";", 1)[0].strip().lower() == "permessage-deflate"
+        for header in websocket.headers.getlist("sec-websocket-extensions")
+        for offer in header.split(",")
+    )
+
+
+class _Totals:
+    def __init__(self):
+        self.connections = {"json": 0, "msgpack": 0}
+        self.deflate_connections = 0
+        self.events = 0
+        self.chunks_in = 0
+        self.frames = 0
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "connections": dict(self.connections),
+            "deflate_connections": self.deflate_connections,
+            "events": self.events,
+            "chunks_in": self.chunks_in,
+            "frames_sent": self.frames,
+            "bytes_sent": self.bytes,
+            "avg_frame_bytes": round(self.bytes / self.frames, 1) if self.frames else 0.0,
+        }
+
+
+frame_totals = _Totals()
+
+
+class FrameChannel:
+    """Encodes, coalesces and meters outgoing events for one socket."""
+
+    def __init__(self, websocket: WebSocket, protocol: Optional[str]):
+        self.websocket = websocket
+        self.binary = protocol == MSGPACK_PROTOCOL
+        self.deflate = _deflate_negotiated(websocket)
+        self._buffer: list[str] = []
+        self._buffer_head: Optional[dict] = None
+        self._buffered_bytes = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self.events = 0
+        self.chunks_in = 0
+        self.frames = 0
+        self.bytes = 0
+        frame_totals.connections["msgpack" if self.binary else "json"] += 1
+        if self.deflate:
+            frame_totals.deflate_connections += 1
+
+    async def _write(self, event: dict):
+        if self.binary:
+            data = msgpack.packb(event, use_bin_type=True)
+            await self.websocket.send_bytes(data)
+            size = len(data)
+        else:
+            text = json.dumps(event)
+            await self.websocket.send_text(text)
+            size = len(text.encode("utf-8"))
+        self.frames += 1
+        self.bytes += size
+        frame_totals.frames += 1
+        frame_totals.bytes += size
+
+    async def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        event = {**self._buffer_head, "content": "".join(self._buffer)}
+        self._buffer = []
+        self._buffer_head = None
+        self._buffered_bytes = 0
+        await self._write(event)
+
+    async def flush(self):
+        async with self._lock:
+            await self._flush_locked()
+
+    async def _timed_flush(self):
+        try:
+            await self.flush()
+        except Exception:
+            # Socket already closed; the receive loop reports the disconnect.
+            pass
+
+    def _flush_later(self):
+        self._flush_task = asyncio.get_running_loop().create_task(self._timed_flush())
+
+    def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+
+    async def send(self, event: dict):
+        """Send an event, coalescing ``stream_chunk`` events."""
+        self.events += 1
+        frame_totals.events += 1
+        async with self._lock:
+            if event.get("type") != "stream_chunk" or not set(event) <= _CHUNK_FIELDS:
+                await self._flush_locked()
+                await self._write(event)
+                return
+            if self._buffer_head is not None and self._buffer_head.get("message_id") != event.get("message_id"):
+                await self._flush_locked()
+
+            self.chunks_in += 1
+            frame_totals.chunks_in += 1
+            if self._buffer_head is None:
+                self._buffer_head = event
+            self._buffer.append(event["content"])
+            self._buffered_bytes += len(event["content"].encode("utf-8"))
+            if self._buffered_bytes >= settings.WS_COALESCE_MAX_BYTES or settings.WS_COALESCE_WINDOW_MS <= 0:
+                await self._flush_locked()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(
+                    settings.WS_COALESCE_WINDOW_MS / 1000, self._flush_later
+                )
+
+    async def receive(self) -> dict:
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        if message.get("bytes") is not None:
+            if not self.binary:
+                raise ValueError("Binary frames require the msgpack subprotocol")
+            return msgpack.unpackb(message["bytes"], raw=False)
+        return json.loads(message["text"])
+
+    def stats(self) -> dict:
+        return {
+            "protocol": "msgpack" if self.binary else "json",
+            "deflate": self.deflate,
+            "events": self.events,
+            "chunks_in": self.chunks_in,
+            "frames_sent": self.frames,
+            "bytes_sent": self.bytes,
+        }
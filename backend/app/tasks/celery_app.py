@@ -24,4 +24,5 @@ celery_app.conf.include = [
     "app.tasks.email_tasks",
     "app.tasks.sms_tasks",
     "app.tasks.evaluation_tasks",
+    "app.tasks.interview_tasks",
 ]
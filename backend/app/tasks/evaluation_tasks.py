@@ -11,14 +11,26 @@ logger = logging.getLogger(__name__)
 def evaluate_interview_task(self, interview_id: int):
     logger.info(f"Starting auto-evaluation for interview {interview_id}")
 
+    from app.ai.openai_client import ai_client
+    from app.ai.rate_governor import Priority, ai_priority
+    from app.ai.usage_ledger import usage_ledger
     from app.core.database import async_session
+    from app.core.redis import redis_pool
     from app.services.evaluation_service import EvaluationService
 
     async def _run():
-        async with async_session() as session:
-            service = EvaluationService(session)
-            result = await service.evaluate_interview(interview_id)
-            await session.commit()
+        with ai_priority(Priority.BATCH):
+            try:
+                # The service drains the transcript journal first; a failed drain retries the task.
+                async with async_session() as session:
+                    service = EvaluationService(session)
+                    result = await service.evaluate_interview(interview_id)
+                    await session.commit()
+            finally:
+                # Flush usage rows and close pooled connections before the loop closes.
+                await usage_ledger.flush()
+                await ai_client.aclose()
+                await redis_pool.aclose()
             return result
 
     loop = asyncio.new_event_loop()
@@ -0,0 +1,92 @@
+"""Interview preparation Celery tasks."""
+import asyncio
+import logging
+
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="tasks.prerender_interview_messages", bind=True, max_retries=3, default_retry_delay=15)
+def prerender_interview_messages_task(self, interview_id: int, with_audio: bool = False):
+    logger.info(f"Pre-rendering greeting/closing for interview {interview_id}")
+
+    from app.ai.openai_client import ai_client
+    from app.ai.rate_governor import Priority, ai_priority
+    from app.ai.usage_ledger import usage_ledger
+    from app.ai.voice.tts_cache import tts_cache
+    from app.core.database import async_session
+    from app.core.redis import redis_pool
+    from app.services.interview_conductor_service import InterviewConductorService
+
+    async def _run():
+        with ai_priority(Priority.BATCH):
+            try:
+                async with async_session() as session:
+                    service = InterviewConductorService(session)
+                    await service.prerender_messages(interview_id, with_audio=with_audio)
+                    await session.commit()
+            finally:
+                # Flush usage rows and cache stores, and close pooled connections before the loop closes.
+                await usage_ledger.flush()
+                await tts_cache.drain()
+                await ai_client.aclose()
+                await redis_pool.aclose()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_run())
+        return {"status": "completed", "interview_id": interview_id}
+    except Exception as e:
+        logger.warning(f"Pre-rendering failed for interview {interview_id}: {e}")
+        raise self.retry(exc=e)
+    finally:
+        loop.close()
+
+
+@celery_app.task(name="tasks.transcribe_interview_recording", bind=True, max_retries=5, default_retry_delay=60)
+def transcribe_recording_task(self, interview_id: int, recording_path: str):
+    logger.info(f"Transcribing recording for interview {interview_id}")
+
+    from app.ai.openai_client import ai_client
+    from app.ai.rate_governor import Priority, ai_priority
+    from app.ai.usage_ledger import usage_ledger
+    from app.core.config import settings
+    from app.core.database import async_session
+    from app.core.redis import redis_pool
+    from app.services.recording_transcription_service import RecordingTranscriptionService
+
+    async def _run() -> dict:
+        with ai_priority(Priority.BATCH):
+            try:
+                # A redelivered task (acks_late) must not race a worker still on the same recording.
+                lock = redis_pool.client.lock(
+                    f"recording:transcribe:{recording_path}", timeout=settings.RECORDING_LOCK_TIMEOUT_SEC,
+                )
+                if not await lock.acquire(blocking=False):
+                    raise RuntimeError("Recording is already being transcribed")
+                try:
+                    async with async_session() as session:
+                        service = RecordingTranscriptionService(session)
+                        return await service.transcribe(interview_id, recording_path)
+                finally:
+                    try:
+                        await lock.release()
+                    except Exception:
+                        # Expired while we worked; the next holder owns it now.
+                        pass
+            finally:
+                await usage_ledger.flush()
+                await ai_client.aclose()
+                await redis_pool.aclose()
+
+    loop = asyncio.new_event_loop()
+    try:
+        summary = loop.run_until_complete(_run())
+        return {"status": "completed", "interview_id": interview_id, **summary}
+    except Exception as e:
+        # Chunks already transcribed are committed; the retry only redoes the rest.
+        logger.warning(f"Recording transcription failed for interview {interview_id}: {e}")
+        raise self.retry(exc=e)
+    finally:
+        loop.close()
@@ -11,14 +11,25 @@ logger = logging.getLogger(__name__)
 def screen_candidate_resume(candidate_id: int, job_id: int):
     logger.info(f"Starting resume screening for candidate {candidate_id}, job {job_id}")
 
+    from app.ai.openai_client import ai_client
+    from app.ai.rate_governor import Priority, ai_priority
+    from app.ai.usage_ledger import usage_ledger
     from app.core.database import async_session
+    from app.core.redis import redis_pool
     from app.services.screening_service import ScreeningService
 
     async def _run():
-        async with async_session() as session:
-            service = ScreeningService(session)
-            result = await service.screen_candidate(candidate_id, job_id)
-            await session.commit()
+        with ai_priority(Priority.BATCH):
+            try:
+                async with async_session() as session:
+                    service = ScreeningService(session)
+                    result = await service.screen_candidate(candidate_id, job_id)
+                    await session.commit()
+            finally:
+                # Flush usage rows and close pooled connections before the loop closes.
+                await usage_ledger.flush()
+                await ai_client.aclose()
+                await redis_pool.aclose()
             return result
 
     loop = asyncio.new_event_loop()
@@ -1,5 +1,7 @@
 """File upload handling and text extraction."""
+import asyncio
 import os
+import tempfile
 import uuid
 from pathlib import Path
 
@@ -35,6 +37,28 @@ async def save_upload(file: UploadFile, subdir: str = "resumes", max_size_mb: in
     return file_path
 
 
+async def spool_upload(file: UploadFile, max_size_mb: int, default_ext: str = "") -> tuple[str, int]:
+    """Copy an upload to a temporary file chunk by chunk; returns (path, size).
+
+    The caller removes the file. Raises ValueError past ``max_size_mb``.
+    """
+    ext = Path(file.filename or "").suffix.lower() or default_ext
+    max_bytes = max_size_mb * 1024 * 1024
+    fd, path = tempfile.mkstemp(suffix=ext)
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await file.read(256 * 1024):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"File size exceeds {max_size_mb}MB limit")
+                await asyncio.to_thread(out.write, chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path, size
+
+
 def extract_text_from_pdf(file_path: str) -> str:
     try:
         import pdfplumber
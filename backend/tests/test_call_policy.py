@@ -0,0 +1,134 @@
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+from app.ai import call_policy
+from app.ai.call_policy import AIDeadlineExceeded, CallPolicy, PolicyEngine
+
+
+@pytest.fixture
+def engine(monkeypatch) -> PolicyEngine:
+    engine = PolicyEngine()
+    monkeypatch.setattr(engine, "backoff_delay", lambda policy, attempt: 0.0)
+    return engine
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    def use(**fields):
+        monkeypatch.setitem(call_policy.DEFAULT_POLICIES, "test", CallPolicy(**fields))
+    return use
+
+
+def _connection_error() -> openai.APIConnectionError:
+    return openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+
+
+async def test_transient_errors_are_retried(engine, policy):
+    policy(deadline_sec=5, attempt_timeout_sec=1, max_attempts=3)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _connection_error()
+        return "ok"
+
+    assert await engine.execute("test", call) == "ok"
+    assert len(calls) == 3
+    assert engine.retries["test"] == 2
+
+
+async def test_last_transient_error_is_raised_after_max_attempts(engine, policy):
+    policy(deadline_sec=5, attempt_timeout_sec=1, max_attempts=2)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        raise _connection_error()
+
+    with pytest.raises(openai.APIConnectionError):
+        await engine.execute("test", call)
+    assert len(calls) == 2
+
+
+async def test_other_errors_are_not_retried(engine, policy):
+    policy(deadline_sec=5, attempt_timeout_sec=1, max_attempts=3)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await engine.execute("test", call)
+    assert len(calls) == 1
+
+
+async def test_attempt_timeouts_end_in_deadline_exceeded(engine, policy):
+    policy(deadline_sec=5, attempt_timeout_sec=0.05, max_attempts=2)
+
+    async def call():
+        await asyncio.sleep(1)
+
+    with pytest.raises(AIDeadlineExceeded):
+        await engine.execute("test", call)
+    assert engine.retries["test"] == 1
+    assert engine.deadline_exceeded["test"] == 1
+
+
+async def test_slow_attempt_is_hedged_after_p95(engine, policy):
+    policy(deadline_sec=5, attempt_timeout_sec=2, hedge=True, hedge_min_samples=5)
+    for _ in range(5):
+        engine.histogram("test").observe(0.02)
+    cancelled = []
+
+    async def call():
+        if not cancelled:
+            cancelled.append(False)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+            return "primary"
+        return "hedged"
+
+    assert await engine.execute("test", call) == "hedged"
+    assert engine.hedges["test"] == 1
+    assert engine.hedge_wins["test"] == 1
+    await asyncio.sleep(0)
+    assert cancelled == [True]
+
+
+async def test_no_hedge_until_enough_samples(engine, policy):
+    policy(deadline_sec=5, attempt_timeout_sec=2, hedge=True, hedge_min_samples=5)
+    engine.histogram("test").observe(0.01)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    assert await engine.execute("test", call) == "primary"
+    assert len(calls) == 1
+    assert "test" not in engine.hedges
+
+
+async def test_hedge_falls_back_to_primary_error_when_both_fail(engine, policy):
+    policy(deadline_sec=5, attempt_timeout_sec=2, max_attempts=1, hedge=True, hedge_min_samples=1)
+    engine.histogram("test").observe(0.01)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise ValueError("primary")
+        raise KeyError("hedge")
+
+    with pytest.raises(ValueError, match="primary"):
+        await engine.execute("test", call)
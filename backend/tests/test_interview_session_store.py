@@ -0,0 +1,78 @@
+import pytest
+
+from app.core.config import settings
+from app.services.interview_session_store import InterviewSessionStore
+
+QUESTIONS = [{"id": i, "text": f"Question {i}"} for i in range(5)]
+GREETING = {"role": "assistant", "content": "Welcome."}
+
+
+def _turn(n: int) -> list[dict]:
+    return [{"role": "user", "content": f"answer {n}"}, {"role": "assistant", "content": f"reply {n}"}]
+
+
+@pytest.fixture
+async def store(redis) -> InterviewSessionStore:
+    store = InterviewSessionStore(redis)
+    await store.create(1, QUESTIONS, [GREETING], started_at="2026-01-01T00:00:00", sequence_counter=1)
+    return store
+
+
+async def test_apply_turn_advances_the_question(store):
+    assert await store.apply_turn(1, expected_index=0, messages=_turn(0), sequence_counter=3) is True
+
+    turn = await store.load_turn(1)
+    assert turn["current_question_index"] == 1
+    assert turn["current_question"] == QUESTIONS[1]
+    assert turn["sequence_counter"] == 3
+    assert turn["history"] == [GREETING, *_turn(0)]
+
+
+async def test_stale_turn_is_rejected_without_writing(store):
+    assert await store.apply_turn(1, expected_index=0, messages=_turn(0), sequence_counter=3) is True
+    assert await store.apply_turn(1, expected_index=0, messages=_turn(99), sequence_counter=5) is False
+
+    turn = await store.load_turn(1)
+    assert turn["current_question_index"] == 1
+    assert turn["sequence_counter"] == 3
+    assert turn["history"] == [GREETING, *_turn(0)]
+
+
+async def test_apply_turn_on_a_missing_session(store):
+    assert await store.apply_turn(2, expected_index=0, messages=_turn(0), sequence_counter=3) is None
+    assert await store.load_turn(2) is None
+
+
+async def test_session_keys_expire(store, redis):
+    await store.apply_turn(1, expected_index=0, messages=_turn(0), sequence_counter=3)
+    for key in InterviewSessionStore._keys(1):
+        assert 0 < await redis.ttl(key) <= settings.INTERVIEW_SESSION_TTL_SEC
+
+
+async def test_summary_is_compare_and_set(store):
+    assert await store.set_summary(1, expected_count=0, new_count=3, summary="first") is True
+    assert await store.set_summary(1, expected_count=0, new_count=3, summary="late") is False
+
+    turn = await store.load_turn(1)
+    assert turn["history_summary"] == "first"
+    assert turn["summarized_count"] == 3
+
+
+async def test_only_summarized_messages_are_trimmed(store, monkeypatch):
+    monkeypatch.setattr(settings, "INTERVIEW_SESSION_HISTORY_MAX", 4)
+    await store.apply_turn(1, expected_index=0, messages=_turn(0), sequence_counter=3)
+    await store.apply_turn(1, expected_index=1, messages=_turn(1), sequence_counter=5)
+    # Over the cap, but nothing is summarized yet, so nothing may be dropped.
+    history, _, offset = await store.load_history(1)
+    assert len(history) == 5 and offset == 0
+
+    await store.set_summary(1, expected_count=0, new_count=3, summary="greeting and first answer")
+    await store.apply_turn(1, expected_index=2, messages=_turn(2), sequence_counter=7)
+
+    history, idx, offset = await store.load_history(1)
+    assert idx == 3
+    assert offset == 3
+    assert history == [*_turn(1), *_turn(2)]
+    turn = await store.load_turn(1)
+    assert turn["history_offset"] == 3
+    assert turn["history"] == [*_turn(1), *_turn(2)]
@@ -0,0 +1,52 @@
+import json
+
+from app.ai.json_stream import JsonArrayStreamParser, iter_array_items
+
+DOCUMENT = json.dumps({
+    "summary": "Strong [backend] candidate",
+    "questions": [
+        {"question_text": "Explain \"eventual\" consistency, e.g. {a, b}]", "keywords": ["cap", "quorum"]},
+        {"question_text": "Why [brackets]?", "nested": {"questions": [1, 2]}},
+    ],
+    "strengths": ["python", "sql, mostly", 3, True, None],
+    "ignored": [{"x": 1}],
+})
+
+
+def _feed_all(parser: JsonArrayStreamParser, text: str, step: int) -> list:
+    items = []
+    for i in range(0, len(text), step):
+        items += parser.feed(text[i:i + step])
+    return items
+
+
+def test_elements_match_the_complete_document():
+    expected = list(iter_array_items(json.loads(DOCUMENT), ["questions", "strengths"]))
+    for step in (1, 3, 7, len(DOCUMENT)):
+        parser = JsonArrayStreamParser(["questions", "strengths"])
+        assert _feed_all(parser, DOCUMENT, step) == expected
+        assert parser.result() == json.loads(DOCUMENT)
+
+
+def test_element_is_emitted_as_soon_as_it_closes():
+    parser = JsonArrayStreamParser(["questions"])
+    assert parser.feed('{"questions": [{"q": "one"}') == [("questions", {"q": "one"})]
+    assert parser.feed(', {"q": "tw') == []
+    assert parser.feed('o"}]}') == [("questions", {"q": "two"})]
+
+
+def test_scalar_elements_end_at_comma_or_bracket():
+    parser = JsonArrayStreamParser(["scores"])
+    assert parser.feed('{"scores": [1, 2.5') == [("scores", 1)]
+    assert parser.feed("]}") == [("scores", 2.5)]
+
+
+def test_nested_arrays_with_the_same_name_are_not_collected():
+    parser = JsonArrayStreamParser(["questions"])
+    items = parser.feed('{"meta": {"questions": [9]}, "questions": ["a"]}')
+    assert items == [("questions", "a")]
+
+
+def test_unparseable_element_is_skipped():
+    parser = JsonArrayStreamParser(["questions"])
+    assert parser.feed('{"questions": [tru, "ok"]}') == [("questions", "ok")]
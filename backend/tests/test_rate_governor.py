@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from app.ai.rate_governor import Priority, RateGovernor, ai_priority
+
+
+def _governor(**overrides) -> RateGovernor:
+    params = dict(rpm=1000, tpm=1_000_000, max_concurrency=8, min_concurrency=1, batch_share=0.5)
+    params.update(overrides)
+    return RateGovernor(**params)
+
+
+async def test_queued_callers_are_admitted_by_priority():
+    governor = _governor(max_concurrency=1)
+    await governor.acquire(10, Priority.NORMAL)
+    order = []
+
+    async def caller(priority: Priority):
+        async with governor.slot(10, priority):
+            order.append(priority)
+
+    tasks = []
+    for priority in (Priority.BATCH, Priority.NORMAL, Priority.INTERACTIVE, Priority.BATCH):
+        tasks.append(asyncio.create_task(caller(priority)))
+        await asyncio.sleep(0)
+    assert governor.stats()["queue_depth"] == {"interactive": 1, "normal": 1, "batch": 2}
+
+    governor.release()
+    await asyncio.gather(*tasks)
+    assert order == [Priority.INTERACTIVE, Priority.NORMAL, Priority.BATCH, Priority.BATCH]
+
+
+async def test_slot_uses_the_context_priority():
+    governor = _governor()
+    with ai_priority(Priority.BATCH):
+        async with governor.slot(10):
+            pass
+    assert governor.admitted == {"interactive": 0, "normal": 0, "batch": 1}
+
+
+async def test_batch_keeps_a_reserve_for_interactive_calls():
+    governor = _governor(rpm=10)
+    for _ in range(5):
+        async with governor.slot(1, Priority.BATCH):
+            pass
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(governor.acquire(1, Priority.BATCH), timeout=0.2)
+    assert governor.stats()["queue_depth"]["batch"] == 0
+
+    await asyncio.wait_for(governor.acquire(1, Priority.INTERACTIVE), timeout=0.2)
+
+
+async def test_rate_limits_halve_concurrency_down_to_the_floor():
+    governor = _governor(max_concurrency=8, min_concurrency=2)
+    governor.on_rate_limited()
+    assert governor.concurrency_limit == 4
+    governor.on_rate_limited()
+    governor.on_rate_limited()
+    governor.on_rate_limited()
+    assert governor.concurrency_limit == 2
+    assert governor.rate_limited == 4
+
+
+async def test_successes_grow_concurrency_additively_up_to_the_max():
+    governor = _governor(max_concurrency=8, min_concurrency=1)
+    governor.on_rate_limited()
+    governor.on_rate_limited()
+    assert governor.concurrency_limit == 2
+
+    governor.release(success=False)
+    assert governor.concurrency_limit == 2
+    # Roughly one step per window of ``limit`` successful calls.
+    for _ in range(3):
+        governor.release()
+    assert governor.concurrency_limit == 3
+    for _ in range(100):
+        governor.release()
+    assert governor.concurrency_limit == 8
+
+
+async def test_admission_waits_for_a_free_slot():
+    governor = _governor(max_concurrency=1)
+    await governor.acquire(10, Priority.INTERACTIVE)
+    waiter = asyncio.create_task(governor.acquire(10, Priority.INTERACTIVE))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    governor.release()
+    await asyncio.wait_for(waiter, timeout=0.5)
+    assert governor.stats()["in_flight"] == 1
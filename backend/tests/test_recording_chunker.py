@@ -0,0 +1,43 @@
+from app.ai.voice.recording_chunker import plan_chunks, remove_overlap
+
+
+def test_short_recording_is_one_chunk():
+    assert plan_chunks(90.0, [], 600) == [(0.0, 90.0)]
+
+
+def test_chunks_without_pauses_are_cut_at_the_window():
+    assert plan_chunks(250.0, [], 100) == [(0.0, 100.0), (100.0, 200.0), (200.0, 250.0)]
+
+
+def test_chunks_end_at_the_last_pause_in_the_second_half():
+    # Pauses are cut at their midpoint; the one at 20 s is in the first half of the window.
+    silences = [(19.0, 21.0), (59.0, 61.0), (79.0, 81.0), (149.0, 151.0)]
+    assert plan_chunks(200.0, silences, 100) == [(0.0, 80.0), (80.0, 150.0), (150.0, 200.0)]
+
+
+def test_chunks_cover_the_recording_without_gaps():
+    spans = plan_chunks(1234.5, [(300.0, 301.0), (777.0, 778.5)], 300)
+    assert spans[0][0] == 0.0
+    assert spans[-1][1] == 1234.5
+    assert all(a[1] == b[0] for a, b in zip(spans, spans[1:]))
+    assert all(end - start <= 300 for start, end in spans)
+
+
+def test_remove_overlap_drops_repeated_words():
+    previous = "I led the migration to Kubernetes last year"
+    text = "Kubernetes last year, and we cut deploy time in half"
+    assert remove_overlap(previous, text) == "and we cut deploy time in half"
+
+
+def test_remove_overlap_ignores_case_and_punctuation():
+    assert remove_overlap("We shipped it. Then", "we shipped it then we tested") == "we tested"
+    assert remove_overlap("on the Team.", "the team, and later") == "and later"
+
+
+def test_remove_overlap_needs_two_words():
+    assert remove_overlap("it went well", "well, mostly") == "well, mostly"
+
+
+def test_remove_overlap_without_previous_text():
+    assert remove_overlap("", "hello there") == "hello there"
+    assert remove_overlap("hello there", "") == ""
@@ -0,0 +1,33 @@
+from app.ai.voice.sentence_tts import SentenceSplitter
+
+
+def test_sentences_complete_on_trailing_whitespace():
+    splitter = SentenceSplitter(min_chars=0)
+    assert splitter.feed("Thanks for that answer.") == []
+    assert splitter.feed(" Tell me about") == ["Thanks for that answer."]
+    assert splitter.feed(" your last project? ") == ["Tell me about your last project?"]
+    assert splitter.flush() is None
+
+
+def test_streamed_tokens_split_like_whole_text():
+    text = 'You said "it scaled." Good! How did you measure it?! Next, the (final) one. '
+    whole = SentenceSplitter(min_chars=0).feed(text)
+    assert whole == ['You said "it scaled."', "Good!", "How did you measure it?!", "Next, the (final) one."]
+
+    splitter = SentenceSplitter(min_chars=0)
+    streamed = []
+    for ch in text:
+        streamed += splitter.feed(ch)
+    assert streamed == whole
+
+
+def test_short_sentences_merge_into_the_next():
+    splitter = SentenceSplitter(min_chars=24)
+    assert splitter.feed("Great. That makes sense to me. Okay. ") == ["Great. That makes sense to me."]
+    assert splitter.flush() == "Okay."
+
+
+def test_decimals_and_unfinished_text_stay_buffered():
+    splitter = SentenceSplitter(min_chars=0)
+    assert splitter.feed("Latency dropped 2.5x in the end") == []
+    assert splitter.flush() == "Latency dropped 2.5x in the end"
@@ -0,0 +1,47 @@
+from array import array
+
+from app.ai.usage import AICallTag
+from app.ai.voice.streaming_stt import STTBackend, StreamingTranscriber
+from app.core.config import settings
+
+SAMPLE_RATE = 16000
+
+
+def _frames(count: int, amplitude: int) -> bytes:
+    samples = SAMPLE_RATE * settings.VOICE_VAD_FRAME_MS // 1000
+    return array("h", [amplitude] * samples * count).tobytes()
+
+
+class RecordingBackend(STTBackend):
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+
+    async def transcribe(self, pcm, sample_rate, language="en", tag=None) -> str:
+        self.calls.append((len(pcm), tag))
+        return f"segment {len(self.calls)}"
+
+
+async def _ignore(event: dict):
+    pass
+
+
+async def test_segments_are_transcribed_with_the_tag():
+    backend = RecordingBackend()
+    tag = AICallTag(operation="stt", interview_id=7)
+    transcriber = StreamingTranscriber(backend, SAMPLE_RATE, on_partial=_ignore, tag=tag)
+    transcriber.feed(_frames(10, 2000) + _frames(20, 0) + _frames(5, 2000))
+
+    assert await transcriber.finish() == "segment 1 segment 2"
+    assert [t for _, t in backend.calls] == [tag, tag]
+
+
+async def test_reset_drops_audio_heard_between_answers():
+    backend = RecordingBackend()
+    transcriber = StreamingTranscriber(backend, SAMPLE_RATE, on_partial=_ignore)
+    transcriber.feed(_frames(10, 2000))
+    transcriber.reset()
+
+    assert await transcriber.finish() == ""
+    assert backend.calls == []
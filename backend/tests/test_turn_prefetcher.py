@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.services.turn_prefetcher import TurnPrefetcher, judge_answer_complete
+
+COMPLETE = "I would shard the table by tenant and move the hot tenants to their own replicas first"
+
+
+@pytest.fixture(autouse=True)
+def prefetch_settings(monkeypatch):
+    monkeypatch.setattr(settings, "INTERVIEW_PREFETCH_MIN_ANSWER_WORDS", 10)
+    monkeypatch.setattr(settings, "INTERVIEW_PREFETCH_WAIT_SEC", 0.1)
+
+
+@pytest.fixture
+def audio(tmp_path):
+    path = tmp_path / "turn_2.mp3"
+    path.write_bytes(b"ID3 audio")
+    return path
+
+
+async def _park(redis, question_index: int, audio_path=None):
+    draft = {"question_index": question_index, "text": "Thanks. Next question.", "audio_path": audio_path}
+    await redis.set("interview:prefetch:1", json.dumps(draft))
+
+
+def test_judge_answer_complete():
+    assert judge_answer_complete(COMPLETE)
+    assert not judge_answer_complete("Not really sure")
+    assert not judge_answer_complete(COMPLETE + ", but what do you mean by replicas?")
+    assert not judge_answer_complete("Could you rephrase that, I did not catch the part about the tenants at all")
+
+
+async def test_used_draft_carries_its_audio_and_deletes_the_file(redis, audio):
+    await _park(redis, 2, str(audio))
+    draft = await TurnPrefetcher().take(redis, 1, 2, COMPLETE)
+    assert draft["text"] == "Thanks. Next question."
+    assert draft["audio"] == b"ID3 audio"
+    assert "audio_path" not in draft
+    assert not audio.exists()
+    assert await redis.get("interview:prefetch:1") is None
+
+
+async def test_draft_for_another_question_is_dropped_with_its_audio(redis, audio):
+    await _park(redis, 1, str(audio))
+    prefetcher = TurnPrefetcher()
+    assert await prefetcher.take(redis, 1, 2, COMPLETE) is None
+    assert prefetcher.not_ready == 1
+    assert not audio.exists()
+
+
+async def test_incomplete_answer_discards_the_draft(redis, audio):
+    await _park(redis, 2, str(audio))
+    prefetcher = TurnPrefetcher()
+    assert await prefetcher.take(redis, 1, 2, "Yes") is None
+    assert prefetcher.discarded == 1
+    assert not audio.exists()
+    assert await redis.get("interview:prefetch:1") is None
+
+
+async def test_text_only_draft(redis):
+    await _park(redis, 2)
+    draft = await TurnPrefetcher().take(redis, 1, 2, COMPLETE)
+    assert draft["audio"] is None
@@ -0,0 +1,87 @@
+from array import array
+
+import pytest
+
+from app.ai.voice.vad import UtteranceSegmenter, frame_rms
+from app.core.config import settings
+
+SAMPLE_RATE = 16000
+
+
+def _frames(count: int, amplitude: int) -> bytes:
+    samples = SAMPLE_RATE * settings.VOICE_VAD_FRAME_MS // 1000
+    return array("h", [amplitude] * samples * count).tobytes()
+
+
+def loud(count: int) -> bytes:
+    return _frames(count, 2000)
+
+
+def quiet(count: int) -> bytes:
+    return _frames(count, 0)
+
+
+@pytest.fixture(autouse=True)
+def vad_settings(monkeypatch):
+    monkeypatch.setattr(settings, "VOICE_VAD_FRAME_MS", 30)
+    monkeypatch.setattr(settings, "VOICE_VAD_ENERGY_THRESHOLD", 300.0)
+    monkeypatch.setattr(settings, "VOICE_VAD_SEGMENT_SILENCE_MS", 400)
+    monkeypatch.setattr(settings, "VOICE_VAD_END_OF_TURN_MS", 1200)
+    monkeypatch.setattr(settings, "VOICE_VAD_MAX_SEGMENT_SEC", 15)
+
+
+def test_frame_rms():
+    assert frame_rms(b"") == 0.0
+    assert frame_rms(loud(1)) == pytest.approx(2000)
+    assert frame_rms(quiet(1)) == 0.0
+
+
+def test_pause_closes_segment_with_preroll():
+    segmenter = UtteranceSegmenter(SAMPLE_RATE)
+    segments, ended = segmenter.feed(loud(10) + quiet(14))
+    assert not ended
+    # Ten voiced frames plus the 420 ms pause that closed the segment.
+    assert segments == [loud(10) + quiet(14)]
+
+
+def test_long_pause_ends_the_answer():
+    segmenter = UtteranceSegmenter(SAMPLE_RATE)
+    segmenter.feed(loud(10) + quiet(14))
+    # 420 ms of the pause already counted; 780 ms more reach the 1200 ms end of turn.
+    assert segmenter.feed(quiet(25)) == ([], False)
+    assert segmenter.feed(quiet(1)) == ([], True)
+
+
+def test_click_is_not_speech():
+    segmenter = UtteranceSegmenter(SAMPLE_RATE)
+    assert segmenter.feed(loud(2) + quiet(60)) == ([], False)
+    assert segmenter.flush() is None
+
+
+def test_long_speech_is_cut_at_max_segment(monkeypatch):
+    monkeypatch.setattr(settings, "VOICE_VAD_MAX_SEGMENT_SEC", 1)
+    segmenter = UtteranceSegmenter(SAMPLE_RATE)
+    segments, _ = segmenter.feed(loud(40))
+    assert len(segments) == 1
+    assert segmenter.max_segment_bytes <= len(segments[0]) < segmenter.max_segment_bytes + segmenter.frame_bytes
+
+
+def test_partial_frames_are_carried_over():
+    audio = loud(10) + quiet(14)
+    whole = UtteranceSegmenter(SAMPLE_RATE).feed(audio)
+
+    segmenter = UtteranceSegmenter(SAMPLE_RATE)
+    segments = []
+    for start in range(0, len(audio), 700):
+        closed, _ = segmenter.feed(audio[start:start + 700])
+        segments += closed
+    assert segments == whole[0]
+
+
+def test_flush_returns_open_segment_and_resets():
+    segmenter = UtteranceSegmenter(SAMPLE_RATE)
+    segmenter.feed(loud(5))
+    assert segmenter.flush() == loud(5)
+    assert segmenter.flush() is None
+    # A fresh answer needs speech again before a pause can end it.
+    assert segmenter.feed(quiet(60)) == ([], False)